@@ -31,18 +31,80 @@ License: GPL v3
 """
 
 import os
+import fnmatch
+import logging
+import math
+import re
+import shutil
+import sys
+from datetime import datetime
 from qgis.PyQt import uic
-from qgis.PyQt.QtWidgets import QDialog, QMessageBox, QAction, QFileDialog
-from qgis.PyQt.QtCore import QCoreApplication
+from qgis.PyQt.QtWidgets import QDialog, QMessageBox, QAction, QFileDialog, QAbstractSpinBox
+from qgis.PyQt.QtCore import QElapsedTimer, QLocale, pyqtSignal
+from qgis.PyQt.QtGui import QTextDocument
 from qgis.core import (
+    QgsApplication,
     QgsProject,
     QgsProcessingFeedback,
+    QgsMapLayer,
     QgsRasterLayer,
     QgsPointXY,
-    QgsRasterBandStats
+    QgsRectangle,
+    QgsRasterBandStats,
+    Qgis
 )
+from qgis.analysis import QgsRasterCalculatorEntry, QgsRasterCalculator
 import processing
 import tempfile
+import threading
+from collections import namedtuple
+from contextlib import contextmanager, suppress
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+from osgeo import gdal
+
+# Logger for the statistics and texture hot paths; debug records are only
+# formatted when the level is enabled (lazy %-arguments). The level follows
+# the "Verbose debug log" option; records go to stdout like the DEBUG prints
+_log = logging.getLogger(__name__)
+_log.setLevel(logging.WARNING)
+if not _log.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    _log.addHandler(_log_handler)
+    _log.propagate = False
+
+# psutil is optional - only used for memory diagnostics
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Numba is optional - without it texture analysis falls back to GRASS r.texture
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    prange = range
+    _HAS_NUMBA = False
+
+# SciPy is optional - without it the Gaussian filter runs through SAGA
+try:
+    from scipy import ndimage
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
+
+# CUDA texture analysis is optional (cupy + glcm-cupy) and needs a visible GPU
+try:
+    import cupy as cp
+    from glcm_cupy import GLCM, Features
+    _HAS_GPU = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:  # ImportError, or CUDA runtime errors when no driver is installed
+    _HAS_GPU = False
+
+# GDAL block cache given to the block-wise passes while they run (_gdal_cache)
+_GDAL_CACHE_BYTES = 512 * 1024 * 1024
 
 """
 From the weakness of the mind, Omnissiah save us,
@@ -56,6 +118,750 @@ Praise the Omnissiah!
 
 FORM_CLASS, _ = uic.loadUiType(os.path.join(os.path.dirname(__file__), 'bare_earth_reconstructor_dialog.ui'))
 
+# Help texts are static, so they are built once at import time instead of on
+# every tab switch. Index in _TAB_HELP_HTML matches the tab index.
+_TAB1_HELP_HTML = """
+<b>INPUT & PROCESSING</b>
+
+<b>Input DSM:</b>
+Select your high-resolution DSM file or layer. Resolution will be detected automatically and parameters will be auto-scaled.
+
+<b>Output Directory:</b>
+Choose folder for results and intermediate files. All processing outputs will be saved here.
+
+<b>Threshold Method:</b>
+<u>Percentile-based (Recommended):</u>
+• Adaptive thresholds based on data distribution
+• Automatically adapts to terrain type
+• Mountain areas: Higher natural slopes
+• Flat areas: Lower natural slopes
+
+<u>Fixed Thresholds (Legacy):</u>
+• Manual threshold values
+• Same values for all terrain types
+• Use for comparison or specific requirements
+
+<b>Percentile Settings:</b>
+• <b>Slope:</b> % of values below anthropogenic threshold (90% = top 10% steepest)
+• <b>Curvature:</b> % of values below feature threshold (95% = top 5% most curved)  
+• <b>Residual:</b> % of values below anomaly threshold (95% = top 5% height differences)
+• <b>Texture Variance:</b> % of values below vegetation threshold (90% = top 10% most variable)
+• <b>Texture Entropy:</b> % of values below vegetation threshold (90% = top 10% most heterogeneous)
+
+<b>Fixed Threshold Values:</b>
+• <b>Slope:</b> Maximum natural slope (degrees)
+• <b>Curvature:</b> Maximum natural curvature
+• <b>Residual:</b> Height difference threshold (meters)
+
+<b>Scientific Method (Cao et al. 2020):</b>
+Objective, reproducible, landscape-independent methodology for bare earth reconstruction.
+
+<b>Interpolation Methods:</b>
+• <b>Enhanced GDAL:</b> Multi-stage processing with smoothing for complex datasets
+• <b>Simple GDAL:</b> Fast single-stage processing for quick results
+• <b>GRASS r.fillnulls:</b> Organic RST interpolation for natural terrain reconstruction
+"""
+
+_TAB2_HELP_HTML = """
+<b>ADVANCED OPTIONS</b>
+
+<b>Gaussian Filter:</b>
+Smooths the DSM to separate terrain from features.
+• <b>Sigma:</b> Smoothing strength (auto-scaled by pixel size)
+• <b>Kernel Radius:</b> Filter size in pixels
+• <b>Iterations:</b> Number of filter passes (2-3 recommended)
+
+<b>Texture Analysis (3-Class):</b>
+Distinguishes vegetation from anthropogenic features using surface texture patterns.
+• <b>Enable:</b> Activates 3-class classification (Natural/Vegetation/Anthropogenic)
+• <b>Window Size:</b> Analysis window (3x3 to 9x9 pixels)
+• <b>Variance Threshold:</b> Vegetation detection sensitivity
+• <b>Entropy Threshold:</b> Texture complexity threshold
+
+<b>Filter Options:</b>
+Choose which features to mask/remove:
+• <b>Anthropogenic:</b> Buildings, roads, infrastructure
+• <b>Vegetation:</b> Trees, bushes, forest cover
+
+<u>Common Combinations:</u>
+• Anthropogenic only: Traditional bare earth
+• Vegetation only: Keep buildings, remove forest
+• Both: Aggressive filtering for geology
+• Neither: Validation/debugging mode
+
+<b>Interpolation Options:</b>
+• <b>Enhanced GDAL:</b> Multi-stage with smoothing (balanced quality/speed)
+• <b>Simple GDAL:</b> Single-stage processing (fast results)
+• <b>GRASS r.fillnulls:</b> Organic RST method (best for natural terrain)
+
+<b>Buffer & Fill:</b>
+• <b>Buffer Distance:</b> Expand masked areas (meters)
+• <b>Fill Distance:</b> Maximum interpolation reach (pixels)
+• <b>Fill Iterations:</b> Interpolation passes (1-10)
+"""
+
+_TAB3_HELP_HTML = """
+<b>INTERPOLATION & OUTPUT</b>
+
+<b>Interpolation Methods:</b>
+Choose algorithm for reconstructing masked areas:
+
+<b>Enhanced GDAL (Multi-stage):</b>
+• Multi-stage processing with smoothing
+• Robust fallback method
+• Good for complex datasets
+• Reduces interpolation artifacts
+
+<b>Simple GDAL:</b>
+• Fast original method
+• May create angular artifacts
+• Use for quick processing
+• Good for parameter testing
+
+<b>GRASS r.fillnulls:</b>
+• Organic interpolation using RST (Regularized Spline with Tension) method
+• Excellent for natural terrain reconstruction and complex landscapes
+• Smooth results with detail preservation and natural surface continuity
+• Advanced parameters for fine-tuning: tension, smooth, edge, npmin, segmax, window size
+• Window size controls local interpolation area (3-15): smaller = more detail, larger = smoother
+• Includes NoData validation for reliable processing
+• Falls back to Simple GDAL if GRASS processing fails
+
+<b>Fill Parameters:</b>
+• <b>Fill Distance:</b> How far to interpolate (pixels)
+• <b>Fill Iterations:</b> Multiple passes for better results
+
+<b>Quality Tips:</b>
+• Use Enhanced GDAL for high-quality results
+• Use Simple GDAL for testing parameters
+• Larger fill distances = smoother results
+• Multiple iterations = better gap filling
+
+<b>Processing:</b>
+Click "Run Reconstruction" to start processing with current settings.
+"""
+
+_DEFAULT_HELP_HTML = "<b>Help</b><br/>Select a tab to see relevant help information."
+
+_TAB_HELP_HTML = (_TAB1_HELP_HTML, _TAB2_HELP_HTML, _TAB3_HELP_HTML)
+
+# GLCM texture settings for the in-process (Numba) texture kernel
+_GLCM_LEVELS = 64
+_TEXTURE_NODATA = -9999.0
+
+# The slope-based variance proxy (slope / 45, bounded to [0, 2]) is stored as
+# Byte: 0-254 with a GDAL scale of 2/254 (0.36 degree steps), 255 is NoData
+_SLOPE_PROXY_SCALE = 2.0 / 254
+_BYTE_NODATA = 255
+
+# Target edge length (pixels) of the tiles used for in-process raster work
+_TILE_SIZE = 1024
+
+# NoData of the residual raster; gdal_calc's Float32 default, so the
+# in-process subtract and the gdal:rastercalculator fallback agree
+_RESIDUAL_NODATA = -3.4028234663852886e+38
+
+# NoData of the slope raster, as written by qgis:slope
+_SLOPE_NODATA = -9999.0
+
+# Raster formats offered in the DSM file dialog
+_DSM_EXTS = ('.tif', '.tiff', '.asc', '.img', '.vrt', '.sdat', '.nc', '.grd', '.bil', '.hdr',
+             '.adf', '.dem', '.dt0', '.dt1', '.dt2', '.flt', '.hgt', '.raw', '.xyz', '.txt')
+_DSM_FILE_FILTER = 'Raster data (' + ' '.join('*' + ext for ext in _DSM_EXTS) + ');;All files (*)'
+
+# QgsRasterBlock data types that can be viewed as NumPy arrays
+_QGIS_NUMPY_DTYPES = {
+    Qgis.Byte: np.uint8,
+    Qgis.UInt16: np.uint16,
+    Qgis.Int16: np.int16,
+    Qgis.UInt32: np.uint32,
+    Qgis.Int32: np.int32,
+    Qgis.Float32: np.float32,
+    Qgis.Float64: np.float64,
+}
+
+# GeoTIFF creation options (processing 'OPTIONS' syntax) for every GDAL
+# translate/warp/fill write: 512px tiles, multi-threaded DEFLATE, BigTIFF
+# only when needed. Tiled outputs let later steps read them block by block
+_GTIFF_CREATION_OPTIONS = 'TILED=YES|COMPRESS=DEFLATE|BLOCKXSIZE=512|BLOCKYSIZE=512|NUM_THREADS=ALL_CPUS|BIGTIFF=IF_SAFER'
+
+# Same for the Float32 elevation rasters written in-process (filtered DSM,
+# residuals) that every later step reads again: the floating-point predictor
+# makes smooth surfaces compress much better, so each re-read moves fewer bytes
+_GTIFF_FLOAT_CREATION_OPTIONS = _GTIFF_CREATION_OPTIONS + '|PREDICTOR=3'
+
+# Statistics printed for binary masks (min/max/mean and the selected pixel
+# count as the band sum); none of them needs the second pass over the
+# raster that StdDev requires
+_MASK_DEBUG_STATS = (QgsRasterBandStats.Min | QgsRasterBandStats.Max |
+                     QgsRasterBandStats.Mean | QgsRasterBandStats.Sum)
+
+@contextmanager
+def _gdal_config(**options):
+    """
+    Temporarily set GDAL configuration options, restoring the previous values.
+    
+    Args:
+        **options: Option names and string values, e.g. GDAL_NUM_THREADS='ALL_CPUS'
+    """
+    previous = {name: gdal.GetConfigOption(name) for name in options}
+    for name, value in options.items():
+        gdal.SetConfigOption(name, value)
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            gdal.SetConfigOption(name, value)
+
+
+@contextmanager
+def _gdal_cache(min_bytes):
+    """
+    Temporarily grow GDAL's block cache to at least min_bytes.
+    
+    The cache is process-wide (QGIS rendering shares it), so the previous
+    size is restored on exit; a larger configured cache is never shrunk.
+    
+    Args:
+        min_bytes (int): Cache size needed by the block-wise pass
+    """
+    previous = gdal.GetCacheMax()
+    if previous < min_bytes:
+        gdal.SetCacheMax(min_bytes)
+    try:
+        yield
+    finally:
+        if previous < min_bytes:
+            gdal.SetCacheMax(previous)
+
+
+# Separator lines of the processing report and the organization summary
+_REPORT_RULE = "=" * 80 + "\n"
+_SECTION_RULE = "-" * 40 + "\n"
+_SUMMARY_RULE = "=" * 50 + "\n"
+
+def _write_text_file(path, text):
+    """
+    Write a text file with one encode and unbuffered os.write() calls.
+    
+    Newlines are translated to os.linesep first, so the file matches what a
+    text-mode open() would have written on this platform.
+    
+    Args:
+        path (str): Destination file path (created or truncated)
+        text (str): File content with '\\n' line endings
+    """
+    data = memoryview(text.replace('\n', os.linesep).encode('utf-8'))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        while data:  # os.write may write less than requested
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+# Rasters above this size get exact percentiles from a GDAL histogram with
+# _HISTOGRAM_BINS bins; smaller ones are read whole and partitioned
+_HISTOGRAM_MIN_PIXELS = 1000000
+_HISTOGRAM_BINS = 65536
+
+# Upper bound of pixels read for percentile estimation; larger rasters are
+# decimated by GDAL during the read
+_PERCENTILE_SAMPLE_PIXELS = 4000000
+
+# Number of valid values kept for the percentile selection itself; a uniform
+# random subsample (fixed seed, so thresholds are reproducible between runs)
+# of the block read, drawn without replacement
+_PERCENTILE_RANDOM_SAMPLES = 100000
+
+# Snapshot of the input DSM properties, taken once per selected DSM instead of
+# querying the layer/provider again in every consumer
+_DSMMeta = namedtuple('_DSMMeta', ['xres', 'yres', 'width', 'height', 'crs', 'extent'])
+
+# Band statistics read straight from GDAL; the field names follow
+# QgsRasterBandStats so both can be used interchangeably
+_BandStats = namedtuple('_BandStats', ['minimumValue', 'maximumValue', 'mean', 'stdDev',
+                                       'sum', 'elementCount', 'width', 'height'])
+
+# Pixel budget for approximate (sampled/overview) band statistics in checks
+# that only need a rough min/max/mean
+_STATS_SAMPLE_SIZE = 250000
+
+
+def _iter_tile_windows(x_size, y_size, block_x, block_y, overlap=0):
+    """
+    Yield tile windows over a raster, aligned to its GDAL block size.
+    
+    Args:
+        x_size (int): Raster width in pixels
+        y_size (int): Raster height in pixels
+        block_x (int): Native block width (band.GetBlockSize()[0])
+        block_y (int): Native block height (band.GetBlockSize()[1])
+        overlap (int): Halo in pixels added around each tile for moving-window
+            operations (e.g. texture window // 2)
+            
+    Yields:
+        tuple: (read_window, core_offset, core_window) where
+            - read_window is (xoff, yoff, xsize, ysize) including the halo
+            - core_offset is (col, row) of the core inside the read window
+            - core_window is (xoff, yoff, xsize, ysize) to write back
+    """
+    tile_x = max(block_x, (_TILE_SIZE // block_x) * block_x)
+    tile_y = max(block_y, (_TILE_SIZE // block_y) * block_y)
+    for y_off in range(0, y_size, tile_y):
+        rows = min(tile_y, y_size - y_off)
+        read_y0 = max(0, y_off - overlap)
+        read_y1 = min(y_size, y_off + rows + overlap)
+        for x_off in range(0, x_size, tile_x):
+            cols = min(tile_x, x_size - x_off)
+            read_x0 = max(0, x_off - overlap)
+            read_x1 = min(x_size, x_off + cols + overlap)
+            yield ((read_x0, read_y0, read_x1 - read_x0, read_y1 - read_y0),
+                   (x_off - read_x0, y_off - read_y0),
+                   (x_off, y_off, cols, rows))
+
+
+def _open_valid_raster(path, name):
+    """
+    Load a raster file as a QgsRasterLayer with the GDAL provider.
+    
+    Args:
+        path (str): Raster file path
+        name (str): Layer name
+        
+    Returns:
+        QgsRasterLayer: The layer, or None if it is not valid (the provider
+            error is logged)
+    """
+    layer = QgsRasterLayer(path, name, 'gdal')
+    if layer.isValid():
+        return layer
+    _log.warning('Could not load %s: %s', path, layer.error().message())
+    return None
+
+
+def _quick_probe(path):
+    """
+    Check that GDAL can open a raster and read its size and CRS.
+    
+    Much lighter than a throwaway QgsRasterLayer (provider registry, extent
+    and statistics metadata) when only validity or the grid is needed.
+    
+    Args:
+        path (str): Raster file path
+        
+    Returns:
+        tuple: (ok, width, height, crs_wkt); (False, 0, 0, '') if GDAL
+            cannot open the file
+    """
+    dataset = gdal.OpenEx(path, gdal.OF_RASTER | gdal.OF_READONLY)
+    if dataset is None:
+        return False, 0, 0, ''
+    return True, dataset.RasterXSize, dataset.RasterYSize, dataset.GetProjection()
+
+
+def _sample_class_counts(path, grid_size):
+    """
+    Count the class values on a regular grid_size x grid_size sample grid.
+    
+    One decimated GDAL read (buf_xsize/buf_ysize, nearest neighbour, using
+    overviews if present) replaces a provider.sample() call per grid point.
+    
+    Args:
+        path (str): Classification raster path
+        grid_size (int): Samples per row and column
+        
+    Returns:
+        dict: {class value: sample count} of the valid samples
+        
+    Raises:
+        Exception: If GDAL cannot open the raster
+    """
+    dataset = gdal.OpenEx(path, gdal.OF_RASTER | gdal.OF_READONLY)
+    if dataset is None:
+        raise Exception(f"Could not open classification raster: {path}")
+    band = dataset.GetRasterBand(1)
+    values = band.ReadAsArray(buf_xsize=min(grid_size, band.XSize), buf_ysize=min(grid_size, band.YSize))
+    valid = np.isfinite(values)
+    nodata_value = band.GetNoDataValue()
+    if nodata_value is not None:
+        valid &= values != nodata_value
+    classes, counts = np.unique(values[valid].astype(np.int64), return_counts=True)
+    return dict(zip(classes.tolist(), counts.tolist()))
+
+
+def _tile_statistics(values, nodata_value):
+    """
+    Partial statistics of one written tile, merged by _store_band_statistics.
+    
+    Args:
+        values (ndarray): Tile values as written to the output band
+        nodata_value (float): NoData value of the output band
+        
+    Returns:
+        tuple: (min, max, sum, sum of squares, valid count), or None if the
+            tile holds no valid value
+    """
+    valid = values[values != nodata_value].astype(np.float64)
+    if valid.size == 0:
+        return None
+    return float(valid.min()), float(valid.max()), float(valid.sum()), float(np.dot(valid, valid)), valid.size
+
+
+def _store_band_statistics(band, tile_stats):
+    """
+    Store exact band statistics merged from per-tile partials.
+    
+    Writes STATISTICS_MINIMUM/MAXIMUM/MEAN/STDDEV (SetStatistics) plus
+    STATISTICS_VALID_PERCENT and STATISTICS_SUM, so later readers (band
+    statistics, histogram percentiles) skip their own pass over the file.
+    
+    Args:
+        band (gdal.Band): Output band, opened for writing
+        tile_stats (list): _tile_statistics results of all tiles
+    """
+    tile_stats = [stats for stats in tile_stats if stats is not None]
+    if not tile_stats:
+        return
+    count = sum(stats[4] for stats in tile_stats)
+    total = sum(stats[2] for stats in tile_stats)
+    mean = total / count
+    variance = max(0.0, sum(stats[3] for stats in tile_stats) / count - mean * mean)
+    band.SetStatistics(min(stats[0] for stats in tile_stats), max(stats[1] for stats in tile_stats),
+                       mean, math.sqrt(variance))
+    band.SetMetadataItem('STATISTICS_VALID_PERCENT', repr(100.0 * count / (band.XSize * band.YSize)))
+    band.SetMetadataItem('STATISTICS_SUM', repr(total))
+
+
+def _run_tiles(process_tile, tiles, workers):
+    """
+    Apply process_tile to every tile window, concurrently where it pays off.
+    
+    Tiles are independent, so they run in a thread pool of at most one
+    thread per tile (GDAL reads and the nogil kernels release the GIL).
+    With a single worker or a single tile they run inline on the calling
+    thread, without pool overhead. GDAL's block cache is grown to
+    _GDAL_CACHE_BYTES for the pass (halo reads revisit neighbouring blocks)
+    and restored afterwards.
+    
+    Args:
+        process_tile (callable): Function taking one _iter_tile_windows item
+        tiles (list): Tile windows from _iter_tile_windows
+        workers (int): Maximum number of worker threads
+    """
+    with _gdal_cache(_GDAL_CACHE_BYTES):
+        if workers <= 1 or len(tiles) <= 1:
+            for tile in tiles:
+                process_tile(tile)
+            return
+        with ThreadPoolExecutor(max_workers=min(workers, len(tiles))) as executor:
+            # list() re-raises the first worker exception here
+            list(executor.map(process_tile, tiles))
+
+
+def _glcm_texture_kernel(img_q, valid, win, xlogx, out_var, out_ent):
+    """
+    Sliding-window GLCM variance and entropy without building the GLCM.
+    
+    For every pixel the symmetric co-occurrence pairs (distance 1, directions
+    0°, 45°, 90°, 135°) inside a win x win window are accumulated. Variance is
+    taken from running sums of the grey levels (Σg, Σg²), entropy from a
+    running Σ c·log(c) that is updated incrementally as pair counts grow:
+    H = log(N) - Σ c·log(c) / N. Only the touched cells of the count matrix
+    are reset afterwards, so per-pixel cost is O(window pairs), not O(levels²).
+    
+    Args:
+        img_q (ndarray[uint8]): Quantized grey levels (0 .. _GLCM_LEVELS-1)
+        valid (ndarray[bool]): Mask of valid (non-NoData) pixels
+        win (int): Window size in pixels (odd)
+        xlogx (ndarray[float64]): Lookup table with xlogx[c] = c·log(c)
+        out_var (ndarray[float32]): Output GLCM variance
+        out_ent (ndarray[float32]): Output GLCM entropy
+    """
+    height, width = img_q.shape
+    half = win // 2
+    offset_y = (0, 1, 1, 1)
+    offset_x = (1, 0, 1, -1)
+    for y in prange(height):
+        counts = np.zeros((_GLCM_LEVELS, _GLCM_LEVELS), dtype=np.int32)
+        y0 = max(0, y - half)
+        y1 = min(height - 1, y + half)
+        for x in range(width):
+            if not valid[y, x]:
+                out_var[y, x] = _TEXTURE_NODATA
+                out_ent[y, x] = _TEXTURE_NODATA
+                continue
+            x0 = max(0, x - half)
+            x1 = min(width - 1, x + half)
+            n = 0
+            sum_g = 0.0
+            sum_g2 = 0.0
+            sum_clogc = 0.0
+            for wy in range(y0, y1 + 1):
+                for wx in range(x0, x1 + 1):
+                    if not valid[wy, wx]:
+                        continue
+                    a = int(img_q[wy, wx])
+                    for k in range(4):
+                        ny = wy + offset_y[k]
+                        nx = wx + offset_x[k]
+                        if ny > y1 or nx < x0 or nx > x1 or not valid[ny, nx]:
+                            continue
+                        b = int(img_q[ny, nx])
+                        c = counts[a, b]
+                        sum_clogc += xlogx[c + 1] - xlogx[c]
+                        counts[a, b] = c + 1
+                        c = counts[b, a]
+                        sum_clogc += xlogx[c + 1] - xlogx[c]
+                        counts[b, a] = c + 1
+                        n += 2
+                        sum_g += a + b
+                        sum_g2 += a * a + b * b
+            if n == 0:
+                out_var[y, x] = _TEXTURE_NODATA
+                out_ent[y, x] = _TEXTURE_NODATA
+                continue
+            mean_g = sum_g / n
+            out_var[y, x] = sum_g2 / n - mean_g * mean_g
+            out_ent[y, x] = np.log(n) - sum_clogc / n
+            # Reset only the cells touched by this window
+            for wy in range(y0, y1 + 1):
+                for wx in range(x0, x1 + 1):
+                    if not valid[wy, wx]:
+                        continue
+                    a = int(img_q[wy, wx])
+                    for k in range(4):
+                        ny = wy + offset_y[k]
+                        nx = wx + offset_x[k]
+                        if ny > y1 or nx < x0 or nx > x1 or not valid[ny, nx]:
+                            continue
+                        b = int(img_q[ny, nx])
+                        counts[a, b] = 0
+                        counts[b, a] = 0
+
+
+def _glcm_texture_gpu(img_q, valid, win, out_var, out_ent):
+    """
+    GLCM variance and entropy on the GPU using glcm-cupy.
+    
+    Same contract as _glcm_texture_kernel. glcm-cupy needs radius + 1 pixels
+    of context around each output cell, so that border of the array is set to
+    _TEXTURE_NODATA; callers pass tiles with a matching halo.
+    
+    Args:
+        img_q (ndarray[uint8]): Quantized grey levels (0 .. _GLCM_LEVELS-1)
+        valid (ndarray[bool]): Mask of valid (non-NoData) pixels
+        win (int): Window size in pixels (odd)
+        out_var (ndarray[float32]): Output GLCM variance
+        out_ent (ndarray[float32]): Output GLCM entropy
+    """
+    border = win // 2 + 1
+    out_var.fill(_TEXTURE_NODATA)
+    out_ent.fill(_TEXTURE_NODATA)
+    height, width = img_q.shape
+    if height <= 2 * border or width <= 2 * border:
+        return
+    glcm = GLCM(radius=win // 2, step_size=1, bin_from=_GLCM_LEVELS, bin_to=_GLCM_LEVELS,
+                normalized_features=False, verbose=False,
+                features=(Features.VARIANCE, Features.ENTROPY))
+    result = cp.asnumpy(glcm.run(cp.asarray(img_q[..., None])))  # (h - 2b, w - 2b, 1, features)
+    out_var[border:-border, border:-border] = result[:, :, 0, Features.VARIANCE]
+    out_ent[border:-border, border:-border] = result[:, :, 0, Features.ENTROPY]
+    out_var[~valid] = _TEXTURE_NODATA
+    out_ent[~valid] = _TEXTURE_NODATA
+
+
+def _window_variance_sat(values, valid, win, out_var):
+    """
+    Moving-window variance from summed-area tables (integral images).
+    
+    Var = E[x²] - E[x]² over the valid pixels of each win x win window. The
+    window sums of x, x² and the valid count are four-corner differences of
+    their 2-D cumulative sums, so the cost per pixel is O(1) regardless of
+    the window size.
+    
+    Args:
+        values (ndarray[float32]): Grey levels of the tile
+        valid (ndarray[bool]): Mask of valid (non-NoData) pixels
+        win (int): Window size in pixels (odd)
+        out_var (ndarray[float32]): Output variance; _TEXTURE_NODATA where the
+            centre pixel is invalid
+    """
+    half = win // 2
+    # One leading zero row/column so window sums need no bounds checks
+    pad = ((half + 1, half), (half + 1, half))
+    x = np.where(valid, values, 0).astype(np.float64)
+    window_sums = []
+    for layer in (x, x * x, valid.astype(np.float64)):
+        table = np.pad(layer, pad).cumsum(axis=0).cumsum(axis=1)
+        window_sums.append(table[win:, win:] - table[:-win, win:] - table[win:, :-win] + table[:-win, :-win])
+    sum_x, sum_x2, count = window_sums
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sum_x / count
+        variance = np.maximum(sum_x2 / count - mean * mean, 0.0)
+    out_var[...] = variance
+    out_var[~valid | (count == 0)] = _TEXTURE_NODATA
+
+
+def _horn_slope(values, valid, cell_x, cell_y):
+    """
+    Horn's slope in degrees over a whole array, vectorized with NumPy.
+    
+    Follows the QGIS slope filter (qgis:slope): each row (column) of the
+    3x3 window contributes its central difference, or a one-sided difference
+    to the centre cell with half the weight when one end is NoData or outside
+    the array, or nothing when both are. Cells that are NoData, or whose
+    window leaves no weight in x or y, get _SLOPE_NODATA.
+    
+    Args:
+        values (ndarray[float32]): Elevation values
+        valid (ndarray[bool]): Mask of valid (non-NoData) pixels
+        cell_x (float): Pixel width in map units
+        cell_y (float): Pixel height in map units
+        
+    Returns:
+        ndarray[float32]: Slope in degrees
+    """
+    height, width = values.shape
+    z = np.pad(values, 1)
+    v = np.pad(valid, 1)  # outside the array counts as NoData
+    
+    def cell(dy, dx):
+        return z[1 + dy:1 + dy + height, 1 + dx:1 + dx + width], v[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+    
+    def derivative(pairs, cell_size):
+        total = np.zeros((height, width), dtype=np.float64)
+        weight = np.zeros((height, width), dtype=np.float64)
+        for (low, low_valid), (mid, mid_valid), (high, high_valid), factor in pairs:
+            both = low_valid & high_valid
+            high_only = ~low_valid & high_valid & mid_valid
+            low_only = low_valid & ~high_valid & mid_valid
+            total += factor * np.where(both, high - low, np.where(high_only, high - mid,
+                                                                  np.where(low_only, mid - low, 0.0)))
+            weight += factor * np.where(both, 2.0, np.where(high_only | low_only, 1.0, 0.0))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return total / (weight * cell_size), weight > 0
+    
+    dzdx, x_ok = derivative([(cell(dy, -1), cell(dy, 0), cell(dy, 1), 2.0 if dy == 0 else 1.0)
+                             for dy in (-1, 0, 1)], cell_x)
+    dzdy, y_ok = derivative([(cell(-1, dx), cell(0, dx), cell(1, dx), 2.0 if dx == 0 else 1.0)
+                             for dx in (-1, 0, 1)], cell_y)
+    with np.errstate(invalid='ignore'):
+        slope = np.degrees(np.arctan(np.hypot(dzdx, dzdy))).astype(np.float32)
+    slope[~(valid & x_ok & y_ok)] = _SLOPE_NODATA
+    return slope
+
+
+def _slope_roughness_kernel(dem, valid, cell_x, cell_y, out_var, out_ent):
+    """
+    Fused 3x3 slope and ruggedness pass for the alternative texture proxies.
+    
+    Per pixel, Horn's slope in degrees and Riley's terrain ruggedness index
+    sqrt(Σ (z_i - z_0)²) over the 8 neighbours (as qgis:ruggednessindex) are
+    computed from the same window. Neighbours that are NoData or outside the
+    array are substituted by the centre value. That is enough for a texture
+    proxy, but it is not the edge rule of the QGIS slope filter, which uses
+    one-sided differences with half weight (see _horn_slope). The outputs are
+    already normalized the way the old raster calculator formulas did:
+    variance = slope / 45, entropy = TRI * 10.
+    
+    Args:
+        dem (ndarray[float32]): Elevation values
+        valid (ndarray[bool]): Mask of valid (non-NoData) pixels
+        cell_x (float): Pixel width in map units
+        cell_y (float): Pixel height in map units
+        out_var (ndarray[float32]): Output slope / 45
+        out_ent (ndarray[float32]): Output ruggedness * 10
+    """
+    height, width = dem.shape
+    to_degrees = 180.0 / np.pi
+    for y in prange(height):
+        up = y > 0
+        down = y < height - 1
+        for x in range(width):
+            if not valid[y, x]:
+                out_var[y, x] = _TEXTURE_NODATA
+                out_ent[y, x] = _TEXTURE_NODATA
+                continue
+            z0 = np.float64(dem[y, x])
+            left = x > 0
+            right = x < width - 1
+            # Unrolled 3x3 stencil, window layout: a b c / d e f / g h i.
+            # Straight-line selects instead of a window array and a nested
+            # bounds-checked loop, so the compiler keeps everything in registers
+            a = dem[y - 1, x - 1] if up and left and valid[y - 1, x - 1] else z0
+            b = dem[y - 1, x] if up and valid[y - 1, x] else z0
+            c = dem[y - 1, x + 1] if up and right and valid[y - 1, x + 1] else z0
+            d = dem[y, x - 1] if left and valid[y, x - 1] else z0
+            f = dem[y, x + 1] if right and valid[y, x + 1] else z0
+            g = dem[y + 1, x - 1] if down and left and valid[y + 1, x - 1] else z0
+            h = dem[y + 1, x] if down and valid[y + 1, x] else z0
+            i = dem[y + 1, x + 1] if down and right and valid[y + 1, x + 1] else z0
+            tri = ((a - z0) ** 2 + (b - z0) ** 2 + (c - z0) ** 2 + (d - z0) ** 2
+                   + (f - z0) ** 2 + (g - z0) ** 2 + (h - z0) ** 2 + (i - z0) ** 2)
+            dzdx = ((c + 2 * f + i) - (a + 2 * d + g)) / (8 * cell_x)
+            dzdy = ((g + 2 * h + i) - (a + 2 * b + c)) / (8 * cell_y)
+            out_var[y, x] = np.arctan(np.sqrt(dzdx * dzdx + dzdy * dzdy)) * to_degrees / 45.0
+            out_ent[y, x] = np.sqrt(tri) * 10.0
+
+
+def _classify_kernel(slope, curvature, residual, variance, entropy, valid, mode, use_residual,
+                     thresholds, out):
+    """
+    Fused per-pixel classification of the anthropogenic feature mask.
+    
+    Evaluates the same decision as the raster calculator expressions of
+    run_reconstruction in one pass, without building or parsing a formula:
+    a pixel is "rough" if slope > slope threshold, |curvature| > curvature
+    threshold or (with residuals) |residual| > residual threshold.
+    
+    - mode 0 (binary): 1 = rough, 0 = natural
+    - mode 1 (texture rasters): 1 = (variance > t or entropy > t) and not
+      rough, else 2 = rough, else 0
+    - mode 2 (no texture rasters): 1 = slope <= vegetation slope threshold
+      (and |residual| <= residual threshold / 2), else 2 = rough, else 0
+    
+    Args:
+        slope, curvature, residual, variance, entropy (ndarray[float32]):
+            Aligned input arrays (unused ones may be any same-shape array)
+        valid (ndarray[bool]): Pixels where every used input is valid
+        mode (int): 0, 1 or 2 as above
+        use_residual (bool): Whether residuals take part in the decision
+        thresholds (ndarray[float64]): slope, curvature, residual, variance,
+            entropy and vegetation slope thresholds
+        out (ndarray[uint8]): Output classes, _BYTE_NODATA where not valid
+    """
+    slope_t, curvature_t, residual_t, variance_t, entropy_t, vegetation_slope_t = (
+        thresholds[0], thresholds[1], thresholds[2], thresholds[3], thresholds[4], thresholds[5])
+    height, width = slope.shape
+    for y in range(height):
+        for x in range(width):
+            if not valid[y, x]:
+                out[y, x] = _BYTE_NODATA
+                continue
+            slope_value = slope[y, x]
+            residual_value = abs(residual[y, x]) if use_residual else 0.0
+            rough = (slope_value > slope_t or abs(curvature[y, x]) > curvature_t
+                     or (use_residual and residual_value > residual_t))
+            if mode == 0:
+                out[y, x] = 1 if rough else 0
+                continue
+            if mode == 1:
+                vegetation = (variance[y, x] > variance_t or entropy[y, x] > entropy_t) and not rough
+            else:
+                vegetation = (slope_value <= vegetation_slope_t
+                              and (not use_residual or residual_value <= residual_t / 2))
+            out[y, x] = 1 if vegetation else (2 if rough else 0)
+
+
+if _HAS_NUMBA:
+    # Tiles run concurrently from a thread pool, so the kernels release the
+    # GIL instead of using Numba's own (non re-entrant) parallel layer
+    _slope_roughness_kernel = njit(nogil=True, fastmath=True, cache=True)(_slope_roughness_kernel)
+    _glcm_texture_kernel = njit(nogil=True, fastmath=True, cache=True)(_glcm_texture_kernel)
+    _classify_kernel = njit(nogil=True, cache=True)(_classify_kernel)
+
 class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
     """
     Main dialog class for the Bare Earth Reconstructor plugin.
@@ -89,6 +895,13 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
         - organize_output_files: File organization and cleanup
     """
     
+    # Progress notifications as (step, total_steps, message). Emitted from
+    # run_reconstruction and rendered by _on_progress.
+    progressChanged = pyqtSignal(int, int, str)
+    
+    # Minimum interval between two repaints of the progress widgets
+    PROGRESS_REPAINT_INTERVAL_MS = 50
+    
     def __init__(self, parent=None):
         """
         Initialize the Bare Earth Reconstructor dialog.
@@ -107,11 +920,65 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
         """
         super().__init__(parent)
         self.setupUi(self)
+        self._help_documents = {}  # tab index -> parsed help QTextDocument
+        self.spinWorkers.setValue(min(os.cpu_count() or 1, self.spinWorkers.maximum()))
+        self.checkUseGPU.setEnabled(_HAS_GPU)
+        self.checkUseGPU.setChecked(_HAS_GPU)
+        self.checkDebugLog.toggled.connect(self.on_debug_log_toggled)
+        self.on_debug_log_toggled(self.checkDebugLog.isChecked())
+        
+        # Set locale for decimal separators to use dot (.) instead of comma (,)
+        english_locale = QLocale(QLocale.English, QLocale.UnitedStates)
+        
+        # Apply English locale to all spin boxes (QSpinBox and QDoubleSpinBox) in one tree walk
+        for spin_box in self.findChildren(QAbstractSpinBox):
+            spin_box.setLocale(english_locale)
+        
+        # Progress updates go through a signal instead of pumping the event loop;
+        # the default AutoConnection is direct on the GUI thread and queued
+        # when emitted from a worker thread.
+        self._progress_timer = QElapsedTimer()
+        self.progressChanged.connect(self._on_progress)
+        
         self.populate_layers()
+        # Keep the layer combo in sync with the project instead of rescanning it
+        QgsProject.instance().layersAdded.connect(self._on_layers_added)
+        QgsProject.instance().layersWillBeRemoved.connect(self._on_layers_removed)
         self.buttonRun.clicked.connect(self.run_reconstruction)
         self.buttonBrowseDSM.clicked.connect(self.browse_dsm)
         self.buttonBrowseOutputDir.clicked.connect(self.browse_output_dir)
         
+        # Cached (source, _DSMMeta) of the selected DSM; dropped when the selection changes
+        self._dsm_meta = None
+        self.comboInputDSM.currentIndexChanged.connect(self._invalidate_dsm_meta)
+        self.lineEditInputDSM.textChanged.connect(self._invalidate_dsm_meta)
+        
+        # Float32 read buffers for percentile sampling, reused while the
+        # buffer shape stays the same (slope/curvature/residual share the grid);
+        # a pool, since the joint scan samples several layers concurrently
+        self._percentile_buffers = []
+        self._percentile_lock = threading.Lock()
+        
+        # Percentile results keyed by (source, mtime_ns, size, percentile); a
+        # rewritten raster gets a new key, so stale entries are never hit
+        self._percentile_cache = {}
+        # (min, max) of band 1 for the histogram percentiles, same file key
+        self._minmax_cache = {}
+        # Sources whose provider already passed the sample probe
+        self._validated_sources = set()
+        
+        # bandStatistics results keyed by (source, mtime_ns, size, stats flags)
+        self._band_stats_cache = {}
+        
+        # Scratch directory for temporary rasters, created on first use
+        self._scratch_dir = None
+        # Temporary GeoTIFF copies of non-file layers, keyed by layer id
+        self._raster_path_cache = {}
+        
+        # SAGA NextGen availability, looked up once instead of catching the
+        # unknown-algorithm error on every run
+        self._has_sagang = QgsApplication.processingRegistry().algorithmById('sagang:gaussianfilter') is not None
+        
         # Connect radio button signals for threshold method switching
         self.radioPercentile.toggled.connect(self.on_threshold_method_changed)
         self.radioFixed.toggled.connect(self.on_threshold_method_changed)
@@ -129,21 +996,6 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
         
         # Set initial help text for first tab
         self.update_help_text_for_tab(0)
-        
-        # Set locale for decimal separators to use dot (.) instead of comma (,)
-        from PyQt5.QtCore import QLocale
-        english_locale = QLocale(QLocale.English, QLocale.UnitedStates)
-        
-        # Apply English locale to all QDoubleSpinBox widgets for consistent decimal input
-        for widget_name in ['spinVarianceThreshold', 'spinEntropyThreshold', 'spinSlope', 
-                          'spinCurvature', 'spinResidual', 'spinVariancePercentile', 
-                          'spinEntropyPercentile', 'spinSigma', 'spinKernel', 'spinBuffer', 
-                          'spinFillDistance', 'spinFillIterations', 'spinTension', 
-                          'spinSmooth', 'spinEdge', 'spinNpmin', 'spinSegmax']:
-            if hasattr(self, widget_name):
-                widget = getattr(self, widget_name)
-                if hasattr(widget, 'setLocale'):
-                    widget.setLocale(english_locale)
 
     def on_threshold_method_changed(self):
         """
@@ -238,10 +1090,11 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
         presence in the dataset.
         
         The validation includes:
-        - File accessibility and raster layer validity
+        - File accessibility (opened read-only through GDAL)
         - NoData value definition in the raster metadata
-        - Presence of actual NoData pixels in the dataset
-        - Statistical validation of raster content
+        - Presence of valid pixels, taken from stored statistics metadata
+          or from a block-wise scan that stops at the first valid and the
+          first NoData pixel
         
         This method is specifically designed for GRASS r.fillnulls compatibility,
         as this algorithm requires properly defined NoData values to function
@@ -252,7 +1105,7 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
             raster_path (str): Path to the raster file to validate
                 - Must be a valid file path
                 - Should be a supported raster format (GeoTIFF, etc.)
-                - File must be readable by QGIS
+                - File must be readable by GDAL
                 
         Returns:
             bool: True if raster has valid NoData values, False otherwise
@@ -274,33 +1127,68 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
             - Method handles various raster formats and edge cases gracefully
         """
         try:
-            # Load raster layer
-            raster_layer = QgsRasterLayer(raster_path, 'NoData_Validation')
-            if not raster_layer.isValid():
+            # Open with GDAL directly - only metadata is needed, so there is no
+            # reason to build a full QgsRasterLayer/provider for this check
+            dataset = gdal.OpenEx(raster_path, gdal.OF_RASTER | gdal.OF_READONLY)
+            if dataset is None:
                 print(f'DEBUG: Could not load raster for NoData validation: {raster_path}')
                 return False
             
-            # Get raster provider
-            provider = raster_layer.dataProvider()
+            band = dataset.GetRasterBand(1)
             
             # Check if NoData value is defined
-            nodata_value = provider.sourceNoDataValue(1)
+            nodata_value = band.GetNoDataValue()
             print(f'DEBUG: NoData value for band 1: {nodata_value}')
             
             # Check if NoData value is a valid number (not None or NaN)
             if nodata_value is None or (nodata_value != nodata_value):  # Check for NaN
                 print('DEBUG: WARNING - NoData value is not properly defined!')
+                dataset = None
                 return False
             
-            # Get raster statistics to check for NoData pixels
-            stats = provider.bandStatistics(1, QgsRasterBandStats.All)
-            print(f'DEBUG: Raster statistics - Valid pixels: {stats.elementCount}')
-            print(f'DEBUG: Raster statistics - Min: {stats.minimumValue}, Max: {stats.maximumValue}')
+            # Prefer statistics already stored with the raster (PAM/.aux.xml)
+            minimum = band.GetMetadataItem('STATISTICS_MINIMUM')
+            maximum = band.GetMetadataItem('STATISTICS_MAXIMUM')
+            valid_percent = band.GetMetadataItem('STATISTICS_VALID_PERCENT')
+            if minimum is not None and maximum is not None:
+                dataset = None
+                print(f'DEBUG: Raster statistics - Valid percent: {valid_percent}')
+                print(f'DEBUG: Raster statistics - Min: {minimum}, Max: {maximum}')
+                if valid_percent is not None and float(valid_percent) == 0.0:
+                    print('DEBUG: WARNING - No valid pixels found in raster!')
+                    return False
+                print('DEBUG: NoData validation successful')
+                return True
+            
+            # No stored statistics: scan block by block (native block size) and
+            # stop as soon as both a valid pixel and a NoData pixel were seen
+            block_x, block_y = band.GetBlockSize()
+            x_size, y_size = band.XSize, band.YSize
+            has_valid = False
+            has_nodata = False
+            with _gdal_cache(_GDAL_CACHE_BYTES):
+                for y_off in range(0, y_size, block_y):
+                    rows = min(block_y, y_size - y_off)
+                    for x_off in range(0, x_size, block_x):
+                        cols = min(block_x, x_size - x_off)
+                        block = band.ReadAsArray(x_off, y_off, cols, rows)
+                        invalid = (block == nodata_value) | ~np.isfinite(block)
+                        has_nodata = has_nodata or bool(invalid.any())
+                        has_valid = has_valid or not bool(invalid.all())
+                        if has_valid and has_nodata:
+                            break
+                    if has_valid and has_nodata:
+                        break
+            dataset = None
+            
+            print(f'DEBUG: Block scan - Valid pixels present: {has_valid}, NoData pixels present: {has_nodata}')
             
-            # Check if there are actually NoData pixels in the raster
-            if stats.elementCount == 0:
+            # Check if there are actually valid pixels in the raster
+            if not has_valid:
                 print('DEBUG: WARNING - No valid pixels found in raster!')
                 return False
+            if not has_nodata:
+                print('DEBUG: WARNING - No NoData pixels found - nothing to fill')
             
             print('DEBUG: NoData validation successful')
             return True
@@ -320,12 +1208,37 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
         Side Effects:
             - Clears and repopulates the comboInputDSM combo box
             - Adds layer names as display text and layer IDs as data
+            
+        Note:
+            - Runs once at dialog creation; later project changes are
+              applied incrementally by _on_layers_added/_on_layers_removed
         """
         self.comboInputDSM.clear()
-        for layer in QgsProject.instance().mapLayers().values():
-            if isinstance(layer, QgsRasterLayer):
+        self._on_layers_added(QgsProject.instance().mapLayers().values())
+
+    def _on_layers_added(self, layers):
+        """
+        Add newly loaded raster layers to the input DSM combo box.
+        
+        Args:
+            layers (iterable of QgsMapLayer): Layers added to the project
+        """
+        for layer in layers:
+            if layer.type() == QgsMapLayer.RasterLayer:
                 self.comboInputDSM.addItem(layer.name(), layer.id())
 
+    def _on_layers_removed(self, layer_ids):
+        """
+        Remove layers that are about to leave the project from the combo box.
+        
+        Args:
+            layer_ids (list of str): IDs of the layers being removed
+        """
+        for layer_id in layer_ids:
+            index = self.comboInputDSM.findData(layer_id)
+            if index >= 0:
+                self.comboInputDSM.removeItem(index)
+
     def setup_help_text(self):
         """
         Setup help text for parameter explanations.
@@ -356,85 +1269,51 @@ class BareEarthReconstructorDialog(QDialog, FORM_CLASS):
                 
         Side Effects:
             - Updates the textEditHelp widget with appropriate help content
+            - Caches one parsed QTextDocument per tab for repeat visits
             - Handles exceptions gracefully with debug output
             
         Raises:
             Exception: If help text update fails (logged but not re-raised)
         """
         try:
-            if tab_index == 0:  # Input & Processing
-                help_text = self.get_tab1_help_text()
-            elif tab_index == 1:  # Advanced Options
-                help_text = self.get_tab2_help_text()
-            elif tab_index == 2:  # Interpolation & Output
-                help_text = self.get_tab3_help_text()
-            else:
-                help_text = "<b>Help</b><br/>Select a tab to see relevant help information."
+            # Reuse the already parsed document when the tab is revisited
+            help_document = self._help_documents.get(tab_index)
+            if help_document is None:
+                if 0 <= tab_index < len(_TAB_HELP_HTML):
+                    help_text = _TAB_HELP_HTML[tab_index]
+                else:
+                    help_text = _DEFAULT_HELP_HTML
+                
+                # Parent the document to the widget so it outlives setDocument swaps
+                help_document = QTextDocument(self.textEditHelp)
+                help_document.setDefaultFont(self.textEditHelp.font())
+                help_document.setHtml(help_text)
+                self._help_documents[tab_index] = help_document
             
-            self.textEditHelp.setHtml(help_text)
+            self.textEditHelp.setDocument(help_document)
         except Exception as e:
             print(f'DEBUG: Error updating help text: {str(e)}')
 
     def get_tab1_help_text(self):
         """
-        Generate help text for Tab 1: Input & Processing.
-        
-        Provides detailed explanations of the input parameters and processing
-        options available in the first tab. Includes information about DSM
-        selection, output directory, threshold methods, and percentile settings.
-        
-        Returns:
-            str: HTML-formatted help text for the Input & Processing tab
-            
-        Content includes:
-            - Input DSM selection and resolution detection
-            - Output directory specification
-            - Threshold method comparison (percentile vs fixed)
-            - Percentile parameter explanations
-            - Fixed threshold value descriptions
-            - Scientific methodology reference
-        """
-        return """
-<b>INPUT & PROCESSING</b>
-
-<b>Input DSM:</b>
-Select your high-resolution DSM file or layer. Resolution will be detected automatically and parameters will be auto-scaled.
-
-<b>Output Directory:</b>
-Choose folder for results and intermediate files. All processing outputs will be saved here.
-
-<b>Threshold Method:</b>
-<u>Percentile-based (Recommended):</u>
-• Adaptive thresholds based on data distribution
-• Automatically adapts to terrain type
-• Mountain areas: Higher natural slopes
-• Flat areas: Lower natural slopes
-
-<u>Fixed Thresholds (Legacy):</u>
-• Manual threshold values
-• Same values for all terrain types
-• Use for comparison or specific requirements
-
-<b>Percentile Settings:</b>
-• <b>Slope:</b> % of values below anthropogenic threshold (90% = top 10% steepest)
-• <b>Curvature:</b> % of values below feature threshold (95% = top 5% most curved)  
-• <b>Residual:</b> % of values below anomaly threshold (95% = top 5% height differences)
-• <b>Texture Variance:</b> % of values below vegetation threshold (90% = top 10% most variable)
-• <b>Texture Entropy:</b> % of values below vegetation threshold (90% = top 10% most heterogeneous)
-
-<b>Fixed Threshold Values:</b>
-• <b>Slope:</b> Maximum natural slope (degrees)
-• <b>Curvature:</b> Maximum natural curvature
-• <b>Residual:</b> Height difference threshold (meters)
-
-<b>Scientific Method (Cao et al. 2020):</b>
-Objective, reproducible, landscape-independent methodology for bare earth reconstruction.
-
-<b>Interpolation Methods:</b>
-• <b>Enhanced GDAL:</b> Multi-stage processing with smoothing for complex datasets
-• <b>Simple GDAL:</b> Fast single-stage processing for quick results
-• <b>GRASS r.fillnulls:</b> Organic RST interpolation for natural terrain reconstruction
+        Generate help text for Tab 1: Input & Processing.
+        
+        Provides detailed explanations of the input parameters and processing
+        options available in the first tab. Includes information about DSM
+        selection, output directory, threshold methods, and percentile settings.
+        
+        Returns:
+            str: HTML-formatted help text for the Input & Processing tab
+            
+        Content includes:
+            - Input DSM selection and resolution detection
+            - Output directory specification
+            - Threshold method comparison (percentile vs fixed)
+            - Percentile parameter explanations
+            - Fixed threshold value descriptions
+            - Scientific methodology reference
         """
+        return _TAB1_HELP_HTML
 
     def get_tab2_help_text(self):
         """
@@ -454,43 +1333,7 @@ Objective, reproducible, landscape-independent methodology for bare earth recons
             - Buffer and fill parameter explanations
             - Common parameter combinations and use cases
         """
-        return """
-<b>ADVANCED OPTIONS</b>
-
-<b>Gaussian Filter:</b>
-Smooths the DSM to separate terrain from features.
-• <b>Sigma:</b> Smoothing strength (auto-scaled by pixel size)
-• <b>Kernel Radius:</b> Filter size in pixels
-• <b>Iterations:</b> Number of filter passes (2-3 recommended)
-
-<b>Texture Analysis (3-Class):</b>
-Distinguishes vegetation from anthropogenic features using surface texture patterns.
-• <b>Enable:</b> Activates 3-class classification (Natural/Vegetation/Anthropogenic)
-• <b>Window Size:</b> Analysis window (3x3 to 9x9 pixels)
-• <b>Variance Threshold:</b> Vegetation detection sensitivity
-• <b>Entropy Threshold:</b> Texture complexity threshold
-
-<b>Filter Options:</b>
-Choose which features to mask/remove:
-• <b>Anthropogenic:</b> Buildings, roads, infrastructure
-• <b>Vegetation:</b> Trees, bushes, forest cover
-
-<u>Common Combinations:</u>
-• Anthropogenic only: Traditional bare earth
-• Vegetation only: Keep buildings, remove forest
-• Both: Aggressive filtering for geology
-• Neither: Validation/debugging mode
-
-<b>Interpolation Options:</b>
-• <b>Enhanced GDAL:</b> Multi-stage with smoothing (balanced quality/speed)
-• <b>Simple GDAL:</b> Single-stage processing (fast results)
-• <b>GRASS r.fillnulls:</b> Organic RST method (best for natural terrain)
-
-<b>Buffer & Fill:</b>
-• <b>Buffer Distance:</b> Expand masked areas (meters)
-• <b>Fill Distance:</b> Maximum interpolation reach (pixels)
-• <b>Fill Iterations:</b> Interpolation passes (1-10)
-        """
+        return _TAB2_HELP_HTML
 
     def get_tab3_help_text(self):
         """
@@ -508,54 +1351,31 @@ Choose which features to mask/remove:
             - Quality tips for optimal results
             - Processing workflow overview
         """
-        return """
-<b>INTERPOLATION & OUTPUT</b>
-
-<b>Interpolation Methods:</b>
-Choose algorithm for reconstructing masked areas:
-
-<b>Enhanced GDAL (Multi-stage):</b>
-• Multi-stage processing with smoothing
-• Robust fallback method
-• Good for complex datasets
-• Reduces interpolation artifacts
-
-<b>Simple GDAL:</b>
-• Fast original method
-• May create angular artifacts
-• Use for quick processing
-• Good for parameter testing
-
-<b>GRASS r.fillnulls:</b>
-• Organic interpolation using RST (Regularized Spline with Tension) method
-• Excellent for natural terrain reconstruction and complex landscapes
-• Smooth results with detail preservation and natural surface continuity
-• Advanced parameters for fine-tuning: tension, smooth, edge, npmin, segmax, window size
-• Window size controls local interpolation area (3-15): smaller = more detail, larger = smoother
-• Includes NoData validation for reliable processing
-• Falls back to Simple GDAL if GRASS processing fails
-
-<b>Fill Parameters:</b>
-• <b>Fill Distance:</b> How far to interpolate (pixels)
-• <b>Fill Iterations:</b> Multiple passes for better results
-
-<b>Quality Tips:</b>
-• Use Enhanced GDAL for high-quality results
-• Use Simple GDAL for testing parameters
-• Larger fill distances = smoother results
-• Multiple iterations = better gap filling
+        return _TAB3_HELP_HTML
 
-<b>Processing:</b>
-Click "Run Reconstruction" to start processing with current settings.
+    def update_progress(self, step, total_steps, message="Processing..."):
+        """
+        Publish the current processing status via progressChanged.
+        
+        Kept as a convenience wrapper for callers that do not emit the
+        signal directly. The actual widget update happens in _on_progress.
+        
+        Args:
+            step (int): Current step number (0-based or 1-based)
+            total_steps (int): Total number of steps in the process
+            message (str): Status message to display to the user
         """
+        self.progressChanged.emit(int(step), int(total_steps), str(message))
 
-    def update_progress(self, step, total_steps, message="Processing..."):
+    def _on_progress(self, step, total_steps, message):
         """
         Update both progress bar and status label with current processing status.
         
-        Provides real-time feedback to the user about processing progress.
-        Updates both the progress bar (numerical) and status label (textual)
-        with current step information and percentage completion.
+        Slot for progressChanged. Updates are throttled to one repaint per
+        PROGRESS_REPAINT_INTERVAL_MS; the final step is always shown. The
+        widgets are repainted directly instead of calling
+        QCoreApplication.processEvents(), so no user input (e.g. a second
+        click on Run) is dispatched while processing is in progress.
         
         Args:
             step (int): Current step number (0-based or 1-based)
@@ -565,25 +1385,28 @@ Click "Run Reconstruction" to start processing with current settings.
         Side Effects:
             - Updates progress bar value and maximum
             - Updates status label with formatted progress information
-            - Forces GUI update to ensure changes are visible
             
         Raises:
             Exception: If progress update fails (logged but not re-raised)
         """
         try:
+            is_final = step >= total_steps
+            if (not is_final and self._progress_timer.isValid()
+                    and self._progress_timer.elapsed() < self.PROGRESS_REPAINT_INTERVAL_MS):
+                return
+            self._progress_timer.start()
+            
             # Update progress bar
-            self.progressBar.setValue(int(step))
-            self.progressBar.setMaximum(int(total_steps))
+            self.progressBar.setMaximum(total_steps)
+            self.progressBar.setValue(step)
+            self.progressBar.repaint()
             
             # Update status label
             if hasattr(self, 'labelProgressStatus'):
                 percentage = int((step / total_steps) * 100) if total_steps > 0 else 0
                 status_text = f"Step {step}/{total_steps} ({percentage}%) • {message}"
                 self.labelProgressStatus.setText(status_text)
-            
-            # Force GUI update
-            from qgis.PyQt.QtCore import QCoreApplication
-            QCoreApplication.processEvents()
+                self.labelProgressStatus.repaint()
             
         except Exception as e:
             print(f'DEBUG: Error updating progress: {str(e)}')
@@ -605,6 +1428,7 @@ Click "Run Reconstruction" to start processing with current settings.
             Exception: If progress reset fails (logged but not re-raised)
         """
         try:
+            self._progress_timer.invalidate()
             self.progressBar.setValue(0)
             self.progressBar.setMaximum(100)
             if hasattr(self, 'labelProgressStatus'):
@@ -623,9 +1447,9 @@ Click "Run Reconstruction" to start processing with current settings.
         Side Effects:
             - Opens file dialog for DSM selection
             - Updates lineEditInputDSM with selected file path
-            - Supports multiple raster formats (.tif, .tiff, .asc, etc.)
+            - Supports the raster formats listed in _DSM_EXTS
         """
-        file_path, _ = QFileDialog.getOpenFileName(self, 'Select DSM', '', 'Raster data (*.tif *.tiff *.asc *.img *.vrt *.sdat *.nc *.grd *.bil *.hdr *.adf *.dem *.dt0 *.dt1 *.dt2 *.flt *.hgt *.raw *.xyz *.txt);;All files (*)')
+        file_path, _ = QFileDialog.getOpenFileName(self, 'Select DSM', '', _DSM_FILE_FILTER)
         if file_path:
             self.lineEditInputDSM.setText(file_path)
 
@@ -675,13 +1499,132 @@ Click "Run Reconstruction" to start processing with current settings.
             layer_id = self.comboInputDSM.currentData()
             return QgsProject.instance().mapLayer(layer_id)
 
+    def get_dsm_meta(self, dsm_layer):
+        """
+        Get resolution, size, CRS and extent of the DSM layer.
+        
+        The values are read from the layer once and cached until the DSM
+        selection changes (see _invalidate_dsm_meta).
+        
+        Args:
+            dsm_layer (QgsRasterLayer): The input DSM layer
+            
+        Returns:
+            _DSMMeta: (xres, yres, width, height, crs, extent) of the layer;
+                crs is the authority id string (e.g. 'EPSG:25832')
+        """
+        source = dsm_layer.source()
+        if self._dsm_meta is None or self._dsm_meta[0] != source:
+            meta = _DSMMeta(
+                xres=abs(dsm_layer.rasterUnitsPerPixelX()),
+                yres=abs(dsm_layer.rasterUnitsPerPixelY()),
+                width=dsm_layer.width(),
+                height=dsm_layer.height(),
+                crs=dsm_layer.crs().authid(),
+                extent=dsm_layer.extent()
+            )
+            self._dsm_meta = (source, meta)
+        return self._dsm_meta[1]
+
+    def _invalidate_dsm_meta(self, *args):
+        """Drop the cached DSM metadata after the DSM selection changed."""
+        self._dsm_meta = None
+
+    def get_band_statistics(self, raster_layer, stats=QgsRasterBandStats.All):
+        """
+        Get band 1 statistics of a raster layer, computed once per file state.
+        
+        bandStatistics() may scan the whole raster when no statistics are
+        stored; results are cached by source path, modification time, size and
+        requested statistics, so a file that is rewritten is scanned again.
+        
+        Args:
+            raster_layer (QgsRasterLayer): The raster layer
+            stats (int): QgsRasterBandStats flags to compute
+            
+        Returns:
+            QgsRasterBandStats: Statistics of band 1
+        """
+        source = raster_layer.source()
+        try:
+            source_stat = os.stat(source)
+        except OSError:
+            # Not a file (e.g. memory layer): nothing to key the cache on
+            return raster_layer.dataProvider().bandStatistics(1, stats)
+        key = (source, source_stat.st_mtime_ns, source_stat.st_size, int(stats))
+        if key not in self._band_stats_cache:
+            self._band_stats_cache[key] = raster_layer.dataProvider().bandStatistics(1, stats)
+        return self._band_stats_cache[key]
+
+    def get_gdal_band_statistics(self, raster_path):
+        """
+        Get band 1 statistics of a raster file through GDAL.
+        
+        Lighter than wrapping the file in a QgsRasterLayer just for
+        bandStatistics(): GDAL returns statistics stored in the file or its
+        .aux.xml (PAM) sidecar, and otherwise computes them exactly once and
+        stores them there for the next reader.
+        
+        Args:
+            raster_path (str): Path to the raster file
+            
+        Returns:
+            _BandStats: Statistics of band 1 (sum taken from a stored
+                STATISTICS_SUM item, else derived from mean and the valid
+                pixel count), or None if GDAL cannot open the file
+        """
+        dataset = gdal.OpenEx(raster_path, gdal.OF_RASTER | gdal.OF_READONLY)
+        if dataset is None:
+            return None
+        band = dataset.GetRasterBand(1)
+        minimum, maximum, mean, std_dev = band.GetStatistics(False, True)
+        valid_percent = band.GetMetadataItem('STATISTICS_VALID_PERCENT')
+        total_pixels = band.XSize * band.YSize
+        valid_count = total_pixels if valid_percent is None else round(total_pixels * float(valid_percent) / 100.0)
+        stored_sum = band.GetMetadataItem('STATISTICS_SUM')
+        band_sum = float(stored_sum) if stored_sum is not None else mean * valid_count
+        return _BandStats(minimum, maximum, mean, std_dev, band_sum, valid_count,
+                          band.XSize, band.YSize)
+
+    def forget_raster_results(self, *paths):
+        """
+        Drop cached statistics, min/max and percentiles of the given rasters.
+        
+        The caches are keyed by modification time and size, which already
+        misses rewritten files; this also covers file systems with coarse
+        timestamps where a rewrite of the same size could keep the old key.
+        
+        Args:
+            *paths (str): Raster file paths that are about to be rewritten
+        """
+        paths = {os.path.normcase(os.path.abspath(path)) for path in paths}
+        for cache in (self._percentile_cache, self._minmax_cache, self._band_stats_cache):
+            stale = [key for key in cache if os.path.normcase(os.path.abspath(key[0])) in paths]
+            for key in stale:
+                del cache[key]
+
+    def get_scratch_dir(self):
+        """
+        Get the dialog's scratch directory for temporary rasters.
+        
+        The directory is created once with tempfile.mkdtemp() and reused for
+        all temporary copies, instead of resolving the system temp dir and
+        formatting a PID-based name on every call.
+        
+        Returns:
+            str: Path to the scratch directory
+        """
+        if self._scratch_dir is None or not os.path.isdir(self._scratch_dir):
+            self._scratch_dir = tempfile.mkdtemp(prefix='bare_earth_')
+        return self._scratch_dir
+
     def get_raster_path(self, raster_layer):
         """
         Get the file path for a raster layer.
         
         Extracts the file path from a QgsRasterLayer. If the layer was
-        loaded from a file, returns the original path. Otherwise, creates
-        a temporary file using GDAL translate.
+        loaded from a file GDAL can read, returns the original path.
+        Otherwise, creates a tiled temporary GeoTIFF using GDAL translate.
         
         Args:
             raster_layer (QgsRasterLayer): The raster layer to get path for
@@ -690,16 +1633,27 @@ Click "Run Reconstruction" to start processing with current settings.
             str: File path to the raster layer
             
         Note:
-            - Prefers original file path if available
-            - Creates temporary file if layer was loaded from memory
-            - Uses GDAL translate for format conversion if needed
+            - Prefers original file path if GDAL can identify its format
+            - Creates temporary file if layer was loaded from memory, with a
+              unique name in get_scratch_dir(); the copy is made once per
+              layer and reused by later calls while it exists
+            - Temporary copy is tiled (512x512), DEFLATE compressed (multi-threaded,
+              BigTIFF when needed) and gets
+              NEAREST overviews (2..32) for cheap decimated reads
         """
-        # If layer was loaded from file, return path
+        # If layer was loaded from a GDAL-readable file, return path. The
+        # formats of _DSM_EXTS are the common case; GDAL's driver probe also
+        # catches any other format it can read (and rejects e.g. a bare .hdr)
         src = raster_layer.source()
-        if os.path.isfile(src) and src.lower().endswith((".tif", ".tiff", ".asc", ".img", ".vrt")):
+        if os.path.isfile(src) and gdal.IdentifyDriver(src) is not None:
             return src
-        # Otherwise save temporarily
-        temp_path = os.path.join(tempfile.gettempdir(), f"temp_input_dsm_{os.getpid()}.tif")
+        cached_path = self._raster_path_cache.get(raster_layer.id())
+        if cached_path is not None and os.path.isfile(cached_path):
+            return cached_path
+        # Otherwise save temporarily, under a unique name in the scratch dir
+        temp_fd, temp_path = tempfile.mkstemp(prefix='temp_input_dsm_', suffix='.tif',
+                                              dir=self.get_scratch_dir())
+        os.close(temp_fd)
         _ = processing.run(
             "gdal:translate",
             {
@@ -707,12 +1661,20 @@ Click "Run Reconstruction" to start processing with current settings.
                 "TARGET_CRS": None,
                 "NODATA": None,
                 "COPY_SUBDATASETS": False,
-                "OPTIONS": "",
+                "OPTIONS": _GTIFF_CREATION_OPTIONS,
                 "EXTRA": "",
                 "DATA_TYPE": 0,
                 "OUTPUT": temp_path
             }
         )
+        # Pyramids let later decimated reads touch only a small overview level.
+        # NEAREST keeps original pixel values, so sampled distributions (and
+        # percentiles) are not smoothed the way AVERAGE overviews would be.
+        dataset = gdal.Open(temp_path, gdal.GA_Update)
+        if dataset is not None:
+            dataset.BuildOverviews('NEAREST', [2, 4, 8, 16, 32])
+            dataset = None
+        self._raster_path_cache[raster_layer.id()] = temp_path
         return temp_path
 
     def get_pixel_size_and_scale_parameters(self, dsm_layer):
@@ -753,8 +1715,9 @@ Click "Run Reconstruction" to start processing with current settings.
         """
         try:
             # Get pixel size in map units
-            pixel_size_x = abs(dsm_layer.rasterUnitsPerPixelX())
-            pixel_size_y = abs(dsm_layer.rasterUnitsPerPixelY())
+            dsm_meta = self.get_dsm_meta(dsm_layer)
+            pixel_size_x = dsm_meta.xres
+            pixel_size_y = dsm_meta.yres
             pixel_size = (pixel_size_x + pixel_size_y) / 2  # Average pixel size
             
             print(f'DEBUG: Detected pixel size: {pixel_size:.3f} map units')
@@ -801,48 +1764,7 @@ Click "Run Reconstruction" to start processing with current settings.
             print(f'DEBUG: Original parameters - Sigma: {original_sigma}, Kernel: {original_kernel_radius}, Buffer: {original_buffer_distance}m, Fill: {original_fill_distance}')
             print(f'DEBUG: Scaled parameters - Sigma: {scaled_sigma:.2f}, Kernel: {scaled_kernel_radius}, Buffer: {scaled_buffer_distance}m, Fill: {scaled_fill_distance}')
             
-            # Show scaling information to user
-            if abs(scale_factor - 1.0) > 0.1:  # Only show if significant scaling needed
-                scaling_message = f"""
-Detected DSM resolution: {pixel_size:.3f}m
-
-Auto-scaled parameters for your resolution:
-• Sigma: {original_sigma:.2f} → {scaled_sigma:.2f}
-• Kernel Radius: {original_kernel_radius} → {scaled_kernel_radius} pixels
-• Buffer Distance: {original_buffer_distance}m ({
-    "no buffering - stays at 0.0m" if original_buffer_distance <= 0.0 
-    else "no scaling - stays in meters"
-})
-• Fill Distance: {original_fill_distance} → {scaled_fill_distance} pixels
-
-Scale factor: {scale_factor:.2f}x relative to 2x2m reference
-Target smoothing window: ~{target_smoothing_distance}m
-                """
-                
-                reply = QMessageBox.question(
-                    self, 
-                    'Auto-Scale Parameters?', 
-                    scaling_message + "\n\nApply auto-scaled parameters?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.Yes
-                )
-                
-                if reply == QMessageBox.Yes:
-                    # Update UI with scaled parameters
-                    self.spinSigma.setValue(scaled_sigma)
-                    self.spinKernelRadius.setValue(scaled_kernel_radius)
-                    # Only update buffer distance if user didn't explicitly set it to 0.0
-                    if original_buffer_distance > 0.0:
-                        self.spinBufferDistance.setValue(scaled_buffer_distance)
-                    # else: keep user's explicit 0.0 setting
-                    self.spinFillDistance.setValue(scaled_fill_distance)
-                    print('DEBUG: Parameters auto-scaled and applied to UI')
-                    if original_buffer_distance <= 0.0:
-                        print('DEBUG: Buffer Distance kept at 0.0 (user preference preserved)')
-                else:
-                    print('DEBUG: User declined auto-scaling, keeping original parameters')
-            
-            return {
+            scaling_info = {
                 'pixel_size': pixel_size,
                 'scale_factor': scale_factor,
                 'suggested_sigma': scaled_sigma,
@@ -851,6 +1773,54 @@ Target smoothing window: ~{target_smoothing_distance}m
                 'suggested_fill_distance': scaled_fill_distance
             }
             
+            # Near-identity scaling: nothing to show, skip message and dialog
+            if abs(scale_factor - 1.0) <= 0.1:
+                return scaling_info
+            
+            # Show scaling information to user
+            if original_buffer_distance <= 0.0:
+                buffer_note = "no buffering - stays at 0.0m"
+            else:
+                buffer_note = "no scaling - stays in meters"
+            scaling_message = "\n".join([
+                "",
+                "Detected DSM resolution: %.3fm" % pixel_size,
+                "",
+                "Auto-scaled parameters for your resolution:",
+                "• Sigma: %.2f → %.2f" % (original_sigma, scaled_sigma),
+                "• Kernel Radius: %d → %d pixels" % (original_kernel_radius, scaled_kernel_radius),
+                "• Buffer Distance: %sm (%s)" % (original_buffer_distance, buffer_note),
+                "• Fill Distance: %d → %d pixels" % (original_fill_distance, scaled_fill_distance),
+                "",
+                "Scale factor: %.2fx relative to 2x2m reference" % scale_factor,
+                "Target smoothing window: ~%sm" % target_smoothing_distance,
+            ])
+            
+            reply = QMessageBox.question(
+                self, 
+                'Auto-Scale Parameters?', 
+                scaling_message + "\n\n\nApply auto-scaled parameters?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            
+            if reply == QMessageBox.Yes:
+                # Update UI with scaled parameters
+                self.spinSigma.setValue(scaled_sigma)
+                self.spinKernelRadius.setValue(scaled_kernel_radius)
+                # Only update buffer distance if user didn't explicitly set it to 0.0
+                if original_buffer_distance > 0.0:
+                    self.spinBufferDistance.setValue(scaled_buffer_distance)
+                # else: keep user's explicit 0.0 setting
+                self.spinFillDistance.setValue(scaled_fill_distance)
+                print('DEBUG: Parameters auto-scaled and applied to UI')
+                if original_buffer_distance <= 0.0:
+                    print('DEBUG: Buffer Distance kept at 0.0 (user preference preserved)')
+            else:
+                print('DEBUG: User declined auto-scaling, keeping original parameters')
+            
+            return scaling_info
+            
         except Exception as e:
             print(f'DEBUG: Could not determine pixel size or scale parameters: {str(e)}')
             print('DEBUG: Using original parameters without scaling')
@@ -863,7 +1833,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                 'suggested_fill_distance': self.spinFillDistance.value()
             }
 
-    def calculate_raster_percentiles(self, raster_layer, percentile):
+    def calculate_raster_percentiles(self, raster_layer, percentile, workers=None):
         """
         Calculate percentile value for a raster layer using memory-efficient processing.
         
@@ -877,31 +1847,42 @@ Target smoothing window: ~{target_smoothing_distance}m
         
         Args:
             raster_layer (QgsRasterLayer): The raster layer to analyze
-            percentile (float): Percentile value to calculate (0-100)
+            percentile (float or sequence of float): Percentile value(s) to calculate (0-100)
                 - 90: Top 10% of values (for anthropogenic features)
                 - 95: Top 5% of values (for extreme features)
                 - 85: Top 15% of values (for moderate features)
+                - [90, 10]: Both tails from a single sampling pass
+            workers (int, optional): Strip read threads for this layer; None
+                uses get_worker_count() (the joint scan passes its per-layer share)
             
         Returns:
-            float: Calculated percentile value, or None if calculation failed
+            float: Calculated percentile value, or None if calculation failed.
+                If a sequence of percentiles was passed, a list of floats in
+                the same order is returned instead.
             
         Raises:
-            ImportError: If NumPy is not available (falls back to simple calculation)
             Exception: If raster reading or calculation fails
             
         Note:
-            - Uses NumPy for efficient percentile calculation when available
-            - Falls back to simple sorting-based calculation if NumPy unavailable
+            - Uses NumPy for efficient percentile calculation
             - Handles NoData values automatically
             - Provides detailed debug output for validation
-            - Sampling is used for datasets >10M pixels to improve performance
+            - GDAL-backed layers are read by file path with GDAL/NumPy
+              (_percentile_from_path): above _HISTOGRAM_MIN_PIXELS an exact
+              streaming histogram, else one ReadAsArray call. Provider grid
+              sampling is only the fallback for other providers
+            - Multiple percentiles share one sampling pass and one partition
+            - Results are cached per file and modification time
             
         Example:
             >>> slope_threshold = calculate_raster_percentiles(slope_layer, 90)
             >>> # Returns the 90th percentile of slope values
+            >>> upper, lower = calculate_raster_percentiles(curvature_layer, [90, 10])
         """
+        single_percentile = not isinstance(percentile, (list, tuple))
+        percentiles = [percentile] if single_percentile else list(percentile)
         try:
-            print(f'DEBUG: Calculating {percentile}th percentile for {raster_layer.name()}...')
+            _log.debug('Calculating %sth percentile(s) for %s...', percentiles, raster_layer.name())
             
             # Validate raster layer before processing
             if not raster_layer or not raster_layer.isValid():
@@ -912,313 +1893,548 @@ Target smoothing window: ~{target_smoothing_distance}m
             if not provider or not provider.isValid():
                 raise Exception(f"Invalid raster provider for {raster_layer.name()}")
             
-            # Test provider with small sample to ensure it's working
+            # Reuse results for an unchanged file (e.g. re-runs after a parameter change)
             try:
-                test_point = raster_layer.extent().center()
-                test_value, test_success = provider.sample(test_point, 1)
-                if not test_success:
-                    print(f'DEBUG: Warning - Provider sample test failed for {raster_layer.name()}')
-            except Exception as test_error:
-                print(f'DEBUG: Warning - Provider test failed: {str(test_error)}')
+                source_stat = os.stat(raster_layer.source())
+                cache_stamp = (raster_layer.source(), source_stat.st_mtime_ns, source_stat.st_size)
+            except OSError:
+                cache_stamp = None
+            if cache_stamp is not None:
+                cached = [self._percentile_cache.get(cache_stamp + (round(pct, 4),)) for pct in percentiles]
+                if None not in cached:
+                    _log.debug('Using cached percentile(s) %s for %s', cached, raster_layer.name())
+                    return cached[0] if single_percentile else cached
+            
+            # GDAL files: numpy-native percentiles read straight from the file
+            # path (histogram or decimated read), bypassing the provider API
+            if raster_layer.providerType() == 'gdal':
+                percentile_values = self._percentile_from_path(
+                    raster_layer.source(), percentiles, cache_stamp, workers)
+                if percentile_values is not None:
+                    _log.debug('Percentiles of %s: %s', raster_layer.name(), ', '.join(
+                        '%sth=%.4f' % item for item in zip(percentiles, percentile_values)))
+                    if cache_stamp is not None:
+                        for pct, pct_value in zip(percentiles, percentile_values):
+                            self._percentile_cache[cache_stamp + (round(pct, 4),)] = pct_value
+                    return percentile_values[0] if single_percentile else percentile_values
             
             # Get raster dimensions
             width = raster_layer.width()
             height = raster_layer.height()
             extent = raster_layer.extent()
             
-            # Check memory usage before processing large datasets
-            try:
-                import psutil
-                memory_percent = psutil.virtual_memory().percent
-                print(f'DEBUG: Memory usage before processing: {memory_percent:.1f}%')
-                if memory_percent > 90:
-                    print(f'DEBUG: WARNING - High memory usage detected: {memory_percent:.1f}%')
-                
-                # Store initial memory for comparison
-                initial_memory = psutil.virtual_memory().used
-                
-            except ImportError:
-                print('DEBUG: psutil not available - memory monitoring disabled')
-                initial_memory = None
-            except Exception as mem_error:
-                print(f'DEBUG: Memory check failed: {str(mem_error)}')
-                initial_memory = None
+            # Check memory usage before processing large datasets; one
+            # snapshot here, compared once after the array is built
+            initial_memory = None
+            if psutil is None:
+                _log.debug('psutil not available - memory monitoring disabled')
+            else:
+                try:
+                    memory = psutil.virtual_memory()
+                    _log.debug('Memory usage before processing: %.1f%%', memory.percent)
+                    if memory.percent > 90:
+                        _log.warning('High memory usage detected: %.1f%%', memory.percent)
+                    initial_memory = memory.used
+                except Exception as mem_error:
+                    _log.debug('Memory check failed: %s', mem_error)
             
-            print(f'DEBUG: Raster dimensions: {width}x{height} pixels')
+            nodata_value = provider.sourceNoDataValue(1) if provider.sourceHasNoDataValue(1) else None
             
             # Memory-efficient processing with chunked approach
             total_pixels = width * height
-            print(f'DEBUG: Total pixels to process: {total_pixels:,}')
+            _log.debug('Raster dimensions: %dx%d pixels (%d total)', width, height, total_pixels)
             
-            # Determine processing strategy based on dataset size
-            if total_pixels > 5000000:  # > 5M pixels - use sampling
-                print('DEBUG: Large raster detected, using statistical sampling for percentile calculation')
-                target_samples = min(100000, total_pixels // 10)  # Max 100k samples, or 10% of pixels
-                sample_factor = max(1, int((total_pixels / target_samples) ** 0.5))
-                
-                print(f'DEBUG: Sampling strategy: {target_samples:,} samples, factor {sample_factor}')
-                
-                # Create systematic sample coordinates
-                values = []
-                nodata_value = provider.sourceNoDataValue(1)
-                samples_taken = 0
-                
-                for i in range(0, width, sample_factor):
-                    for j in range(0, height, sample_factor):
-                        if samples_taken >= target_samples:
-                            break
-                        
-                        try:
-                            # Convert pixel coordinates to map coordinates
-                            x = extent.xMinimum() + (i + 0.5) * raster_layer.rasterUnitsPerPixelX()
-                            y = extent.yMaximum() - (j + 0.5) * raster_layer.rasterUnitsPerPixelY()
-                            
-                            # Sample value using provider
-                            value, success = provider.sample(QgsPointXY(x, y), 1)
-                            if success and value != nodata_value and not (value != value):  # Check for valid value
-                                values.append(value)
-                            
-                            samples_taken += 1
-                            
-                            # Progress update every 1000 samples
-                            if samples_taken % 1000 == 0:
-                                print(f'DEBUG: Sampled {samples_taken:,} pixels...')
-                                
-                        except Exception as sample_error:
-                            print(f'DEBUG: Sample error at ({i},{j}): {str(sample_error)}')
-                            continue
-                    
-                    if samples_taken >= target_samples:
-                        break
-                        
-                print(f'DEBUG: Sampling completed: {len(values):,} valid samples from {samples_taken:,} total samples')
-                
-                # Memory monitoring after sampling
-                if initial_memory is not None:
-                    try:
-                        current_memory = psutil.virtual_memory().used
-                        memory_increase = (current_memory - initial_memory) / 1024 / 1024  # MB
-                        print(f'DEBUG: Memory increase after sampling: {memory_increase:.1f} MB')
-                    except:
-                        pass
-                
-            elif total_pixels > 1000000:  # 1M-5M pixels - use chunked processing
-                print('DEBUG: Medium raster detected, using chunked processing for percentile calculation')
-                
-                # Use chunked processing to reduce memory usage
-                chunk_size = 1000  # Process 1000x1000 pixel chunks
-                values = []
-                nodata_value = provider.sourceNoDataValue(1)
-                
-                for chunk_x in range(0, width, chunk_size):
-                    for chunk_y in range(0, height, chunk_size):
-                        # Calculate chunk dimensions
-                        chunk_width = min(chunk_size, width - chunk_x)
-                        chunk_height = min(chunk_size, height - chunk_y)
-                        
-                        # Create chunk extent
-                        chunk_extent = QgsRectangle(
-                            extent.xMinimum() + chunk_x * raster_layer.rasterUnitsPerPixelX(),
-                            extent.yMaximum() - (chunk_y + chunk_height) * raster_layer.rasterUnitsPerPixelY(),
-                            extent.xMinimum() + (chunk_x + chunk_width) * raster_layer.rasterUnitsPerPixelX(),
-                            extent.yMaximum() - chunk_y * raster_layer.rasterUnitsPerPixelY()
-                        )
-                        
-                        try:
-                            # Skip block creation - use sampling instead
-                            pass
-                            
-                            # Process chunk values using sampling to avoid block access issues
-                            sample_factor = max(1, min(10, chunk_width // 100))  # Sample every 10th pixel or 1% of chunk
-                            
-                            for i in range(0, chunk_width, sample_factor):
-                                for j in range(0, chunk_height, sample_factor):
-                                    try:
-                                        # Convert chunk pixel coordinates to map coordinates
-                                        x = chunk_extent.xMinimum() + (i + 0.5) * raster_layer.rasterUnitsPerPixelX()
-                                        y = chunk_extent.yMaximum() - (j + 0.5) * raster_layer.rasterUnitsPerPixelY()
-                                        
-                                        # Sample value using provider (safer than block access)
-                                        value, success = provider.sample(QgsPointXY(x, y), 1)
-                                        if success and value != nodata_value and not (value != value):
-                                            values.append(value)
-                                    except Exception as chunk_error:
-                                        continue  # Skip problematic pixels
-                            
-                            # Progress update
-                            if (chunk_x // chunk_size + chunk_y // chunk_size) % 10 == 0:
-                                print(f'DEBUG: Processed chunk ({chunk_x},{chunk_y}), total values: {len(values):,}')
-                                
-                        except Exception as chunk_error:
-                            print(f'DEBUG: Chunk processing error at ({chunk_x},{chunk_y}): {str(chunk_error)}')
-                            continue
-                
-                print(f'DEBUG: Chunked processing completed: {len(values):,} valid pixels')
-                
-                # Memory monitoring after chunked processing
-                if initial_memory is not None:
-                    try:
-                        current_memory = psutil.virtual_memory().used
-                        memory_increase = (current_memory - initial_memory) / 1024 / 1024  # MB
-                        print(f'DEBUG: Memory increase after chunked processing: {memory_increase:.1f} MB')
-                    except:
-                        pass
-                
-            else:  # < 1M pixels - use safe sampling approach
-                print('DEBUG: Small raster detected, using safe sampling approach for percentile calculation')
-                
-                # Use sampling approach to avoid block access issues
-                target_samples = min(50000, total_pixels // 2)  # Max 50k samples, or 50% of pixels
-                sample_factor = max(1, int((total_pixels / target_samples) ** 0.5))
-                
-                print(f'DEBUG: Safe sampling strategy: {target_samples:,} samples, factor {sample_factor}')
-                
-                # Create systematic sample coordinates
-                values = []
-                nodata_value = provider.sourceNoDataValue(1)
-                samples_taken = 0
-                
-                for i in range(0, width, sample_factor):
-                    for j in range(0, height, sample_factor):
-                        if samples_taken >= target_samples:
-                            break
-                        
-                        try:
-                            # Convert pixel coordinates to map coordinates
-                            x = extent.xMinimum() + (i + 0.5) * raster_layer.rasterUnitsPerPixelX()
-                            y = extent.yMaximum() - (j + 0.5) * raster_layer.rasterUnitsPerPixelY()
-                            
-                            # Sample value using provider (safer than block access)
-                            value, success = provider.sample(QgsPointXY(x, y), 1)
-                            if success and value != nodata_value and not (value != value):  # Check for valid value
-                                values.append(value)
-                            
-                            samples_taken += 1
-                            
-                            # Progress update every 5000 samples
-                            if samples_taken % 5000 == 0:
-                                print(f'DEBUG: Sampled {samples_taken:,} pixels...')
-                                
-                        except Exception as sample_error:
-                            print(f'DEBUG: Sample error at ({i},{j}): {str(sample_error)}')
-                            continue
-                    
-                    if samples_taken >= target_samples:
-                        break
-                        
-                print(f'DEBUG: Safe sampling completed: {len(values):,} valid samples from {samples_taken:,} total samples')
-                
-                # Memory monitoring after safe sampling
-                if initial_memory is not None:
-                    try:
-                        current_memory = psutil.virtual_memory().used
-                        memory_increase = (current_memory - initial_memory) / 1024 / 1024  # MB
-                        print(f'DEBUG: Memory increase after safe sampling: {memory_increase:.1f} MB')
-                    except:
-                        pass
+            # Other providers: test with a small sample to ensure it's working;
+            # once per source, since the probe decodes a block and discards it
+            if raster_layer.source() not in self._validated_sources:
+                try:
+                    test_point = raster_layer.extent().center()
+                    test_value, test_success = provider.sample(test_point, 1)
+                    if test_success:
+                        self._validated_sources.add(raster_layer.source())
+                    else:
+                        _log.warning('Provider sample test failed for %s', raster_layer.name())
+                except Exception as test_error:
+                    _log.warning('Provider test failed: %s', test_error)
+            
+            # Sample a regular grid, with the same size-dependent sampling
+            # density as before
+            if total_pixels > 5000000:  # > 5M pixels - max 100k samples, or 10% of pixels
+                target_samples = min(100000, total_pixels // 10)
+            elif total_pixels > 1000000:  # 1M-5M pixels - every 10th pixel per axis
+                target_samples = total_pixels // 100
+            else:  # < 1M pixels - max 50k samples, or 50% of pixels
+                target_samples = min(50000, total_pixels // 2)
+            sample_factor = max(1, int((total_pixels / target_samples) ** 0.5))
+            _log.debug('Provider sampling strategy: %d samples, factor %d', target_samples, sample_factor)
+            
+            # Pixel-centre coordinates of the sampling grid, generated in one shot
+            # from plain floats (no PyQt calls once the grid is built)
+            pixel_x = raster_layer.rasterUnitsPerPixelX()
+            pixel_y = raster_layer.rasterUnitsPerPixelY()
+            x_min = extent.xMinimum()
+            y_max = extent.yMaximum()
+            xs = x_min + (np.arange(0, width, sample_factor) + 0.5) * pixel_x
+            ys = y_max - (np.arange(0, height, sample_factor) + 0.5) * pixel_y
+            values = self._sample_provider_grid(provider, xs, ys, sample_factor * pixel_x,
+                                                sample_factor * pixel_y, nodata_value)
+            
+            _log.debug('Sampling completed: %d valid samples from %d grid points', len(values), xs.size * ys.size)
             
             if len(values) == 0:
                 raise Exception("No valid pixel values found")
             
             # Calculate percentile using memory-efficient numpy processing
             try:
-                import numpy as np
-                
                 # Use memory-efficient array creation
-                if len(values) > 1000000:  # > 1M values - use float32 for memory efficiency
-                    print('DEBUG: Large dataset detected, using float32 for memory efficiency')
-                    values_array = np.array(values, dtype=np.float32)
+                if isinstance(values, np.ndarray):
+                    # Already float32 and masked with one isfinite/NoData pass
+                    # by the sampler, so no second NaN/Inf scan is needed
+                    values_array = values
                 else:
-                    values_array = np.array(values)
-            
+                    if len(values) > 1000000:  # > 1M values - use float32 for memory efficiency
+                        _log.debug('Large dataset detected, using float32 for memory efficiency')
+                        values_array = np.array(values, dtype=np.float32)
+                    else:
+                        values_array = np.array(values)
+                    
+                    # Remove invalid values in a single vectorised pass
+                    finite = np.isfinite(values_array)
+                    if not finite.all():
+                        _log.warning('Invalid values (NaN/Inf) detected in array')
+                        values_array = values_array[finite]
+                
                 # Validate array before calculation
                 if len(values_array) == 0:
-                    raise Exception("Empty values array after conversion")
+                    raise Exception("No valid values after removing NaN/Inf")
                 
-                # Check for invalid values in array
-                if np.any(np.isnan(values_array)) or np.any(np.isinf(values_array)):
-                    print('DEBUG: Warning - Invalid values (NaN/Inf) detected in array')
-                    # Remove invalid values
-                    values_array = values_array[np.isfinite(values_array)]
-                    if len(values_array) == 0:
-                        raise Exception("No valid values after removing NaN/Inf")
-                
-                print(f'DEBUG: Final array size: {len(values_array):,} valid values')
-                print(f'DEBUG: Array memory usage: {values_array.nbytes / 1024 / 1024:.1f} MB')
+                _log.debug('Final array size: %d valid values (%.1f MB)',
+                           len(values_array), values_array.nbytes / 1024 / 1024)
                 
                 # Memory monitoring after array creation
                 if initial_memory is not None:
                     try:
                         current_memory = psutil.virtual_memory().used
                         memory_increase = (current_memory - initial_memory) / 1024 / 1024  # MB
-                        print(f'DEBUG: Total memory increase: {memory_increase:.1f} MB')
+                        _log.debug('Total memory increase: %.1f MB', memory_increase)
                     except:
                         pass
                 
             except ImportError:
                 raise ImportError("NumPy is required for percentile calculation")
             except Exception as np_error:
-                print(f'DEBUG: NumPy array creation failed: {str(np_error)}')
+                _log.warning('NumPy array creation failed: %s', np_error)
                 raise Exception(f"Array processing failed: {str(np_error)}")
             
-            # Calculate percentile with safety checks
+            # Calculate all requested percentiles with one O(n) introselect pass
+            # (lower-rank value, like the pure-Python fallback) instead of sorting
             try:
-                percentile_value = np.percentile(values_array, percentile)
+                ranks = [int(pct / 100.0 * (len(values_array) - 1)) for pct in percentiles]
+                percentile_values = np.partition(values_array, ranks)[ranks]
                 
                 # Validate percentile result
-                if np.isnan(percentile_value) or np.isinf(percentile_value):
+                if not np.all(np.isfinite(percentile_values)):
                     raise Exception("Invalid percentile result (NaN/Inf)")
                 
-                # Calculate some additional statistics for debugging
-                min_val = np.min(values_array)
-                max_val = np.max(values_array)
-                mean_val = np.mean(values_array)
-                std_val = np.std(values_array)
+                # Additional statistics for debugging; four extra passes over
+                # the sample, so only computed when debug output is enabled
+                if _log.isEnabledFor(logging.DEBUG):
+                    min_val = np.min(values_array)
+                    max_val = np.max(values_array)
+                    mean_val = np.mean(values_array)
+                    std_val = np.std(values_array)
+                    
+                    # Validate statistics
+                    if not np.all(np.isfinite([min_val, max_val, mean_val, std_val])):
+                        _log.warning('Invalid statistics detected')
                     
-                # Validate statistics
-                if any(np.isnan([min_val, max_val, mean_val, std_val])) or any(np.isinf([min_val, max_val, mean_val, std_val])):
-                    print('DEBUG: Warning - Invalid statistics detected')
+                    _log.debug('Raster statistics - Min: %.4f, Max: %.4f, Mean: %.4f, StdDev: %.4f; '
+                               'percentiles: %s', min_val, max_val, mean_val, std_val,
+                               ', '.join('%sth=%.4f' % item for item in zip(percentiles, percentile_values)))
                 
-                print(f'DEBUG: Raster statistics - Min: {min_val:.4f}, Max: {max_val:.4f}')
-                print(f'DEBUG: Raster statistics - Mean: {mean_val:.4f}, StdDev: {std_val:.4f}')
-                print(f'DEBUG: {percentile}th percentile: {percentile_value:.4f}')
+                percentile_values = [float(v) for v in percentile_values]
+                if cache_stamp is not None:
+                    for pct, pct_value in zip(percentiles, percentile_values):
+                        self._percentile_cache[cache_stamp + (round(pct, 4),)] = pct_value
                 
-                return float(percentile_value)
+                if single_percentile:
+                    return percentile_values[0]
+                return percentile_values
                 
             except Exception as calc_error:
-                print(f'DEBUG: Percentile calculation failed: {str(calc_error)}')
+                _log.warning('Percentile calculation failed: %s', calc_error)
                 raise Exception(f"Percentile calculation failed: {str(calc_error)}")
             
-        except ImportError:
-            print('DEBUG: NumPy not available, using alternative percentile calculation')
+        except Exception as e:
+            _log.warning('Percentile calculation failed for %s: %s', raster_layer.name(), e)
+            return None
+
+    def calculate_raster_percentiles_many(self, raster_layer, percentiles, workers=None):
+        """
+        Calculate several percentiles of a raster layer from one traversal.
+        
+        List form of calculate_raster_percentiles: the raster is read (or its
+        histogram built) once and every percentile is taken from that pass,
+        e.g. both tails of curvature or residuals.
+        
+        Args:
+            raster_layer (QgsRasterLayer): The raster layer to analyze
+            percentiles (sequence of float): Percentile values (0-100)
+            workers (int, optional): Strip read threads (see calculate_raster_percentiles)
+            
+        Returns:
+            list of float: Percentile values in the order requested, or None if
+                the calculation failed
+            
+        Example:
+            >>> lower, upper = calculate_raster_percentiles_many(curvature_layer, [10, 90])
+        """
+        return self.calculate_raster_percentiles(raster_layer, list(percentiles), workers)
+
+    def _percentile_from_path(self, raster_path, percentiles, cache_stamp=None, workers=None):
+        """
+        Calculate percentiles of band 1 of a raster file with GDAL and NumPy.
+        
+        No QGIS objects are involved: rasters above _HISTOGRAM_MIN_PIXELS use
+        the exact streaming histogram (_histogram_percentiles); smaller ones
+        (or if the histogram fails) are read with _read_percentile_sample and
+        the ranks are selected with np.partition.
+        
+        Args:
+            raster_path (str): Path of a GDAL-readable raster file
+            percentiles (list of float): Percentile values (0-100)
+            cache_stamp (tuple, optional): (source, mtime_ns, size) file key
+                for the min/max cache of the histogram path
+            workers (int, optional): Strip read threads of _read_percentile_sample
+            
+        Returns:
+            list of float: Percentile values in the order requested, or None if
+                the file cannot be read or holds no valid pixels
+        """
+        dataset = gdal.OpenEx(raster_path, gdal.OF_RASTER | gdal.OF_READONLY)
+        if dataset is None:
+            return None
+        total_pixels = dataset.RasterXSize * dataset.RasterYSize
+        # Both paths work on raw band values; scaled bands (Byte texture
+        # proxies) are mapped back to real values at the end, like QGIS reads them
+        band = dataset.GetRasterBand(1)
+        scale = band.GetScale() or 1.0
+        offset = band.GetOffset() or 0.0
+        band = None
+        dataset = None
+        
+        percentile_values = None
+        if total_pixels > _HISTOGRAM_MIN_PIXELS:
+            percentile_values = self._histogram_percentiles(raster_path, percentiles, cache_stamp)
+        
+        if percentile_values is None:
+            values = self._read_percentile_sample(raster_path, workers)
+            if values is None or values.size == 0:
+                return None
+            _log.debug('GDAL block read completed: %d valid values', values.size)
+            
+            # All requested percentiles with one O(n) introselect pass (lower-rank
+            # value, like the provider path) instead of sorting
+            ranks = [int(pct / 100.0 * (values.size - 1)) for pct in percentiles]
+            percentile_values = [float(value) for value in np.partition(values, ranks)[ranks]]
+        
+        if scale != 1.0 or offset != 0.0:
+            percentile_values = [value * scale + offset for value in percentile_values]
+        return percentile_values
+
+    def _histogram_percentiles(self, raster_path, percentiles, cache_stamp=None):
+        """
+        Calculate percentiles from a streaming GDAL histogram of band 1.
+        
+        Two C-level passes over the raster: the value range (read from stored
+        exact statistics when present, else ComputeStatistics, which stores
+        them), then GetHistogram with _HISTOGRAM_BINS bins over that range
+        (NoData and NaN are skipped by GDAL). Each percentile is located on
+        the cumulative histogram and interpolated linearly inside its bin, so
+        the error is bounded by (max - min) / _HISTOGRAM_BINS and memory use
+        is independent of the raster size.
+        
+        Args:
+            raster_path (str): Path of a GDAL-readable raster file
+            percentiles (list of float): Percentile values (0-100)
+            cache_stamp (tuple, optional): (source, mtime_ns, size) file key;
+                the min/max pass is skipped if this key was seen before
             
-            # Fallback: Simple percentile calculation without numpy
-            try:
-                if len(values) == 0:
-                    print('DEBUG: No values available for fallback calculation')
-                    return None
-                
-                # Validate values before sorting
-                valid_values = [v for v in values if v == v and v != nodata_value]  # Remove NaN and NoData
-                if len(valid_values) == 0:
-                    print('DEBUG: No valid values for fallback calculation')
+        Returns:
+            list of float: Percentile values in the order requested, or None if
+                the file is not GDAL-readable or holds no valid pixels
+        """
+        dataset = gdal.OpenEx(raster_path, gdal.OF_RASTER | gdal.OF_READONLY)
+        if dataset is None:
+            return None
+        band = dataset.GetRasterBand(1)
+        value_range = self._minmax_cache.get(cache_stamp) if cache_stamp is not None else None
+        if value_range is None:
+            # Exact statistics stored with the file (by the texture writers, or
+            # by an earlier ComputeStatistics below) make the min/max pass free
+            stored_min = band.GetMetadataItem('STATISTICS_MINIMUM')
+            stored_max = band.GetMetadataItem('STATISTICS_MAXIMUM')
+            if (stored_min is not None and stored_max is not None
+                    and band.GetMetadataItem('STATISTICS_APPROXIMATE') != 'YES'):
+                value_range = (float(stored_min), float(stored_max))
+            else:
+                # Same single pass as ComputeRasterMinMax, but the result is
+                # kept in the .aux.xml for the next analysis of this file
+                try:
+                    computed = band.ComputeStatistics(False)
+                except RuntimeError as minmax_error:
+                    computed = None
+                    _log.debug('Min/max pass failed for %s: %s', raster_path, minmax_error)
+                if not computed:
                     return None
-                
-                valid_values.sort()
-                index = int((percentile / 100.0) * (len(valid_values) - 1))
-                index = max(0, min(index, len(valid_values) - 1))  # Ensure index is within bounds
-                percentile_value = valid_values[index]
-                
-                print(f'DEBUG: {percentile}th percentile (fallback): {percentile_value:.4f}')
-                return float(percentile_value)
-                
-            except Exception as fallback_error:
-                print(f'DEBUG: Fallback calculation failed: {str(fallback_error)}')
-                return None
+                value_range = (computed[0], computed[1])
+            if cache_stamp is not None:
+                self._minmax_cache[cache_stamp] = value_range
+        value_min, value_max = value_range
+        if not (math.isfinite(value_min) and math.isfinite(value_max)):
+            return None
+        if value_max <= value_min:
+            return [float(value_min)] * len(percentiles)
+        
+        # Out-of-range counting keeps the maximum itself in the last bin
+        histogram = np.asarray(band.GetHistogram(value_min, value_max, buckets=_HISTOGRAM_BINS,
+                                                 include_out_of_range=1, approx_ok=0),
+                               dtype=np.float64)
+        dataset = None
+        cumulative = np.cumsum(histogram)
+        count = cumulative[-1]
+        if count == 0:
+            return None
+        
+        # Same lower-rank convention as the sampled path; the rank's position
+        # inside its bin splits the bin linearly
+        bin_width = (value_max - value_min) / _HISTOGRAM_BINS
+        ranks = np.array([pct / 100.0 * (count - 1) for pct in percentiles])
+        bins = np.minimum(np.searchsorted(cumulative, ranks, side='right'), _HISTOGRAM_BINS - 1)
+        below = cumulative[bins] - histogram[bins]
+        fraction = (ranks - below) / np.maximum(histogram[bins], 1)
+        values = value_min + (bins + np.clip(fraction, 0.0, 1.0)) * bin_width
+        return [float(min(value, value_max)) for value in values]
+
+    def _joint_percentile_scan(self, layers, percentiles):
+        """
+        Calculate the percentiles of several co-registered layers in one scan.
+        
+        The GDAL block cache is sized once for the whole scan, to min(25% of
+        RAM, 2 GB) when psutil is available (never shrunk), and restored when
+        the scan ends. This lets the strip reads of successive layers reuse it
+        instead of resizing it per layer. Every layer is then sampled once, with all of its percentiles
+        taken from that single sample (see calculate_raster_percentiles).
+        
+        GDAL-backed layers are processed concurrently in a thread pool: their
+        reads and histograms run in GDAL with the GIL released and each call
+        opens its own dataset. The worker budget is split between the layers
+        so the strip reads inside each layer do not oversubscribe the CPU.
+        Other providers are sampled afterwards on the calling thread.
+        
+        Args:
+            layers (dict): Layer key -> QgsRasterLayer
+            percentiles (dict): Layer key -> percentile or list of percentiles
             
-        except Exception as e:
-            print(f'DEBUG: Percentile calculation failed for {raster_layer.name()}: {str(e)}')
+        Returns:
+            dict: Layer key -> float for a single percentile, list of floats
+                for a list of percentiles, or None if the calculation failed
+        """
+        cache_target = 0
+        if psutil is not None:
+            try:
+                cache_target = min(psutil.virtual_memory().total // 4, 2 * 1024 ** 3)
+            except Exception as cache_error:
+                _log.debug('Could not size GDAL block cache: %s', cache_error)
+        with _gdal_cache(cache_target):
+            def percentiles_of(key, workers=None):
+                if isinstance(percentiles[key], (list, tuple)):
+                    return self.calculate_raster_percentiles_many(layers[key], percentiles[key], workers)
+                return self.calculate_raster_percentiles(layers[key], percentiles[key], workers)
+            
+            results = {}
+            gdal_keys = [key for key, layer in layers.items() if layer.providerType() == 'gdal']
+            if len(gdal_keys) > 1:
+                worker_count = self.get_worker_count()
+                pool_size = min(len(gdal_keys), worker_count)
+                layer_workers = max(1, worker_count // pool_size)
+                with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                    futures = {key: executor.submit(percentiles_of, key, layer_workers) for key in gdal_keys}
+                    for key, future in futures.items():
+                        results[key] = future.result()
+            
+            for key in layers:
+                if key not in results:
+                    results[key] = percentiles_of(key)
+            return results
+
+    def _sample_provider_grid(self, provider, xs, ys, cell_x, cell_y, nodata_value):
+        """
+        Sample a raster provider on a regular grid of pixel centres.
+        
+        Requests the whole grid as one QgsRasterBlock whose cells are centred
+        on (xs, ys); only if the provider cannot deliver the block, falls back
+        to one provider.sample() call per grid point.
+        
+        Args:
+            provider (QgsRasterDataProvider): Provider of the raster layer
+            xs (numpy.ndarray): Grid x coordinates (map units, ascending)
+            ys (numpy.ndarray): Grid y coordinates (map units, descending)
+            cell_x (float): Grid spacing in x (map units)
+            cell_y (float): Grid spacing in y (map units)
+            nodata_value (float): Source NoData value of band 1, or None
+            
+        Returns:
+            numpy.ndarray: 1-D float32 array of valid (finite, non-NoData) samples
+        """
+        block_extent = QgsRectangle(xs[0] - cell_x / 2, ys[-1] - cell_y / 2,
+                                    xs[-1] + cell_x / 2, ys[0] + cell_y / 2)
+        block = provider.block(1, block_extent, xs.size, ys.size)
+        dtype = _QGIS_NUMPY_DTYPES.get(block.dataType()) if block is not None else None
+        if dtype is not None and block.isValid():
+            values = np.frombuffer(bytes(block.data()), dtype=dtype).astype(np.float32)
+            if block.hasNoDataValue():
+                nodata_value = block.noDataValue()
+        else:
+            _log.debug('Provider block read unavailable - sampling grid point by point')
+            values = np.empty(xs.size * ys.size, dtype=np.float32)
+            # Bind the method and convert the coordinates to Python floats once,
+            # so the inner loop does no attribute lookups or NumPy scalar boxing
+            sample = provider.sample
+            point = QgsPointXY
+            nan = float('nan')
+            x_list = xs.tolist()
+            index = 0
+            for y in ys.tolist():
+                for x in x_list:
+                    value, success = sample(point(x, y), 1)
+                    values[index] = value if success else nan
+                    index += 1
+        
+        valid = np.isfinite(values)
+        if nodata_value is not None:
+            valid &= values != nodata_value
+        return values[valid]
+
+    def _read_percentile_sample(self, raster_path, workers=None):
+        """
+        Read the valid values of band 1 with GDAL ReadAsArray calls.
+        
+        Rasters above _PERCENTILE_SAMPLE_PIXELS are decimated by GDAL itself
+        (buf_xsize/buf_ysize, nearest neighbour, using overviews if present),
+        so the cost is a C-level read instead of one provider.sample() round
+        trip per pixel. The read is split into horizontal strips that are
+        fetched by workers (default get_worker_count()) threads, each with its own dataset
+        handle (ReadAsArray releases the GIL); a single strip is read through
+        a NUM_THREADS=ALL_CPUS dataset instead. The GDAL block cache is grown
+        to hold a full row of blocks per strip for the read and restored
+        afterwards. GDAL decodes into a preallocated float32 buffer that is
+        returned to a pool for later calls.
+        
+        The valid values are then reduced to a fixed-size reservoir of at most
+        _PERCENTILE_RANDOM_SAMPLES by a seeded random choice of indices without
+        replacement, which removes the regular-grid bias of the decimated read
+        and bounds the memory of the percentile selection.
+        
+        Args:
+            raster_path (str): Path of a GDAL-readable raster file
+            workers (int, optional): Strip read threads; None uses
+                get_worker_count() and lets a single strip decode multi-threaded
+            
+        Returns:
+            numpy.ndarray: 1-D float32 array of valid (finite, non-NoData) values,
+                or None if the file is not GDAL-readable
+        """
+        source = raster_path
+        dataset = gdal.OpenEx(source, gdal.OF_RASTER | gdal.OF_READONLY)
+        if dataset is None:
             return None
+        band = dataset.GetRasterBand(1)
+        nodata_value = band.GetNoDataValue()
+        x_size, y_size = band.XSize, band.YSize
+        block_row_bytes = x_size * band.GetBlockSize()[1] * gdal.GetDataTypeSize(band.DataType) // 8
+        
+        # Prefer the smallest pyramid level that still holds enough samples;
+        # reading it costs I/O proportional to the overview, not the raster
+        overview_index = None
+        for index in range(band.GetOverviewCount()):
+            overview = band.GetOverview(index)
+            if overview.XSize * overview.YSize < _PERCENTILE_SAMPLE_PIXELS:
+                break
+            overview_index = index
+        if overview_index is not None:
+            overview = band.GetOverview(overview_index)
+            x_size, y_size = overview.XSize, overview.YSize
+            _log.debug('Reading overview level %dx%d for percentile sampling', x_size, y_size)
+        dataset = None
+        
+        step = max(1, int(math.ceil(math.sqrt(x_size * y_size / _PERCENTILE_SAMPLE_PIXELS))))
+        buffer_shape = (max(1, y_size // step), max(1, x_size // step))
+        with self._percentile_lock:
+            buffer = next((pooled for pooled in self._percentile_buffers
+                           if pooled.shape == buffer_shape), None)
+            if buffer is not None:
+                self._percentile_buffers.remove(buffer)
+        if buffer is None:
+            buffer = np.empty(buffer_shape, dtype=np.float32)
+        buffer_rows = buffer_shape[0]
+        
+        # Horizontal strips of the buffer; strip boundaries are mapped back to
+        # source rows so the decimation matches a single full read
+        strip_count = max(1, min(workers or self.get_worker_count(), buffer_rows))
+        strips = [(buffer_rows * i // strip_count, buffer_rows * (i + 1) // strip_count)
+                  for i in range(strip_count)]
+        
+        # GDAL datasets are not thread-safe: one handle per worker thread. A
+        # single strip uses multi-threaded block decoding instead, scoped to the
+        # dataset (a global GDAL_NUM_THREADS would also affect QGIS rendering),
+        # unless the joint scan already runs other layers in parallel
+        if strip_count == 1 and workers is None:
+            open_options = ['NUM_THREADS=ALL_CPUS']
+        else:
+            open_options = []
+        thread_state = threading.local()
+        
+        def read_strip(strip):
+            first_row, last_row = strip
+            if not hasattr(thread_state, 'band'):
+                thread_state.dataset = gdal.OpenEx(source, gdal.OF_RASTER | gdal.OF_READONLY,
+                                                   open_options=open_options)
+                thread_state.band = thread_state.dataset.GetRasterBand(1)
+                if overview_index is not None:
+                    thread_state.band = thread_state.band.GetOverview(overview_index)
+            y_off = first_row * y_size // buffer_rows
+            rows = last_row * y_size // buffer_rows - y_off
+            thread_state.band.ReadAsArray(0, y_off, x_size, rows,
+                                          buf_xsize=buffer_shape[1],
+                                          buf_ysize=last_row - first_row,
+                                          buf_obj=buffer[first_row:last_row])
+        
+        # A full row of blocks per concurrent strip must fit in the block cache,
+        # otherwise the strided read decodes the same tiles for every buffer line
+        with _gdal_cache(2 * strip_count * block_row_bytes), \
+                ThreadPoolExecutor(max_workers=strip_count) as executor:
+            # list() re-raises the first worker exception here
+            list(executor.map(read_strip, strips))
+        values = buffer.ravel()
+        _log.debug('Read %d samples (every %dth pixel) in %d strip(s)', values.size, step, strip_count)
+        
+        valid = np.isfinite(values)
+        if nodata_value is not None:
+            valid &= values != nodata_value
+        values = values[valid]
+        with self._percentile_lock:
+            self._percentile_buffers.append(buffer)
+        
+        if values.size > _PERCENTILE_RANDOM_SAMPLES:
+            # Fixed-size uniform sample without replacement (the reservoir an
+            # Algorithm R pass would keep), drawn as unshuffled indices so the
+            # values themselves are never permuted or copied in full
+            rng = np.random.default_rng(0)
+            picks = rng.choice(values.size, size=_PERCENTILE_RANDOM_SAMPLES, replace=False, shuffle=False)
+            values = values[picks]
+            _log.debug('Random subsample of %d values for percentile selection', values.size)
+        return values
 
     def generate_processing_report(self, input_dsm, output_dir, scaling_info, gaussian_iterations, 
                                   sigma_value, kernel_radius, buffer_distance, fill_distance, 
@@ -1283,298 +2499,305 @@ Target smoothing window: ~{target_smoothing_distance}m
             - Provides warnings for potential quality issues
         """
         try:
-            from datetime import datetime
-            import os
             
             # Create timestamp for filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             report_filename = f"reconstruction_report_{timestamp}.txt"
-            report_path = os.path.join(output_dir, report_filename)
+            # Output paths below are built by prefix concatenation instead of
+            # os.path.join per file
+            base = output_dir if output_dir.endswith(os.sep) else output_dir + os.sep
+            report_path = base + report_filename
             
             print(f'DEBUG: Generating processing report: {report_path}')
             
-            with open(report_path, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("=" * 80 + "\n")
-                f.write("BARE EARTH RECONSTRUCTOR - PROCESSING REPORT\n")
-                f.write("=" * 80 + "\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Plugin Version: Advanced with Percentile-based Thresholds (Cao et al. 2020)\n")
-                f.write("\n")
-                
-                # Input Information
-                f.write("INPUT INFORMATION\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Input DSM: {input_dsm.name()}\n")
-                f.write(f"Source Path: {self.get_raster_path(input_dsm)}\n")
-                f.write(f"CRS: {input_dsm.crs().authid()}\n")
-                f.write(f"Dimensions: {input_dsm.width()} x {input_dsm.height()} pixels\n")
-                f.write(f"Pixel Size: {scaling_info['pixel_size']:.3f} m\n")
-                f.write(f"Scale Factor: {scaling_info['scale_factor']:.3f}x (relative to 2x2m reference)\n")
-                f.write(f"Output Directory: {output_dir}\n")
-                f.write("\n")
-                
-                # Processing Parameters
-                f.write("PROCESSING PARAMETERS\n")
-                f.write("-" * 40 + "\n")
-                
-                # Threshold Method
-                threshold_method = "Percentile-based (Cao et al. 2020)" if self.radioPercentile.isChecked() else "Fixed Thresholds"
-                f.write(f"Threshold Method: {threshold_method}\n")
-                
-                if self.radioPercentile.isChecked() and stats_results:
-                    f.write(f"Slope Percentile: {stats_results['slope_percentile']:.1f}%\n")
-                    f.write(f"Curvature Percentile: {stats_results['curvature_percentile']:.1f}%\n")
-                    f.write(f"Residual Percentile: {stats_results['residual_percentile']:.1f}%\n")
-                else:
-                    f.write(f"Fixed Slope Threshold: {self.spinSlope.value():.4f}°\n")
-                    f.write(f"Fixed Curvature Threshold: {self.spinCurvature.value():.4f}\n")
-                    f.write(f"Fixed Residual Threshold: {self.spinResidual.value():.4f} m\n")
-                
-                f.write(f"Gaussian Filter Sigma: {sigma_value:.3f}\n")
-                f.write(f"Gaussian Filter Kernel Radius: {kernel_radius} pixels\n")
-                f.write(f"Gaussian Filter Iterations: {gaussian_iterations}\n")
-                f.write(f"Buffer Distance: {buffer_distance:.1f} m\n")
-                f.write(f"Fill Distance: {fill_distance} pixels (~{fill_distance * scaling_info['pixel_size']:.1f} m)\n")
-                f.write(f"Fill Iterations: {fill_iterations}\n")
-                f.write(f"Selected Interpolation Method: {original_interpolation_method.upper()}\n")
-                if interpolation_method != original_interpolation_method:
-                    f.write(f"Actually Used Method: {interpolation_method.upper()} (fallback applied)\n")
-                else:
-                    f.write(f"Actually Used Method: {interpolation_method.upper()}\n")
-                
-                # GRASS r.fillnulls Parameters (if used)
-                if original_interpolation_method == 'grass_fillnulls':
-                    f.write("\nGRASS R.FILLNULLS PARAMETERS\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"Method: RST (Regularized Spline with Tension, method=0)\n")
-                    f.write(f"Tension: {self.spinTension.value()}\n")
-                    f.write(f"Smooth: {self.spinSmooth.value():.2f}\n")
-                    f.write(f"Edge: {self.spinEdge.value()}\n")
-                    f.write(f"Npmin: {self.spinNpmin.value()}\n")
-                    f.write(f"Segmax: {self.spinSegmax.value()}\n")
-                    f.write(f"Window Size: {self.spinGrassWindowSize.value()}\n")
-                    f.write("\n")
-                
-                f.write("\n")
-                
-                # Texture Analysis Parameters (if enabled)
-                if stats_results and stats_results.get('use_texture', False):
-                    f.write("TEXTURE ANALYSIS PARAMETERS\n")
-                    f.write("-" * 40 + "\n")
-                    try:
-                        window_size = self.spinTextureWindow.value() if hasattr(self, 'spinTextureWindow') else 3
-                    except:
-                        window_size = 3
-                    f.write(f"Window Size: {window_size}x{window_size}\n")
-                    f.write(f"Variance Threshold ({stats_results.get('variance_percentile', 90)}th percentile): {stats_results['variance_threshold']:.4f}\n")
-                    f.write(f"Entropy Threshold ({stats_results.get('entropy_percentile', 90)}th percentile): {stats_results['entropy_threshold']:.4f}\n")
-                    f.write("Classification: 0=Natural, 1=Vegetation, 2=Anthropogenic\n")
-                    f.write("Selective Buffering: Only anthropogenic features (class 2)\n")
-                    f.write("Selective Masking: Preserve vegetation, mask only anthropogenic\n")
-                    f.write("\n")
-                
-                # Applied Thresholds (Final Values)
-                f.write("APPLIED THRESHOLDS\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Slope Threshold: {slope_threshold:.4f}°\n")
-                f.write(f"Curvature Threshold: ±{curvature_threshold:.4f}\n")
-                if use_residuals:
-                    f.write(f"Residual Threshold: ±{residual_threshold:.4f} m\n")
-                else:
-                    f.write("Residual Analysis: Disabled\n")
-                f.write("\n")
-                
-                # Statistical Results
-                f.write("GEOMORPHOMETRIC STATISTICS\n")
-                f.write("-" * 40 + "\n")
-                
-                # Slope Statistics
+            # Stat the output directory once; all existence checks and file
+            # sizes below come from this snapshot
+            with os.scandir(output_dir) as entries:
+                file_info = {entry.name: entry.stat() for entry in entries if entry.is_file()}
+            
+            # Assemble the report in memory and write it with a single call
+            report_parts = []
+            write = report_parts.append
+            
+            # Header
+            write(_REPORT_RULE)
+            write("BARE EARTH RECONSTRUCTOR - PROCESSING REPORT\n")
+            write(_REPORT_RULE)
+            write(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            write(f"Plugin Version: Advanced with Percentile-based Thresholds (Cao et al. 2020)\n")
+            write("\n")
+            
+            # Input Information
+            write("INPUT INFORMATION\n")
+            write(_SECTION_RULE)
+            write(f"Input DSM: {input_dsm.name()}\n")
+            write(f"Source Path: {self.get_raster_path(input_dsm)}\n")
+            dsm_meta = self.get_dsm_meta(input_dsm)
+            write(f"CRS: {dsm_meta.crs}\n")
+            write(f"Dimensions: {dsm_meta.width} x {dsm_meta.height} pixels\n")
+            write(f"Pixel Size: {scaling_info['pixel_size']:.3f} m\n")
+            write(f"Scale Factor: {scaling_info['scale_factor']:.3f}x (relative to 2x2m reference)\n")
+            write(f"Output Directory: {output_dir}\n")
+            write("\n")
+            
+            # Processing Parameters
+            write("PROCESSING PARAMETERS\n")
+            write(_SECTION_RULE)
+            
+            # Threshold Method
+            threshold_method = "Percentile-based (Cao et al. 2020)" if self.radioPercentile.isChecked() else "Fixed Thresholds"
+            write(f"Threshold Method: {threshold_method}\n")
+            
+            if self.radioPercentile.isChecked() and stats_results:
+                write(f"Slope Percentile: {stats_results['slope_percentile']:.1f}%\n")
+                write(f"Curvature Percentile: {stats_results['curvature_percentile']:.1f}%\n")
+                write(f"Residual Percentile: {stats_results['residual_percentile']:.1f}%\n")
+            else:
+                write(f"Fixed Slope Threshold: {self.spinSlope.value():.4f}°\n")
+                write(f"Fixed Curvature Threshold: {self.spinCurvature.value():.4f}\n")
+                write(f"Fixed Residual Threshold: {self.spinResidual.value():.4f} m\n")
+            
+            write(f"Gaussian Filter Sigma: {sigma_value:.3f}\n")
+            write(f"Gaussian Filter Kernel Radius: {kernel_radius} pixels\n")
+            write(f"Gaussian Filter Iterations: {gaussian_iterations}\n")
+            write(f"Buffer Distance: {buffer_distance:.1f} m\n")
+            write(f"Fill Distance: {fill_distance} pixels (~{fill_distance * scaling_info['pixel_size']:.1f} m)\n")
+            write(f"Fill Iterations: {fill_iterations}\n")
+            write(f"Selected Interpolation Method: {original_interpolation_method.upper()}\n")
+            if interpolation_method != original_interpolation_method:
+                write(f"Actually Used Method: {interpolation_method.upper()} (fallback applied)\n")
+            else:
+                write(f"Actually Used Method: {interpolation_method.upper()}\n")
+            
+            # GRASS r.fillnulls Parameters (if used)
+            if original_interpolation_method == 'grass_fillnulls':
+                write("\nGRASS R.FILLNULLS PARAMETERS\n")
+                write(_SECTION_RULE)
+                write(f"Method: RST (Regularized Spline with Tension, method=0)\n")
+                write(f"Tension: {self.spinTension.value()}\n")
+                write(f"Smooth: {self.spinSmooth.value():.2f}\n")
+                write(f"Edge: {self.spinEdge.value()}\n")
+                write(f"Npmin: {self.spinNpmin.value()}\n")
+                write(f"Segmax: {self.spinSegmax.value()}\n")
+                write(f"Window Size: {self.spinGrassWindowSize.value()}\n")
+                write("\n")
+            
+            write("\n")
+            
+            # Texture Analysis Parameters (if enabled)
+            if stats_results and stats_results.get('use_texture', False):
+                write("TEXTURE ANALYSIS PARAMETERS\n")
+                write(_SECTION_RULE)
                 try:
-                    slope_stats = slope_layer.dataProvider().bandStatistics(1)
-                    f.write(f"Slope - Min/Max: {slope_stats.minimumValue:.4f}° / {slope_stats.maximumValue:.4f}°\n")
-                    f.write(f"Slope - Mean/StdDev: {slope_stats.mean:.4f}° / {slope_stats.stdDev:.4f}°\n")
+                    window_size = self.spinTextureWindow.value() if hasattr(self, 'spinTextureWindow') else 3
                 except:
-                    f.write("Slope Statistics: Not available\n")
-                
-                # Curvature Statistics  
+                    window_size = 3
+                write(f"Window Size: {window_size}x{window_size}\n")
+                write(f"Variance Threshold ({stats_results.get('variance_percentile', 90)}th percentile): {stats_results['variance_threshold']:.4f}\n")
+                write(f"Entropy Threshold ({stats_results.get('entropy_percentile', 90)}th percentile): {stats_results['entropy_threshold']:.4f}\n")
+                write("Classification: 0=Natural, 1=Vegetation, 2=Anthropogenic\n")
+                write("Selective Buffering: Only anthropogenic features (class 2)\n")
+                write("Selective Masking: Preserve vegetation, mask only anthropogenic\n")
+                write("\n")
+            
+            # Applied Thresholds (Final Values)
+            write("APPLIED THRESHOLDS\n")
+            write(_SECTION_RULE)
+            write(f"Slope Threshold: {slope_threshold:.4f}°\n")
+            write(f"Curvature Threshold: ±{curvature_threshold:.4f}\n")
+            if use_residuals:
+                write(f"Residual Threshold: ±{residual_threshold:.4f} m\n")
+            else:
+                write("Residual Analysis: Disabled\n")
+            write("\n")
+            
+            # Statistical Results
+            write("GEOMORPHOMETRIC STATISTICS\n")
+            write(_SECTION_RULE)
+            
+            # Slope Statistics
+            try:
+                slope_stats = self.get_band_statistics(slope_layer)
+                write(f"Slope - Min/Max: {slope_stats.minimumValue:.4f}° / {slope_stats.maximumValue:.4f}°\n")
+                write(f"Slope - Mean/StdDev: {slope_stats.mean:.4f}° / {slope_stats.stdDev:.4f}°\n")
+            except:
+                write("Slope Statistics: Not available\n")
+            
+            # Curvature Statistics  
+            try:
+                curvature_stats = self.get_band_statistics(curvature_layer)
+                write(f"Curvature - Min/Max: {curvature_stats.minimumValue:.6f} / {curvature_stats.maximumValue:.6f}\n")
+                write(f"Curvature - Mean/StdDev: {curvature_stats.mean:.6f} / {curvature_stats.stdDev:.6f}\n")
+            except:
+                write("Curvature Statistics: Not available\n")
+            
+            # Residual Statistics
+            if use_residuals and residual_layer:
                 try:
-                    curvature_stats = curvature_layer.dataProvider().bandStatistics(1)
-                    f.write(f"Curvature - Min/Max: {curvature_stats.minimumValue:.6f} / {curvature_stats.maximumValue:.6f}\n")
-                    f.write(f"Curvature - Mean/StdDev: {curvature_stats.mean:.6f} / {curvature_stats.stdDev:.6f}\n")
+                    residual_stats = self.get_gdal_band_statistics(residual_layer.source())
+                    write(f"Residuals - Min/Max: {residual_stats.minimumValue:.4f} m / {residual_stats.maximumValue:.4f} m\n")
+                    write(f"Residuals - Mean/StdDev: {residual_stats.mean:.6f} m / {residual_stats.stdDev:.4f} m\n")
                 except:
-                    f.write("Curvature Statistics: Not available\n")
-                
-                # Residual Statistics
-                if use_residuals and residual_layer:
-                    try:
-                        residual_stats = residual_layer.dataProvider().bandStatistics(1)
-                        f.write(f"Residuals - Min/Max: {residual_stats.minimumValue:.4f} m / {residual_stats.maximumValue:.4f} m\n")
-                        f.write(f"Residuals - Mean/StdDev: {residual_stats.mean:.6f} m / {residual_stats.stdDev:.4f} m\n")
-                    except:
-                        f.write("Residual Statistics: Not available\n")
-                else:
-                    f.write("Residual Statistics: Not calculated\n")
-                f.write("\n")
-                
-                # Anthropogenic Detection Results
-                f.write("ANTHROPOGENIC FEATURE DETECTION\n")
-                f.write("-" * 40 + "\n")
-                if total_pixels > 0:
-                    anthropogenic_percentage = (anthropogenic_pixels / total_pixels) * 100
-                    f.write(f"Total Pixels: {total_pixels:,}\n")
-                    f.write(f"Anthropogenic Pixels: {anthropogenic_pixels:,}\n")
-                    f.write(f"Anthropogenic Area: {anthropogenic_percentage:.2f}%\n")
-                    
-                    # Buffering results
-                    buffered_percentage = 0
-                    try:
-                        buffered_path = os.path.join(output_dir, 'buffered_anthropogenic.tif')
-                        if os.path.exists(buffered_path):
-                            buffered_layer = QgsRasterLayer(buffered_path, 'Buffered_Check')
-                            if buffered_layer.isValid():
-                                buffered_stats = buffered_layer.dataProvider().bandStatistics(1)
-                                buffered_percentage = (buffered_stats.sum / total_pixels) * 100
-                                f.write(f"Buffered Area: {buffered_percentage:.2f}%\n")
-                                
-                                if buffered_percentage > 50:
-                                    f.write("*** WARNING: High buffering percentage detected! ***\n")
-                                    f.write("Consider adjusting threshold parameters.\n")
-                    except:
-                        f.write("Buffered Area: Could not calculate\n")
-                else:
-                    f.write("Detection Results: Not available\n")
-                f.write("\n")
-                
-                # Classification Statistics (if texture analysis was used)
-                output_anthropogenic = os.path.join(output_dir, 'anthropogenic_features.tif')
-                if stats_results and stats_results.get('use_texture', False) and os.path.exists(output_anthropogenic):
-                    f.write("CLASSIFICATION STATISTICS\n")
-                    f.write("-" * 40 + "\n")
-                    try:
-                        anthro_layer = QgsRasterLayer(output_anthropogenic, 'Classification_Stats')
-                        if anthro_layer.isValid():
-                            # Use sampling for efficient class counting
-                            width = anthro_layer.width()
-                            height = anthro_layer.height()
-                            class_counts = {0: 0, 1: 0, 2: 0}  # Natural, Vegetation, Anthropogenic
-                            total_pixels = 0
-                            
-                            # Use sampling approach for classification statistics to avoid block access issues
-                            sample_size = min(10000, width * height // 100)  # Sample 1% or max 10k pixels
-                            sample_factor = max(1, int((width * height / sample_size) ** 0.5))
-                            
-                            for i in range(0, width, sample_factor):
-                                for j in range(0, height, sample_factor):
-                                    try:
-                                        # Convert pixel coordinates to map coordinates
-                                        x = anthro_layer.extent().xMinimum() + (i + 0.5) * anthro_layer.rasterUnitsPerPixelX()
-                                        y = anthro_layer.extent().yMaximum() - (j + 0.5) * anthro_layer.rasterUnitsPerPixelY()
-                                        
-                                        # Sample value using provider (safer than block access)
-                                        value, success = anthro_layer.dataProvider().sample(QgsPointXY(x, y), 1)
-                                        if success and value == value:  # Check not NaN
-                                            class_counts[int(value)] = class_counts.get(int(value), 0) + 1
-                                            total_pixels += 1
-                                    except Exception as sample_error:
-                                        continue  # Skip problematic pixels
-                            
-                            if total_pixels > 0:
-                                natural_pct = (class_counts[0] / total_pixels) * 100
-                                vegetation_pct = (class_counts[1] / total_pixels) * 100
-                                anthropogenic_pct = (class_counts[2] / total_pixels) * 100
-                                
-                                f.write(f"Total Valid Pixels: {total_pixels:,}\n")
-                                f.write(f"Natural Landscape (0): {class_counts[0]:,} pixels ({natural_pct:.2f}%)\n")
-                                f.write(f"Vegetation (1): {class_counts[1]:,} pixels ({vegetation_pct:.2f}%)\n")
-                                f.write(f"Anthropogenic (2): {class_counts[2]:,} pixels ({anthropogenic_pct:.2f}%)\n")
-                            else:
-                                f.write("Classification Statistics: No valid pixels found\n")
-                    except Exception as e:
-                        f.write(f"Classification Statistics: Error - {str(e)}\n")
-                    f.write("\n")
+                    write("Residual Statistics: Not available\n")
+            else:
+                write("Residual Statistics: Not calculated\n")
+            write("\n")
+            
+            # Anthropogenic Detection Results
+            write("ANTHROPOGENIC FEATURE DETECTION\n")
+            write(_SECTION_RULE)
+            if total_pixels > 0:
+                anthropogenic_percentage = (anthropogenic_pixels / total_pixels) * 100
+                write(f"Total Pixels: {total_pixels:,}\n")
+                write(f"Anthropogenic Pixels: {anthropogenic_pixels:,}\n")
+                write(f"Anthropogenic Area: {anthropogenic_percentage:.2f}%\n")
                 
-                # Original DSM Statistics
-                f.write("ORIGINAL DSM STATISTICS\n")
-                f.write("-" * 40 + "\n")
+                # Buffering results
+                buffered_percentage = 0
                 try:
-                    original_stats = input_dsm.dataProvider().bandStatistics(1)
-                    f.write(f"Elevation Range: {original_stats.minimumValue:.3f} - {original_stats.maximumValue:.3f} m\n")
-                    f.write(f"Mean Elevation: {original_stats.mean:.3f} m\n")
-                    f.write(f"Elevation StdDev: {original_stats.stdDev:.3f} m\n")
+                    buffered_path = base + 'buffered_anthropogenic.tif'
+                    if 'buffered_anthropogenic.tif' in file_info:
+                        buffered_stats = self.get_gdal_band_statistics(buffered_path)
+                        if buffered_stats is not None:
+                            buffered_percentage = (buffered_stats.sum / total_pixels) * 100
+                            write(f"Buffered Area: {buffered_percentage:.2f}%\n")
+                            
+                            if buffered_percentage > 50:
+                                write("*** WARNING: High buffering percentage detected! ***\n")
+                                write("Consider adjusting threshold parameters.\n")
                 except:
-                    f.write("Original DSM Statistics: Not available\n")
-                f.write("\n")
-                
-                # Reconstructed DSM Statistics
-                f.write("RECONSTRUCTED DSM STATISTICS\n")
-                f.write("-" * 40 + "\n")
+                    write("Buffered Area: Could not calculate\n")
+            else:
+                write("Detection Results: Not available\n")
+            write("\n")
+            
+            # Classification Statistics (if texture analysis was used)
+            output_anthropogenic = base + 'anthropogenic_features.tif'
+            if stats_results and stats_results.get('use_texture', False) and 'anthropogenic_features.tif' in file_info:
+                write("CLASSIFICATION STATISTICS\n")
+                write(_SECTION_RULE)
                 try:
-                    reconstructed_layer = QgsRasterLayer(output_dsm, 'Reconstructed_Stats')
-                    if reconstructed_layer.isValid():
-                        reconstructed_stats = reconstructed_layer.dataProvider().bandStatistics(1)
-                        f.write(f"Elevation Range: {reconstructed_stats.minimumValue:.3f} - {reconstructed_stats.maximumValue:.3f} m\n")
-                        f.write(f"Mean Elevation: {reconstructed_stats.mean:.3f} m\n")
-                        f.write(f"Elevation StdDev: {reconstructed_stats.stdDev:.3f} m\n")
-                        
-                        # Quality metrics
-                        original_stats = input_dsm.dataProvider().bandStatistics(1)
-                        mean_diff = abs(reconstructed_stats.mean - original_stats.mean)
-                        std_diff = abs(reconstructed_stats.stdDev - original_stats.stdDev)
+                    dataset = gdal.OpenEx(output_anthropogenic, gdal.OF_RASTER | gdal.OF_READONLY)
+                    if dataset is not None:
+                        # One read, decimated by GDAL (nearest neighbour) to at most
+                        # _PERCENTILE_SAMPLE_PIXELS, counted with bincount; rasters
+                        # below the budget are counted exactly
+                        band = dataset.GetRasterBand(1)
+                        nodata_value = band.GetNoDataValue()
+                        x_size, y_size = band.XSize, band.YSize
+                        step = max(1, int(math.ceil(math.sqrt(x_size * y_size / _PERCENTILE_SAMPLE_PIXELS))))
+                        classes = band.ReadAsArray(0, 0, x_size, y_size,
+                                                   buf_xsize=max(1, x_size // step),
+                                                   buf_ysize=max(1, y_size // step),
+                                                   resample_alg=gdal.GRIORA_NearestNeighbour)
+                        dataset = None
+                        valid = np.isfinite(classes) & (classes >= 0)
+                        if nodata_value is not None:
+                            valid &= classes != nodata_value
+                        counts = np.bincount(classes[valid].astype(np.intp), minlength=3)
+                        total_pixels = int(counts.sum())
+                        class_counts = {class_value: int(count) for class_value, count in enumerate(counts[:3])}
+                        if step > 1:
+                            write(f"(Sampled every {step}th pixel per axis)\n")
                         
-                        f.write(f"Mean Difference: {mean_diff:.3f} m\n")
-                        f.write(f"StdDev Difference: {std_diff:.3f} m\n")
-                        
-                        if mean_diff > 1.0:
-                            f.write("*** WARNING: Large mean difference detected! ***\n")
-                        if std_diff > 1.0:
-                            f.write("*** WARNING: Large standard deviation difference detected! ***\n")
+                        if total_pixels > 0:
+                            natural_pct = (class_counts[0] / total_pixels) * 100
+                            vegetation_pct = (class_counts[1] / total_pixels) * 100
+                            anthropogenic_pct = (class_counts[2] / total_pixels) * 100
+                            
+                            write(f"Total Valid Pixels: {total_pixels:,}\n")
+                            write(f"Natural Landscape (0): {class_counts[0]:,} pixels ({natural_pct:.2f}%)\n")
+                            write(f"Vegetation (1): {class_counts[1]:,} pixels ({vegetation_pct:.2f}%)\n")
+                            write(f"Anthropogenic (2): {class_counts[2]:,} pixels ({anthropogenic_pct:.2f}%)\n")
+                        else:
+                            write("Classification Statistics: No valid pixels found\n")
                     else:
-                        f.write("Reconstructed DSM Statistics: Could not load output file\n")
+                        write("Classification Statistics: Could not open classification raster\n")
                 except Exception as e:
-                    f.write(f"Reconstructed DSM Statistics: Error - {str(e)}\n")
-                f.write("\n")
-                
-                # Output Files
-                f.write("OUTPUT FILES\n")
-                f.write("-" * 40 + "\n")
-                output_files = [
-                    ("Filtered DSM", "filtered_dsm.tif"),
-                    ("Slope", "slope.tif"),
-                    ("Curvature", "curvature.tif"),
-                    ("Anthropogenic Features", "anthropogenic_features.tif"),
-                    ("Buffered Anthropogenic", "buffered_anthropogenic.tif"),
-                    ("Masked DSM", "masked_dsm.tif"),
-                    ("Reconstructed DSM", "reconstructed_dsm.tif")
-                ]
-                
-                if use_residuals:
-                    output_files.insert(3, ("Residuals", "residuals.tif"))
-                
-                # Add texture files if texture analysis was used
-                if stats_results and stats_results.get('use_texture', False):
-                    output_files.insert(-3, ("Texture Variance", "texture_variance.tif"))
-                    output_files.insert(-3, ("Texture Entropy", "texture_entropy.tif"))
-                    # Check if texture was successfully created (not just enabled)
-                    texture_variance_path = os.path.join(output_dir, 'texture_variance.tif')
-                    if os.path.exists(texture_variance_path):
-                        output_files.insert(-3, ("Anthropogenic Only", "anthropogenic_only.tif"))
-                
-                for description, filename in output_files:
-                    filepath = os.path.join(output_dir, filename)
-                    if os.path.exists(filepath):
-                        file_size = os.path.getsize(filepath) / (1024 * 1024)  # MB
-                        f.write(f"{description}: {filename} ({file_size:.1f} MB)\n")
-                    else:
-                        f.write(f"{description}: {filename} (NOT FOUND)\n")
-                
-                f.write(f"Processing Report: {report_filename}\n")
-                f.write("\n")
-                
-                # Footer
-                f.write("=" * 80 + "\n")
-                f.write("END OF REPORT\n")
-                f.write("=" * 80 + "\n")
+                    write(f"Classification Statistics: Error - {str(e)}\n")
+                write("\n")
+            
+            # Original DSM Statistics
+            write("ORIGINAL DSM STATISTICS\n")
+            write(_SECTION_RULE)
+            try:
+                original_stats = self.get_band_statistics(input_dsm)
+                write(f"Elevation Range: {original_stats.minimumValue:.3f} - {original_stats.maximumValue:.3f} m\n")
+                write(f"Mean Elevation: {original_stats.mean:.3f} m\n")
+                write(f"Elevation StdDev: {original_stats.stdDev:.3f} m\n")
+            except:
+                write("Original DSM Statistics: Not available\n")
+            write("\n")
+            
+            # Reconstructed DSM Statistics
+            write("RECONSTRUCTED DSM STATISTICS\n")
+            write(_SECTION_RULE)
+            try:
+                reconstructed_stats = self.get_gdal_band_statistics(output_dsm)
+                if reconstructed_stats is not None:
+                    write(f"Elevation Range: {reconstructed_stats.minimumValue:.3f} - {reconstructed_stats.maximumValue:.3f} m\n")
+                    write(f"Mean Elevation: {reconstructed_stats.mean:.3f} m\n")
+                    write(f"Elevation StdDev: {reconstructed_stats.stdDev:.3f} m\n")
+                    
+                    # Quality metrics (original statistics come from the cache)
+                    original_stats = self.get_band_statistics(input_dsm)
+                    mean_diff = abs(reconstructed_stats.mean - original_stats.mean)
+                    std_diff = abs(reconstructed_stats.stdDev - original_stats.stdDev)
+                    
+                    write(f"Mean Difference: {mean_diff:.3f} m\n")
+                    write(f"StdDev Difference: {std_diff:.3f} m\n")
+                    
+                    if mean_diff > 1.0:
+                        write("*** WARNING: Large mean difference detected! ***\n")
+                    if std_diff > 1.0:
+                        write("*** WARNING: Large standard deviation difference detected! ***\n")
+                else:
+                    write("Reconstructed DSM Statistics: Could not load output file\n")
+            except Exception as e:
+                write(f"Reconstructed DSM Statistics: Error - {str(e)}\n")
+            write("\n")
+            
+            # Output Files
+            write("OUTPUT FILES\n")
+            write(_SECTION_RULE)
+            output_files = [
+                ("Filtered DSM", "filtered_dsm.tif"),
+                ("Slope", "slope.tif"),
+                ("Curvature", "curvature.tif"),
+                ("Anthropogenic Features", "anthropogenic_features.tif"),
+                ("Buffered Anthropogenic", "buffered_anthropogenic.tif"),
+                ("Masked DSM", "masked_dsm.tif"),
+                ("Reconstructed DSM", "reconstructed_dsm.tif")
+            ]
+            
+            if use_residuals:
+                output_files.insert(3, ("Residuals", "residuals.tif"))
+            
+            # Add texture files if texture analysis was used
+            if stats_results and stats_results.get('use_texture', False):
+                output_files.insert(-3, ("Texture Variance", "texture_variance.tif"))
+                output_files.insert(-3, ("Texture Entropy", "texture_entropy.tif"))
+                # Check if texture was successfully created (not just enabled)
+                if 'texture_variance.tif' in file_info:
+                    output_files.insert(-3, ("Anthropogenic Only", "anthropogenic_only.tif"))
+            
+            for description, filename in output_files:
+                if filename in file_info:
+                    file_size = file_info[filename].st_size / (1024 * 1024)  # MB
+                    write(f"{description}: {filename} ({file_size:.1f} MB)\n")
+                else:
+                    write(f"{description}: {filename} (NOT FOUND)\n")
+            
+            write(f"Processing Report: {report_filename}\n")
+            write("\n")
+            
+            # Footer
+            write(_REPORT_RULE)
+            write("END OF REPORT\n")
+            write(_REPORT_RULE)
+            
+            _write_text_file(report_path, ''.join(report_parts))
             
             print(f'DEBUG: Processing report generated successfully: {report_filename}')
             return report_path
@@ -1616,14 +2839,14 @@ Target smoothing window: ~{target_smoothing_distance}m
             - User can safely delete Intermediate/ folder if only final results needed
         """
         try:
-            import os
-            import shutil
-            from datetime import datetime
             
             print('DEBUG:  Organizing output files for better structure...')
             
-            # Create intermediate files directory
-            intermediate_dir = os.path.join(output_dir, 'Intermediate')
+            # Create intermediate files directory; destination paths are built
+            # by prefix concatenation instead of os.path.join per file
+            base = output_dir if output_dir.endswith(os.sep) else output_dir + os.sep
+            intermediate_dir = base + 'Intermediate'
+            intermediate_base = intermediate_dir + os.sep
             os.makedirs(intermediate_dir, exist_ok=True)
             
             # Define final result files (keep in main directory)
@@ -1665,125 +2888,97 @@ Target smoothing window: ~{target_smoothing_distance}m
                 'proximity_*.tif'                      # Proximity calculation files
             ]
             
+            # Exact names are looked up in sets; the wildcard patterns become one
+            # compiled alternation per category (fnmatch glob semantics)
+            exact_final = {pattern for pattern in final_files if '*' not in pattern}
+            exact_intermediate = {pattern for pattern in intermediate_files if '*' not in pattern}
+            final_re = re.compile('|'.join(fnmatch.translate(pattern) for pattern in final_files
+                                           if '*' in pattern))
+            intermediate_re = re.compile('|'.join(fnmatch.translate(pattern) for pattern in intermediate_files
+                                                  if '*' in pattern))
+            
             moved_count = 0
             kept_count = 0
             
-            # Get all files in output directory
+            # Get all files in output directory (one scandir pass; the DirEntry
+            # caches the file type, so no extra stat() per file)
             all_files = []
             try:
-                all_files = [f for f in os.listdir(output_dir) if os.path.isfile(os.path.join(output_dir, f))]
+                with os.scandir(output_dir) as entries:
+                    all_files = [entry for entry in entries if entry.is_file()]
             except Exception as e:
                 print(f'DEBUG: Error listing files: {str(e)}')
                 return
             
             print(f'DEBUG: Found {len(all_files)} files to organize')
             
-            # Process each file
-            for filename in all_files:
-                file_path = os.path.join(output_dir, filename)
-                
-                # Skip if it's a directory
-                if not os.path.isfile(file_path):
-                    continue
-                
-                # Check if file should be kept in main directory
-                should_keep = False
-                
-                # Check final files (exact match and wildcards)
-                for final_pattern in final_files:
-                    if final_pattern.endswith('*.txt'):
-                        # Handle wildcard for report files
-                        if filename.startswith('reconstruction_report_') and filename.endswith('.txt'):
-                            should_keep = True
-                            break
-                    elif final_pattern.endswith('*.tif'):
-                        # Handle wildcard for texture files
-                        prefix = final_pattern[:-5]  # Remove '*.tif'
-                        if filename.startswith(prefix) and filename.endswith('.tif'):
-                            should_keep = True
-                            print(f'DEBUG: Final pattern match: {filename} matches {final_pattern}')
-                            break
-                    elif filename == final_pattern:
-                        should_keep = True
-                        break
+            # Classify each file; moves are collected and run in a thread pool below
+            moves = []
+            for entry in all_files:
+                filename = entry.name
+                file_path = entry.path
                 
-                if should_keep:
+                # Final results stay in the main directory, checked first
+                if filename in exact_final or final_re.match(filename):
                     print(f'DEBUG: Keeping in main directory: {filename}')
                     kept_count += 1
                     continue
                 
                 # Check if file should be moved to intermediate directory
-                should_move = False
-                
-                # Debug: Show which patterns we're checking
-                # print(f'DEBUG: Checking file {filename} against {len(intermediate_files)} patterns')
-                
-                for intermediate_pattern in intermediate_files:
-                    if intermediate_pattern.startswith('*') and intermediate_pattern.endswith('*'):
-                        # Handle patterns like *_temp*.tif
-                        pattern_core = intermediate_pattern[1:-1]  # Remove * from both ends
-                        if pattern_core in filename:
-                            should_move = True
-                            break
-                    elif intermediate_pattern.startswith('*'):
-                        # Handle patterns like *.tif, *.tfw, *.aux.xml
-                        suffix = intermediate_pattern[1:]
-                        if filename.endswith(suffix):
-                            should_move = True
-                            print(f'DEBUG:  Pattern match: {filename} matches {intermediate_pattern}')
-                            break
-                    elif intermediate_pattern.endswith('*'):
-                        # Handle patterns like filtered_dsm_iter_*
-                        prefix = intermediate_pattern[:-1]
-                        if filename.startswith(prefix):
-                            should_move = True
-                            break
-                    elif filename == intermediate_pattern:
-                        # Exact match
-                        should_move = True
-                        break
+                should_move = filename in exact_intermediate or intermediate_re.match(filename) is not None
                 
                 if should_move:
-                    try:
-                        destination_path = os.path.join(intermediate_dir, filename)
-                        shutil.move(file_path, destination_path)
-                        print(f'DEBUG:  Moved to Intermediate/: {filename}')
-                        moved_count += 1
-                    except Exception as e:
-                        # File is likely locked by QGIS - keep in main directory with note
-                        print(f'DEBUG:  File locked, keeping in main: {filename} ({str(e)[:50]}...)')
-                        kept_count += 1
+                    moves.append((filename, file_path, intermediate_base + filename))
                 else:
                     # Unknown file - keep in main directory but log it
                     print(f'DEBUG:  Unknown file kept in main: {filename}')
                     kept_count += 1
             
+            # shutil.move releases the GIL during the file system calls, so
+            # cross-device copies (and slow network shares) overlap in threads
+            if moves:
+                with ThreadPoolExecutor(max_workers=min(8, len(moves))) as executor:
+                    futures = {executor.submit(shutil.move, source, destination): filename
+                               for filename, source, destination in moves}
+                    for future in as_completed(futures):
+                        filename = futures[future]
+                        try:
+                            future.result()
+                            print(f'DEBUG:  Moved to Intermediate/: {filename}')
+                            moved_count += 1
+                        except Exception as e:
+                            # File is likely locked by QGIS - keep in main directory with note
+                            print(f'DEBUG:  File locked, keeping in main: {filename} ({str(e)[:50]}...)')
+                            kept_count += 1
+            
             # Create organization summary
-            summary_file = os.path.join(output_dir, '_file_organization_summary.txt')
+            summary_file = base + '_file_organization_summary.txt'
             try:
-                with open(summary_file, 'w', encoding='utf-8') as f:
-                    f.write("FILE ORGANIZATION SUMMARY\n")
-                    f.write("=" * 50 + "\n")
-                    f.write(f"Organized on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Files kept in main directory: {kept_count}\n")
-                    f.write(f"Files moved to Intermediate/: {moved_count}\n")
-                    f.write(f"Total files processed: {kept_count + moved_count}\n")
-                    f.write("\n")
-                    f.write("MAIN DIRECTORY (Final Results):\n")
-                    f.write("- reconstructed_dsm.tif (Main reconstructed surface)\n")
-                    f.write("- anthropogenic_features.tif (3-class classification)\n")
-                    f.write("- reconstruction_report_*.txt (Processing report)\n")
-                    f.write("\n")
-                    f.write("INTERMEDIATE/ DIRECTORY:\n")
-                    f.write("- All intermediate processing files\n")
-                    f.write("- Temporary files and calculations\n")
-                    f.write("- Individual processing steps\n")
-                    f.write("\n")
-                    f.write("NOTE: Some files may remain in main directory\n")
-                    f.write("if they were locked by QGIS during organization.\n")
-                    f.write("You can safely delete the Intermediate/ folder\n")
-                    f.write("if you only need the final results.\n")
-                    
+                summary_parts = [
+                    "FILE ORGANIZATION SUMMARY\n",
+                    _SUMMARY_RULE,
+                    f"Organized on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                    f"Files kept in main directory: {kept_count}\n",
+                    f"Files moved to Intermediate/: {moved_count}\n",
+                    f"Total files processed: {kept_count + moved_count}\n",
+                    "\n",
+                    "MAIN DIRECTORY (Final Results):\n",
+                    "- reconstructed_dsm.tif (Main reconstructed surface)\n",
+                    "- anthropogenic_features.tif (3-class classification)\n",
+                    "- reconstruction_report_*.txt (Processing report)\n",
+                    "\n",
+                    "INTERMEDIATE/ DIRECTORY:\n",
+                    "- All intermediate processing files\n",
+                    "- Temporary files and calculations\n",
+                    "- Individual processing steps\n",
+                    "\n",
+                    "NOTE: Some files may remain in main directory\n",
+                    "if they were locked by QGIS during organization.\n",
+                    "You can safely delete the Intermediate/ folder\n",
+                    "if you only need the final results.\n",
+                ]
+                _write_text_file(summary_file, ''.join(summary_parts))
+                
                 print(f'DEBUG:  Organization summary created: _file_organization_summary.txt')
             except Exception as e:
                 print(f'DEBUG: Error creating organization summary: {str(e)}')
@@ -1794,7 +2989,6 @@ Target smoothing window: ~{target_smoothing_distance}m
             
             # Show user notification
             try:
-                from qgis.PyQt.QtWidgets import QMessageBox
                 # Simple check if there were any locked files (based on kept vs moved ratio)
                 locked_files_note = ""
                 if kept_count > 5:  # If more than 5 files kept, likely some were locked
@@ -1815,7 +3009,6 @@ Target smoothing window: ~{target_smoothing_distance}m
         except Exception as e:
             print(f'DEBUG: Error during file organization: {str(e)}')
             try:
-                from qgis.PyQt.QtWidgets import QMessageBox
                 QMessageBox.warning(
                     self, 
                     'Organization Warning', 
@@ -1875,16 +3068,18 @@ Target smoothing window: ~{target_smoothing_distance}m
             - Supports both 3-class and binary classification modes
         """
         try:
-            print('DEBUG: ===== Geomorphometric Statistical Analysis =====')
-            print('DEBUG: Following Cao et al. (2020) methodology')
+            _log.debug('===== Geomorphometric Statistical Analysis =====')
+            _log.debug('Following Cao et al. (2020) methodology')
             
             # Get percentile values from UI (only if percentile mode is selected)
             slope_percentile = self.spinSlopePercentile.value()
             curvature_percentile = self.spinCurvaturePercentile.value()
             residual_percentile = self.spinResidualPercentile.value()
             
-            # Get Variance/Entropy values based on selected method
-            if self.radioPercentile.isChecked():
+            # Get Variance/Entropy values based on selected method; in fixed
+            # mode the texture rasters are never opened for statistics
+            percentile_mode = self.radioPercentile.isChecked()
+            if percentile_mode:
                 # Use percentile values for Variance/Entropy
                 variance_percentile = self.spinVariancePercentile.value()
                 entropy_percentile = self.spinEntropyPercentile.value()
@@ -1897,59 +3092,79 @@ Target smoothing window: ~{target_smoothing_distance}m
                 variance_threshold = self.spinVarianceThreshold.value()
                 entropy_threshold = self.spinEntropyThreshold.value()
             
-            # Calculate adaptive thresholds
-            slope_threshold = self.calculate_raster_percentiles(slope_layer, slope_percentile)
+            # Collect every percentile query and run them as one joint scan;
+            # curvature and residuals need both tails (one sample per layer)
+            scan_layers = {'slope': slope_layer, 'curvature': curvature_layer}
+            scan_percentiles = {
+                'slope': slope_percentile,
+                'curvature': [curvature_percentile, 100 - curvature_percentile]
+            }
+            if residual_layer is not None:
+                scan_layers['residual'] = residual_layer
+                scan_percentiles['residual'] = [residual_percentile, 100 - residual_percentile]
+            texture_percentiles = (percentile_mode and texture_variance is not None
+                                   and texture_entropy is not None)
+            if texture_percentiles:
+                _log.debug('Calculating texture percentiles for vegetation detection...')
+                scan_layers['variance'] = texture_variance
+                scan_layers['entropy'] = texture_entropy
+                scan_percentiles['variance'] = variance_percentile
+                scan_percentiles['entropy'] = entropy_percentile
+            scan_results = self._joint_percentile_scan(scan_layers, scan_percentiles)
+            
+            # A failed layer must not pass a None threshold on silently (the
+            # summary below is only formatted when debug logging is enabled)
+            failed_layers = [key for key, value in scan_results.items() if value is None]
+            if failed_layers:
+                raise Exception(f"Percentile calculation failed for: {', '.join(failed_layers)}")
             
-            # For curvature, we need both positive and negative thresholds
-            curvature_pos_threshold = self.calculate_raster_percentiles(curvature_layer, curvature_percentile)
-            curvature_neg_threshold = self.calculate_raster_percentiles(curvature_layer, 100 - curvature_percentile)
+            # Calculate adaptive thresholds
+            slope_threshold = scan_results['slope']
+            curvature_pos_threshold, curvature_neg_threshold = scan_results['curvature']
             
             residual_threshold = None
             if residual_layer is not None:
-                # For residuals, calculate both positive and negative thresholds
-                residual_pos_threshold = self.calculate_raster_percentiles(residual_layer, residual_percentile)
-                residual_neg_threshold = self.calculate_raster_percentiles(residual_layer, 100 - residual_percentile)
+                residual_pos_threshold, residual_neg_threshold = scan_results['residual']
                 residual_threshold = max(abs(residual_pos_threshold), abs(residual_neg_threshold))
 
             # Calculate texture thresholds based on selected method and available data
             use_texture = False
             
             if texture_variance is not None and texture_entropy is not None:
-                if self.radioPercentile.isChecked():
-                    # Calculate percentiles from texture data
-                    print('DEBUG: Calculating texture percentiles for vegetation detection...')
-                    variance_threshold = self.calculate_raster_percentiles(texture_variance, variance_percentile)
-                    entropy_threshold = self.calculate_raster_percentiles(texture_entropy, entropy_percentile)
+                if texture_percentiles:
+                    # Percentiles from texture data (computed in the joint scan)
+                    variance_threshold = scan_results['variance']
+                    entropy_threshold = scan_results['entropy']
                     use_texture = True
-                    print(f'DEBUG: Variance {variance_percentile}th percentile: {variance_threshold:.4f}')
-                    print(f'DEBUG: Entropy {entropy_percentile}th percentile: {entropy_threshold:.4f}')
+                    _log.debug('Variance %sth percentile: %.4f', variance_percentile, variance_threshold)
+                    _log.debug('Entropy %sth percentile: %.4f', entropy_percentile, entropy_threshold)
                 else:
                     # Use fixed threshold values (already set above)
                     use_texture = True
-                    print(f'DEBUG: Using fixed variance threshold: {variance_threshold:.4f}')
-                    print(f'DEBUG: Using fixed entropy threshold: {entropy_threshold:.4f}')
+                    _log.debug('Using fixed variance threshold: %.4f', variance_threshold)
+                    _log.debug('Using fixed entropy threshold: %.4f', entropy_threshold)
             else:
                 # Texture analysis failed/disabled, use UI values
-                print('DEBUG: Texture analysis failed/disabled, using UI values...')
+                _log.debug('Texture analysis failed/disabled, using UI values...')
                 try:
                     # Check if texture analysis is enabled in UI
                     if hasattr(self, 'checkTextureAnalysis') and self.checkTextureAnalysis.isChecked():
                         use_texture = True
-                        if self.radioPercentile.isChecked():
-                            print('DEBUG: Texture analysis enabled but no texture data available')
-                            print('DEBUG: Will use UI percentile values when texture data becomes available')
+                        if percentile_mode:
+                            _log.debug('Texture analysis enabled but no texture data available')
+                            _log.debug('Will use UI percentile values when texture data becomes available')
                         else:
-                            print(f'DEBUG: Using fixed variance threshold: {variance_threshold:.4f}')
-                            print(f'DEBUG: Using fixed entropy threshold: {entropy_threshold:.4f}')
+                            _log.debug('Using fixed variance threshold: %.4f', variance_threshold)
+                            _log.debug('Using fixed entropy threshold: %.4f', entropy_threshold)
                     else:
                         use_texture = False
-                        print('DEBUG: Texture analysis disabled in UI')
+                        _log.debug('Texture analysis disabled in UI')
                 except:
                     # Final fallback values
                     variance_threshold = 0.5  # Default variance threshold
                     entropy_threshold = 2.0   # Default entropy threshold
                     use_texture = False
-                    print('DEBUG: Using hardcoded fallback values - texture analysis disabled')
+                    _log.debug('Using hardcoded fallback values - texture analysis disabled')
             
             # Compile results
             results = {
@@ -1966,35 +3181,35 @@ Target smoothing window: ~{target_smoothing_distance}m
                 'variance_percentile': variance_percentile,
                 'entropy_percentile': entropy_percentile,
                 'use_texture': use_texture,
-                'threshold_method': 'percentile' if self.radioPercentile.isChecked() else 'fixed'
+                'threshold_method': 'percentile' if percentile_mode else 'fixed'
             }
             
             # Print summary
-            print('DEBUG: ===== Adaptive Threshold Results =====')
-            print(f'DEBUG: Slope {slope_percentile}th percentile: {slope_threshold:.4f}°')
-            print(f'DEBUG: Curvature {curvature_percentile}th percentile: +{curvature_pos_threshold:.4f}')
-            print(f'DEBUG: Curvature {100-curvature_percentile}th percentile: {curvature_neg_threshold:.4f}')
+            _log.debug('===== Adaptive Threshold Results =====')
+            _log.debug('Slope %sth percentile: %.4f°', slope_percentile, slope_threshold)
+            _log.debug('Curvature %sth percentile: +%.4f', curvature_percentile, curvature_pos_threshold)
+            _log.debug('Curvature %sth percentile: %.4f', 100-curvature_percentile, curvature_neg_threshold)
             if residual_threshold is not None:
-                print(f'DEBUG: Residual {residual_percentile}th percentile: ±{residual_threshold:.4f}m')
+                _log.debug('Residual %sth percentile: ±%.4fm', residual_percentile, residual_threshold)
             else:
-                print('DEBUG: Residual analysis: Not available')
+                _log.debug('Residual analysis: Not available')
             
             if use_texture:
-                if self.radioPercentile.isChecked():
-                    print(f'DEBUG: Variance threshold ({variance_percentile}th percentile): {variance_threshold:.4f}')
-                    print(f'DEBUG: Entropy threshold ({entropy_percentile}th percentile): {entropy_threshold:.4f}')
+                if percentile_mode:
+                    _log.debug('Variance threshold (%sth percentile): %.4f', variance_percentile, variance_threshold)
+                    _log.debug('Entropy threshold (%sth percentile): %.4f', entropy_percentile, entropy_threshold)
                 else:
-                    print(f'DEBUG: Variance threshold (fixed): {variance_threshold:.4f}')
-                    print(f'DEBUG: Entropy threshold (fixed): {entropy_threshold:.4f}')
-                print('DEBUG: Texture analysis: ENABLED (3-class classification)')
+                    _log.debug('Variance threshold (fixed): %.4f', variance_threshold)
+                    _log.debug('Entropy threshold (fixed): %.4f', entropy_threshold)
+                _log.debug('Texture analysis: ENABLED (3-class classification)')
             else:
-                print('DEBUG: Texture analysis: DISABLED (binary classification)')
-            print('DEBUG: ==========================================')
+                _log.debug('Texture analysis: DISABLED (binary classification)')
+            _log.debug('==========================================')
             
             return results
             
         except Exception as e:
-            print(f'DEBUG: Statistical analysis failed: {str(e)}')
+            _log.warning('Statistical analysis failed: %s', e)
             return None
 
     def perform_texture_analysis(self, input_raster_path, output_dir, feedback):
@@ -2012,8 +3227,11 @@ Target smoothing window: ~{target_smoothing_distance}m
         
         Processing Workflow:
         1. Check if texture analysis is enabled in UI
-        2. Convert input to integer format for GRASS compatibility
-        3. Calculate variance using GRASS r.texture
+           (if the GPU or Numba path is available, compute GLCM in-process and return)
+        2. Expose float input as an Int16-scaled VRT for GRASS compatibility
+           (integer input is used directly)
+        3. Calculate variance in-process with summed-area tables
+           (GRASS r.texture if that fails)
         4. Calculate entropy using GRASS r.texture
         5. Validate output files and load as QgsRasterLayers
         6. Provide comprehensive diagnostics and fallback options
@@ -2038,7 +3256,7 @@ Target smoothing window: ~{target_smoothing_distance}m
             Exception: If texture analysis fails completely (with fallback attempts)
             
         Note:
-            - Uses GRASS r.texture algorithm for GLCM calculation
+            - Uses the in-process GLCM (GPU, then Numba) when available, else GRASS r.texture
             - Supports configurable window size (default 3x3 to 9x9)
             - Provides multiple fallback methods if GRASS fails
             - Includes comprehensive file validation and diagnostics
@@ -2050,57 +3268,81 @@ Target smoothing window: ~{target_smoothing_distance}m
                 texture_enabled = True
             else:
                 texture_enabled = True  # Default to enabled for now
-                print('DEBUG: Texture analysis checkbox not found, defaulting to enabled')
+                _log.debug('Texture analysis checkbox not found, defaulting to enabled')
         except:
             texture_enabled = True  # Fallback
-            print('DEBUG: Error checking texture analysis checkbox, defaulting to enabled')
+            _log.debug('Error checking texture analysis checkbox, defaulting to enabled')
             
         if not texture_enabled:
-            print('DEBUG: Texture analysis disabled – using original workflow')
+            _log.debug('Texture analysis disabled – using original workflow')
             return None, None
         
         try:
             window_size = self.spinTextureWindow.value() if hasattr(self, 'spinTextureWindow') else 3
         except:
             window_size = 3
-        print(f'DEBUG: Texture analysis enabled with window size {window_size}x{window_size}')
+        _log.debug('Texture analysis enabled with window size %sx%s', window_size, window_size)
+        
+        # Results cached for an earlier texture run are stale from here on
+        self.forget_raster_results(*(os.path.join(output_dir, name) for name in (
+            'texture_variance.tif', 'texture_entropy.tif',
+            'texture_variance_gdal.tif', 'texture_entropy_gdal.tif')))
+        
+        # Preferred: in-process GLCM (no GRASS session, no Int16 copy) -
+        # GPU first if enabled, then the Numba CPU kernel
+        in_process_devices = []
+        if self.use_gpu_texture():
+            in_process_devices.append(True)
+        if _HAS_NUMBA:
+            in_process_devices.append(False)
+        for use_gpu in in_process_devices:
+            device_name = 'GPU' if use_gpu else 'Numba CPU'
+            try:
+                _log.debug('Calculating GLCM texture in-process (%s)...', device_name)
+                variance_layer, entropy_layer = self.calculate_texture_glcm(
+                    input_raster_path, output_dir, window_size, use_gpu=use_gpu)
+                if variance_layer is not None and entropy_layer is not None:
+                    return variance_layer, entropy_layer
+            except Exception as glcm_error:
+                _log.warning('%s GLCM texture failed: %s', device_name, glcm_error)
+        if in_process_devices:
+            _log.debug('In-process GLCM texture unavailable - falling back to GRASS')
         
         variance_path = os.path.join(output_dir, 'texture_variance.tif')
         entropy_path = os.path.join(output_dir, 'texture_entropy.tif')
         
         try:
             # Method 1: Try GRASS r.texture with corrected parameters - focus only on variance first
-            print('DEBUG: Attempting GRASS r.texture for variance...')
+            _log.debug('Attempting GRASS r.texture for variance...')
             
             # Get input raster properties for GRASS parameters
             input_layer = QgsRasterLayer(input_raster_path, 'Input_For_Texture')
             if input_layer.isValid():
                 extent = input_layer.extent()
                 pixel_size = input_layer.rasterUnitsPerPixelX()
-                print(f'DEBUG: Input raster extent: {extent.toString()}')
-                print(f'DEBUG: Input raster pixel size: {pixel_size}')
+                input_data_type = input_layer.dataProvider().dataType(1)
+                _log.debug('Input raster extent: %s', extent.toString())
+                _log.debug('Input raster pixel size: %s', pixel_size)
             else:
                 extent = None
                 pixel_size = None
-                print('DEBUG: Could not get input raster properties')
+                input_data_type = None
+                _log.debug('Could not get input raster properties')
             
             try:
-                # GRASS r.texture often requires integer input - convert first
-                print(f"DEBUG: Preparing input for GRASS r.texture...")
-                temp_grass_input = os.path.join(output_dir, 'temp_grass_input.tif')
-                
-                # Convert to integer format that GRASS prefers
-                processing.run('gdal:translate', {
-                    'INPUT': input_raster_path,
-                    'TARGET_CRS': None,
-                    'NODATA': None,
-                    'COPY_SUBDATASETS': False,
-                    'OPTIONS': 'COMPRESS=LZW',
-                    'EXTRA': '-ot Int16 -scale',  # Convert to 16-bit integer with scaling
-                    'DATA_TYPE': 2,  # Int16
-                    'OUTPUT': temp_grass_input
-                })
-                print(f"DEBUG: Converted input to integer format: {temp_grass_input}")
+                # GRASS r.texture often requires integer input. Integer rasters are
+                # passed as they are; float ones get a VRT that applies the Int16
+                # scaling on the fly, so the DSM is not rewritten to disk
+                _log.debug('Preparing input for GRASS r.texture...')
+                if input_data_type in (Qgis.Byte, Qgis.UInt16, Qgis.Int16):
+                    grass_input = input_raster_path
+                    _log.debug('Input is already integer - no conversion for GRASS')
+                else:
+                    temp_grass_input = os.path.join(output_dir, 'temp_grass_input.vrt')
+                    gdal.Translate(temp_grass_input, input_raster_path, format='VRT',
+                                   outputType=gdal.GDT_Int16, scaleParams=[[]])
+                    grass_input = temp_grass_input
+                    _log.debug('Integer-scaled VRT for GRASS: %s', temp_grass_input)
                 
                 # Enhanced GRASS parameters - simplified to avoid region issues
                 grass_params_base = {
@@ -2110,25 +3352,32 @@ Target smoothing window: ~{target_smoothing_distance}m
                     'GRASS_RASTER_FORMAT_META': ''
                 }
                 
-                # Step 1: Calculate variance with optimized parameters
-                print('DEBUG: Calculating variance with optimized GRASS parameters...')
-                variance_params = {
-                    'input': temp_grass_input,  # Use converted integer input
-                    'output': variance_path,
-                    'size': window_size,
-                    'distance': 1,
-                    'method': [0],  # 0: Variance only
-                    **grass_params_base
-                }
-                
-                variance_result = processing.run('grass7:r.texture', variance_params, feedback=feedback)
+                # Step 1: Variance in-process with summed-area tables (O(1) per
+                # pixel); GRASS r.texture only if that fails
+                try:
+                    _log.debug('Calculating variance with summed-area tables...')
+                    self.calculate_texture_variance_sat(input_raster_path, variance_path, window_size)
+                    variance_result = {'output': variance_path}
+                except Exception as sat_error:
+                    _log.warning('SAT variance failed (%s), using GRASS r.texture', sat_error)
+                    _log.debug('Calculating variance with optimized GRASS parameters...')
+                    variance_params = {
+                        'input': grass_input,  # Integer input (original or scaled VRT)
+                        'output': variance_path,
+                        'size': window_size,
+                        'distance': 1,
+                        'method': [0],  # 0: Variance only
+                        **grass_params_base
+                    }
+                    
+                    variance_result = processing.run('grass7:r.texture', variance_params, feedback=feedback)
                 
-                print(f'DEBUG: GRASS variance result: {variance_result}')
+                _log.debug('GRASS variance result: %s', variance_result)
                 
                 # Step 2: Calculate entropy with same optimized parameters
-                print('DEBUG: Calculating entropy with optimized GRASS parameters...')
+                _log.debug('Calculating entropy with optimized GRASS parameters...')
                 entropy_params = {
-                    'input': temp_grass_input,  # Use converted integer input
+                    'input': grass_input,  # Integer input (original or scaled VRT)
                     'output': entropy_path,
                     'size': window_size,
                     'distance': 1,
@@ -2138,181 +3387,439 @@ Target smoothing window: ~{target_smoothing_distance}m
                 
                 entropy_result = processing.run('grass7:r.texture', entropy_params, feedback=feedback)
                 
-                print(f'DEBUG: GRASS entropy result: {entropy_result}')
+                _log.debug('GRASS entropy result: %s', entropy_result)
                 
-                # Check if files were created
-                if not os.path.exists(variance_path):
-                    print(f'DEBUG: Variance file not found: {variance_path}')
+                # Check if files were created; one scandir pass lists the
+                # candidates for both outputs if either is missing
+                variance_found = os.path.exists(variance_path)
+                entropy_found = os.path.exists(entropy_path)
+                if not (variance_found and entropy_found):
+                    with os.scandir(output_dir) as entries:
+                        output_files = [entry for entry in entries if entry.is_file()]
+                    
+                if not variance_found:
+                    _log.debug('Variance file not found: %s', variance_path)
                     # Check if GRASS created it with a different name
-                    import glob
-                    variance_candidates = glob.glob(os.path.join(output_dir, '*variance*'))
-                    print(f'DEBUG: Found variance candidates: {variance_candidates}')
+                    variance_candidates = [entry.path for entry in output_files if 'variance' in entry.name]
+                    _log.debug('Found variance candidates: %s', variance_candidates)
                     
-                if not os.path.exists(entropy_path):
-                    print(f'DEBUG: Entropy file not found: {entropy_path}')
+                if not entropy_found:
+                    _log.debug('Entropy file not found: %s', entropy_path)
                     # Check if GRASS created it with a different name
-                    import glob
-                    entropy_candidates = glob.glob(os.path.join(output_dir, '*entropy*'))
-                    print(f'DEBUG: Found entropy candidates: {entropy_candidates}')
+                    entropy_candidates = [entry.path for entry in output_files if 'entropy' in entry.name]
+                    _log.debug('Found entropy candidates: %s', entropy_candidates)
                 
                 # Try to find the actual output files from processing results
                 if 'output' in variance_result:
                     actual_variance_path = variance_result['output']
-                    print(f'DEBUG: Actual variance path from result: {actual_variance_path}')
+                    _log.debug('Actual variance path from result: %s', actual_variance_path)
                     if os.path.exists(actual_variance_path):
                         variance_path = actual_variance_path
                 
                 if 'output' in entropy_result:
                     actual_entropy_path = entropy_result['output']
-                    print(f'DEBUG: Actual entropy path from result: {actual_entropy_path}')
+                    _log.debug('Actual entropy path from result: %s', actual_entropy_path)
                     if os.path.exists(actual_entropy_path):
                         entropy_path = actual_entropy_path
                 
                 # Final check
                 if not os.path.exists(variance_path) or not os.path.exists(entropy_path):
-                    print(f'DEBUG: Still missing files - Variance: {os.path.exists(variance_path)}, Entropy: {os.path.exists(entropy_path)}')
+                    _log.debug('Still missing files - Variance: %s, Entropy: %s', os.path.exists(variance_path), os.path.exists(entropy_path))
                     raise Exception("GRASS r.texture output files not found")
                     
-                print('DEBUG: GRASS r.texture completed successfully')
-                print(f'DEBUG: Variance file: {variance_path}')
-                print(f'DEBUG: Entropy file: {entropy_path}')
+                _log.debug('GRASS r.texture completed successfully')
+                _log.debug('Variance file: %s', variance_path)
+                _log.debug('Entropy file: %s', entropy_path)
                 
             except Exception as grass_error:
-                print(f'DEBUG: GRASS r.texture failed: {str(grass_error)}')
+                _log.warning('GRASS r.texture failed: %s', grass_error)
                 raise Exception("GRASS r.texture failed")
             
             # Enhanced diagnostics and validation
-            print('DEBUG: ===== TEXTURE ANALYSIS DIAGNOSTICS =====')
-            
-            # Check file sizes
-            variance_size = os.path.getsize(variance_path) if os.path.exists(variance_path) else 0
-            entropy_size = os.path.getsize(entropy_path) if os.path.exists(entropy_path) else 0
-            print(f'DEBUG: Variance file size: {variance_size} bytes')
-            print(f'DEBUG: Entropy file size: {entropy_size} bytes')
-            
-            # Check if files are too small (likely empty/corrupt)
-            if variance_size < 10000 or entropy_size < 10000:  # Less than 10KB is suspicious
-                print('DEBUG: Files too small, likely corrupt. Trying GDAL repair...')
-                try:
-                    # Try to repair/convert using GDAL
-                    repaired_variance = os.path.join(output_dir, 'texture_variance_repaired.tif')
-                    repaired_entropy = os.path.join(output_dir, 'texture_entropy_repaired.tif')
-                    
-                    processing.run('gdal:translate', {
-                        'INPUT': variance_path,
-                        'OUTPUT': repaired_variance
-                    })
-                    processing.run('gdal:translate', {
-                        'INPUT': entropy_path,
-                        'OUTPUT': repaired_entropy
-                    })
-                    
-                    if os.path.exists(repaired_variance) and os.path.exists(repaired_entropy):
-                        variance_path = repaired_variance
-                        entropy_path = repaired_entropy
-                        print('DEBUG: Files repaired using GDAL translate')
-                    else:
-                        raise Exception("GDAL repair failed")
-                        
-                except Exception as repair_error:
-                    print(f'DEBUG: GDAL repair failed: {str(repair_error)}')
-                    
-            # Try multiple loading methods
-            variance_layer = None
-            entropy_layer = None
-            
-            # Method 1: Direct QgsRasterLayer loading
-            print('DEBUG: Trying direct QgsRasterLayer loading...')
-            variance_layer = QgsRasterLayer(variance_path, 'Texture Variance')
-            entropy_layer = QgsRasterLayer(entropy_path, 'Texture Entropy')
-            
-            variance_valid = variance_layer.isValid()
-            entropy_valid = entropy_layer.isValid()
-            print(f'DEBUG: Variance layer valid: {variance_valid}')
-            print(f'DEBUG: Entropy layer valid: {entropy_valid}')
-            
-            if not variance_valid:
-                print(f'DEBUG: Variance layer error: {variance_layer.error().message()}')
-            if not entropy_valid:
-                print(f'DEBUG: Entropy layer error: {entropy_layer.error().message()}')
-            
-            # Method 2: Try with explicit provider if direct loading failed
-            if not variance_valid or not entropy_valid:
-                print('DEBUG: Trying explicit GDAL provider...')
-                variance_layer = QgsRasterLayer(f'GDAL:{variance_path}', 'Texture Variance', 'gdal')
-                entropy_layer = QgsRasterLayer(f'GDAL:{entropy_path}', 'Texture Entropy', 'gdal')
-                
-                variance_valid = variance_layer.isValid()
-                entropy_valid = entropy_layer.isValid()
-                print(f'DEBUG: GDAL provider - Variance valid: {variance_valid}')
-                print(f'DEBUG: GDAL provider - Entropy valid: {entropy_valid}')
-            
-            # Method 3: Force refresh and retry if still failed
-            if not variance_valid or not entropy_valid:
-                print('DEBUG: Trying layer refresh and reload...')
+            _log.debug('===== TEXTURE ANALYSIS DIAGNOSTICS =====')
+            
+            # Validate the outputs by computing their statistics; an unreadable
+            # or all-NoData raster fails here instead of being copied again
+            # (the statistics are stored in the .aux.xml for later reads)
+            for output_path in (variance_path, entropy_path):
+                output_ds = gdal.Open(output_path, gdal.GA_ReadOnly)
+                if output_ds is None:
+                    raise Exception(f"Texture output cannot be opened: {output_path}")
                 try:
-                    # Force a small delay and retry
-                    import time
-                    time.sleep(0.5)
-                    
-                    variance_layer = QgsRasterLayer(variance_path, 'Texture Variance')
-                    entropy_layer = QgsRasterLayer(entropy_path, 'Texture Entropy')
-                    
-                    # Force reload
-                    variance_layer.reload()
-                    entropy_layer.reload()
-                    
-                    variance_valid = variance_layer.isValid()
-                    entropy_valid = entropy_layer.isValid()
-                    print(f'DEBUG: After refresh - Variance valid: {variance_valid}')
-                    print(f'DEBUG: After refresh - Entropy valid: {entropy_valid}')
-                    
-                except Exception as refresh_error:
-                    print(f'DEBUG: Refresh method failed: {str(refresh_error)}')
+                    output_stats = output_ds.GetRasterBand(1).ComputeStatistics(False)
+                except RuntimeError as stats_error:
+                    raise Exception(f"Texture output has no valid statistics: {output_path} ({stats_error})")
+                output_ds = None
+                if not output_stats or not all(math.isfinite(value) for value in output_stats):
+                    raise Exception(f"Texture output has no valid statistics: {output_path}")
+                _log.debug('%s - Min: %.4f, Max: %.4f, Mean: %.4f', output_path, *output_stats[:3])
+            
+            # Load both outputs once with the GDAL provider
+            variance_layer = _open_valid_raster(variance_path, 'Texture Variance')
+            entropy_layer = _open_valid_raster(entropy_path, 'Texture Entropy')
+            variance_valid = variance_layer is not None
+            entropy_valid = entropy_layer is not None
+            _log.debug('Variance layer valid: %s', variance_valid)
+            _log.debug('Entropy layer valid: %s', entropy_valid)
             
             # Final validation
             if not variance_valid or not entropy_valid:
-                print('DEBUG: All loading methods failed - texture analysis unsuccessful')
-                print('DEBUG: ==========================================')
+                _log.warning('All loading methods failed - texture analysis unsuccessful')
+                _log.debug('==========================================')
                 # Clean up temporary grass input file
-                if 'temp_grass_input' in locals() and os.path.exists(temp_grass_input):
-                    try:
-                        os.remove(temp_grass_input)
-                    except:
-                        pass
+                if 'temp_grass_input' in locals():
+                    with suppress(OSError):
+                        os.unlink(temp_grass_input)
                 return None, None
                 
-            print('DEBUG: ===== TEXTURE ANALYSIS SUCCESSFUL =====')
-            print(f'DEBUG: Variance layer: {variance_path} (Valid: {variance_valid})')
-            print(f'DEBUG: Entropy layer: {entropy_path} (Valid: {entropy_valid})')
-            print('DEBUG: ==========================================')
+            _log.debug('===== TEXTURE ANALYSIS SUCCESSFUL =====')
+            _log.debug('Variance layer: %s (Valid: %s)', variance_path, variance_valid)
+            _log.debug('Entropy layer: %s (Valid: %s)', entropy_path, entropy_valid)
+            _log.debug('==========================================')
             
             # Clean up temporary grass input file
-            if 'temp_grass_input' in locals() and os.path.exists(temp_grass_input):
-                try:
-                    os.remove(temp_grass_input)
-                    print(f'DEBUG: Cleaned up temporary GRASS input: {temp_grass_input}')
-                except:
-                    pass
+            if 'temp_grass_input' in locals():
+                with suppress(OSError):
+                    os.unlink(temp_grass_input)
+                    _log.debug('Cleaned up temporary GRASS input: %s', temp_grass_input)
+            
+            return variance_layer, entropy_layer
+            
+        except Exception as e:
+            _log.warning('GRASS r.texture completely failed: %s', e)
+            _log.debug('Trying alternative GDAL-based texture calculation...')
+            
+            # Alternative texture calculation using focal statistics
+            try:
+                return self.calculate_texture_alternative(input_raster_path, output_dir, window_size, feedback)
+            except Exception as alt_error:
+                _log.warning('Alternative texture calculation also failed: %s', alt_error)
+                # Clean up temporary grass input file
+                if 'temp_grass_input' in locals():
+                    with suppress(OSError):
+                        os.unlink(temp_grass_input)
+                return None, None
+
+    def get_worker_count(self):
+        """
+        Number of worker threads for tiled in-process raster work.
+        
+        Returns:
+            int: Value of the "Worker Threads" spin box (defaults to the CPU count)
+        """
+        if hasattr(self, 'spinWorkers'):
+            return max(1, self.spinWorkers.value())
+        return os.cpu_count() or 1
+
+    def on_debug_log_toggled(self, checked):
+        """
+        Switch the module logger between DEBUG and WARNING level.
+        
+        Args:
+            checked (bool): State of the "Verbose debug log" check box
+        """
+        _log.setLevel(logging.DEBUG if checked else logging.WARNING)
+
+    def use_gpu_texture(self):
+        """
+        Whether texture analysis should run on the GPU.
+        
+        Returns:
+            bool: True if cupy/glcm-cupy found a CUDA device and the
+                "Use GPU" option is checked
+        """
+        return _HAS_GPU and hasattr(self, 'checkUseGPU') and self.checkUseGPU.isChecked()
+
+    def calculate_texture_glcm(self, input_raster_path, output_dir, window_size, use_gpu=False):
+        """
+        In-process GLCM texture analysis using the Numba sliding-window kernel.
+        
+        Reads the filtered DSM with GDAL tile by tile (with a halo of half the
+        window), quantizes it to _GLCM_LEVELS grey levels and computes GLCM
+        variance and entropy with _glcm_texture_kernel. Tiles are processed
+        by a thread pool sized by get_worker_count(). Avoids the GRASS
+        session setup, the Int16 conversion and the two separate r.texture
+        runs.
+        
+        Args:
+            input_raster_path (str): Path to the filtered DSM raster file
+            output_dir (str): Directory where texture results will be saved
+            window_size (int): Moving window size in pixels
+            use_gpu (bool): Run on the GPU via glcm-cupy instead of the Numba kernel
+            
+        Returns:
+            tuple: (variance_layer, entropy_layer) or (None, None) if calculation fails
+            
+        Side Effects:
+            - Creates texture_variance.tif and texture_entropy.tif in output directory
             
+        Note:
+            - use_gpu requires cupy/glcm-cupy (see use_gpu_texture), the CPU
+              path requires Numba; callers fall back to GRASS r.texture
+            - On the GPU a border of window_size // 2 + 1 pixels along the
+              raster edge is left as NoData
+            - Variance is rescaled to a 0-255 grey range so fixed thresholds
+              stay comparable with r.texture results
+        """
+        variance_path = os.path.join(output_dir, 'texture_variance.tif')
+        entropy_path = os.path.join(output_dir, 'texture_entropy.tif')
+        
+        dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+        if dataset is None:
+            raise Exception(f"Could not open raster for texture analysis: {input_raster_path}")
+        band = dataset.GetRasterBand(1)
+        nodata_value = band.GetNoDataValue()
+        x_size, y_size = band.XSize, band.YSize
+        block_x, block_y = band.GetBlockSize()
+        
+        # Quantization range must be global so tiles share the same grey levels.
+        # Use the 1st/99th percentile of a decimated read so single outliers
+        # (spikes, pits) do not squeeze the terrain into a few grey levels.
+        decimation = max(1, int(np.ceil(np.sqrt(x_size * y_size / 1000000.0))))
+        overview = band.ReadAsArray(buf_xsize=max(1, x_size // decimation),
+                                    buf_ysize=max(1, y_size // decimation)).astype(np.float32, copy=False)
+        if nodata_value is not None:
+            overview[overview == nodata_value] = np.nan
+        min_val, max_val = (float(v) for v in np.nanpercentile(overview, [1, 99]))
+        overview = None
+        if not max_val > min_val:
+            max_val = min_val + 1.0  # flat raster - avoid division by zero
+        level_scale = (_GLCM_LEVELS - 1) / (max_val - min_val)
+        _log.debug('Quantizing %.2f..%.2f m to %d grey levels', min_val, max_val, _GLCM_LEVELS)
+        
+        # Lookup table c*log(c) for every possible cell count in one window
+        max_count = 8 * window_size * window_size
+        counts = np.arange(max_count + 2, dtype=np.float64)
+        xlogx = np.zeros_like(counts)
+        xlogx[1:] = counts[1:] * np.log(counts[1:])
+        grey_scale = (255.0 / (_GLCM_LEVELS - 1)) ** 2  # variance in 0-255 grey units like r.texture
+        
+        driver = gdal.GetDriverByName('GTiff')
+        out_datasets = []
+        for path in (variance_path, entropy_path):
+            out_ds = driver.Create(path, x_size, y_size, 1, gdal.GDT_Float32,
+                                   options=_GTIFF_CREATION_OPTIONS.split('|'))
+            out_ds.SetGeoTransform(dataset.GetGeoTransform())
+            out_ds.SetProjection(dataset.GetProjection())
+            out_ds.GetRasterBand(1).SetNoDataValue(_TEXTURE_NODATA)
+            out_datasets.append(out_ds)
+        dataset = None
+        
+        # GPU tiles need one more pixel of halo and run one at a time on the device
+        texture_kernel = _glcm_texture_gpu if use_gpu else _glcm_texture_kernel
+        overlap = window_size // 2 + 1 if use_gpu else window_size // 2
+        
+        # GDAL datasets are not thread-safe: one read handle per worker thread,
+        # writes to the shared outputs are serialized
+        thread_state = threading.local()
+        write_lock = threading.Lock()
+        # Per-tile partial statistics, stored in the outputs once all tiles ran
+        variance_stats = []
+        entropy_stats = []
+        
+        def process_tile(tile):
+            read_window, (core_col, core_row), core_window = tile
+            if not hasattr(thread_state, 'band'):
+                thread_state.dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+                thread_state.band = thread_state.dataset.GetRasterBand(1)
+            elevation = thread_state.band.ReadAsArray(*read_window).astype(np.float32, copy=False)
+            valid = np.isfinite(elevation)
+            if nodata_value is not None:
+                valid &= elevation != nodata_value
+            with np.errstate(invalid='ignore'):  # NaN NoData cells are zeroed below
+                img_q = np.clip((elevation - min_val) * level_scale, 0, _GLCM_LEVELS - 1).astype(np.uint8)
+            img_q[~valid] = 0
+            
+            out_var = np.empty(elevation.shape, dtype=np.float32)
+            out_ent = np.empty(elevation.shape, dtype=np.float32)
+            if use_gpu:
+                texture_kernel(img_q, valid, window_size, out_var, out_ent)
+            else:
+                texture_kernel(img_q, valid, window_size, xlogx, out_var, out_ent)
+            out_var[out_var != _TEXTURE_NODATA] *= grey_scale
+            
+            x_off, y_off, cols, rows = core_window
+            core = (slice(core_row, core_row + rows), slice(core_col, core_col + cols))
+            core_stats = (_tile_statistics(out_var[core], _TEXTURE_NODATA),
+                          _tile_statistics(out_ent[core], _TEXTURE_NODATA))
+            with write_lock:
+                out_datasets[0].GetRasterBand(1).WriteArray(out_var[core], x_off, y_off)
+                out_datasets[1].GetRasterBand(1).WriteArray(out_ent[core], x_off, y_off)
+                variance_stats.append(core_stats[0])
+                entropy_stats.append(core_stats[1])
+        
+        tiles = list(_iter_tile_windows(x_size, y_size, block_x, block_y, overlap=overlap))
+        workers = 1 if use_gpu else self.get_worker_count()
+        _log.debug('GLCM texture over %d tiles with %d worker thread(s)%s',
+                   len(tiles), workers, ' on GPU' if use_gpu else '')
+        _run_tiles(process_tile, tiles, workers)
+        _store_band_statistics(out_datasets[0].GetRasterBand(1), variance_stats)
+        _store_band_statistics(out_datasets[1].GetRasterBand(1), entropy_stats)
+        out_datasets = None
+        
+        variance_layer = _open_valid_raster(variance_path, 'Texture Variance')
+        entropy_layer = _open_valid_raster(entropy_path, 'Texture Entropy')
+        if variance_layer is not None and entropy_layer is not None:
+            _log.debug('In-process GLCM texture written: %s, %s', variance_path, entropy_path)
             return variance_layer, entropy_layer
+        _log.debug('In-process GLCM texture layers are invalid')
+        return None, None
+
+    def calculate_texture_variance_sat(self, input_raster_path, variance_path, window_size):
+        """
+        In-process moving-window variance with summed-area tables.
+        
+        Replaces the GRASS r.texture variance run when the Numba GLCM kernel
+        is unavailable. The DSM is rescaled from its min/max to 0-255 grey
+        levels (as the Int16 '-scale' input for r.texture is) and the window
+        variance is computed tile by tile with _window_variance_sat, in a
+        thread pool sized by get_worker_count().
+        
+        Args:
+            input_raster_path (str): Path to the filtered DSM raster file
+            variance_path (str): Output GeoTIFF path
+            window_size (int): Moving window size in pixels
             
-        except Exception as e:
-            print(f'DEBUG: GRASS r.texture completely failed: {str(e)}')
-            print('DEBUG: Trying alternative GDAL-based texture calculation...')
+        Returns:
+            str: variance_path
             
-            # Alternative texture calculation using focal statistics
-            try:
-                return self.calculate_texture_alternative(input_raster_path, output_dir, window_size, feedback)
-            except Exception as alt_error:
-                print(f'DEBUG: Alternative texture calculation also failed: {str(alt_error)}')
-                # Clean up temporary grass input file
-                if 'temp_grass_input' in locals() and os.path.exists(temp_grass_input):
-                    try:
-                        os.remove(temp_grass_input)
-                    except:
-                        pass
-                return None, None
+        Note:
+            - Plain window variance of the grey levels; r.texture weights each
+              pixel by its co-occurrence pairs, which differs only at window
+              borders
+        """
+        dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+        if dataset is None:
+            raise Exception(f"Could not open raster for texture analysis: {input_raster_path}")
+        band = dataset.GetRasterBand(1)
+        nodata_value = band.GetNoDataValue()
+        x_size, y_size = band.XSize, band.YSize
+        block_x, block_y = band.GetBlockSize()
+        min_val, max_val = band.ComputeRasterMinMax(False)
+        level_scale = 255.0 / (max_val - min_val) if max_val > min_val else 0.0
+        
+        out_ds = gdal.GetDriverByName('GTiff').Create(variance_path, x_size, y_size, 1, gdal.GDT_Float32,
+                                                      options=_GTIFF_CREATION_OPTIONS.split('|'))
+        out_ds.SetGeoTransform(dataset.GetGeoTransform())
+        out_ds.SetProjection(dataset.GetProjection())
+        out_band = out_ds.GetRasterBand(1)
+        out_band.SetNoDataValue(_TEXTURE_NODATA)
+        dataset = None
+        
+        thread_state = threading.local()
+        write_lock = threading.Lock()
+        tile_stats = []
+        
+        def process_tile(tile):
+            read_window, (core_col, core_row), core_window = tile
+            if not hasattr(thread_state, 'band'):
+                thread_state.dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+                thread_state.band = thread_state.dataset.GetRasterBand(1)
+            elevation = thread_state.band.ReadAsArray(*read_window).astype(np.float32, copy=False)
+            valid = np.isfinite(elevation)
+            if nodata_value is not None:
+                valid &= elevation != nodata_value
+            with np.errstate(invalid='ignore'):  # NaN NoData cells are masked by valid
+                grey = np.rint((elevation - min_val) * level_scale)
+            out_var = np.empty(elevation.shape, dtype=np.float32)
+            _window_variance_sat(grey, valid, window_size, out_var)
+            
+            x_off, y_off, cols, rows = core_window
+            core = out_var[core_row:core_row + rows, core_col:core_col + cols]
+            core_stats = _tile_statistics(core, _TEXTURE_NODATA)
+            with write_lock:
+                out_band.WriteArray(core, x_off, y_off)
+                tile_stats.append(core_stats)
+        
+        tiles = list(_iter_tile_windows(x_size, y_size, block_x, block_y, overlap=window_size // 2))
+        _run_tiles(process_tile, tiles, self.get_worker_count())
+        _store_band_statistics(out_band, tile_stats)
+        out_band = None
+        out_ds = None
+        _log.debug('SAT variance written over %d tiles: %s', len(tiles), variance_path)
+        return variance_path
+
+    def calculate_slope_roughness_texture(self, input_raster_path, variance_path, entropy_path):
+        """
+        In-process slope/ruggedness texture proxies with the Numba kernel.
+        
+        Computes both proxies in one fused 3x3 pass (_slope_roughness_kernel)
+        instead of three terrain algorithms plus two raster calculator runs.
+        The DSM is streamed in tiles aligned to its GDAL block size, read with
+        a 1-pixel halo for the 3x3 window, so peak memory stays at a few tiles
+        regardless of raster size. Tiles run in a thread pool sized by
+        get_worker_count().
+        
+        The variance proxy is bounded, so it is written as Byte with a GDAL
+        scale (_SLOPE_PROXY_SCALE) that QGIS applies on read: a quarter of the
+        Float32 size for every later pass. The ruggedness proxy is unbounded
+        and stays Float32.
+        
+        Args:
+            input_raster_path (str): Path to the input DSM raster file
+            variance_path (str): Output path of the slope-based variance proxy
+            entropy_path (str): Output path of the ruggedness-based entropy proxy
+        """
+        dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+        if dataset is None:
+            raise Exception(f"Could not open raster for texture analysis: {input_raster_path}")
+        band = dataset.GetRasterBand(1)
+        nodata_value = band.GetNoDataValue()
+        x_size, y_size = band.XSize, band.YSize
+        block_x, block_y = band.GetBlockSize()
+        geotransform = dataset.GetGeoTransform()
+        cell_x, cell_y = abs(geotransform[1]), abs(geotransform[5])
+        
+        driver = gdal.GetDriverByName('GTiff')
+        outputs = []
+        for path, data_type, out_nodata in ((variance_path, gdal.GDT_Byte, _BYTE_NODATA),
+                                            (entropy_path, gdal.GDT_Float32, _TEXTURE_NODATA)):
+            out_ds = driver.Create(path, x_size, y_size, 1, data_type,
+                                   options=_GTIFF_CREATION_OPTIONS.split('|'))
+            out_ds.SetGeoTransform(geotransform)
+            out_ds.SetProjection(dataset.GetProjection())
+            out_band = out_ds.GetRasterBand(1)
+            out_band.SetNoDataValue(out_nodata)
+            outputs.append((out_ds, out_band, [], out_nodata))
+        outputs[0][1].SetScale(_SLOPE_PROXY_SCALE)
+        outputs[0][1].SetOffset(0.0)
+        dataset = None
+        
+        thread_state = threading.local()
+        write_lock = threading.Lock()
+        
+        def process_tile(tile):
+            read_window, (core_col, core_row), core_window = tile
+            if not hasattr(thread_state, 'band'):
+                thread_state.dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+                thread_state.band = thread_state.dataset.GetRasterBand(1)
+            dem = thread_state.band.ReadAsArray(*read_window).astype(np.float32, copy=False)
+            valid = np.isfinite(dem)
+            if nodata_value is not None:
+                valid &= dem != nodata_value
+            out_var = np.empty(dem.shape, dtype=np.float32)
+            out_ent = np.empty(dem.shape, dtype=np.float32)
+            _slope_roughness_kernel(dem, valid, cell_x, cell_y, out_var, out_ent)
+            
+            x_off, y_off, cols, rows = core_window
+            var_core = out_var[core_row:core_row + rows, core_col:core_col + cols]
+            var_levels = np.rint(np.clip(var_core, 0.0, 2.0) / _SLOPE_PROXY_SCALE).astype(np.uint8)
+            var_levels[var_core == _TEXTURE_NODATA] = _BYTE_NODATA
+            cores = [var_levels, out_ent[core_row:core_row + rows, core_col:core_col + cols]]
+            cores_stats = [_tile_statistics(core, output[3]) for core, output in zip(cores, outputs)]
+            with write_lock:
+                for (_, out_band, tile_stats, _), core, core_stats in zip(outputs, cores, cores_stats):
+                    out_band.WriteArray(core, x_off, y_off)
+                    tile_stats.append(core_stats)
+        
+        tiles = list(_iter_tile_windows(x_size, y_size, block_x, block_y, overlap=1))
+        _run_tiles(process_tile, tiles, self.get_worker_count())
+        for out_ds, out_band, tile_stats, _ in outputs:
+            _store_band_statistics(out_band, tile_stats)
+        out_band = None
+        out_ds = None
+        outputs = None
+        _log.debug('Slope/ruggedness texture written over %d tiles', len(tiles))
 
     def calculate_texture_alternative(self, input_raster_path, output_dir, window_size, feedback):
         """
@@ -2349,7 +3856,9 @@ Target smoothing window: ~{target_smoothing_distance}m
             Exception: If alternative texture calculation fails completely
             
         Note:
-            - Uses QGIS terrain analysis algorithms (slope, aspect, roughness)
+            - With Numba, slope and ruggedness come from one fused in-process
+              pass (calculate_slope_roughness_texture); otherwise from the QGIS
+              terrain analysis algorithms (slope, roughness)
             - Provides reasonable approximations for texture analysis
             - Much faster than GRASS r.texture but less sophisticated
             - Suitable for datasets where GRASS is not available
@@ -2359,6 +3868,19 @@ Target smoothing window: ~{target_smoothing_distance}m
         variance_path = os.path.join(output_dir, 'texture_variance_gdal.tif')
         entropy_path = os.path.join(output_dir, 'texture_entropy_gdal.tif')
         
+        # Preferred: one fused in-process pass (Numba); the processing chain
+        # below is the fallback without Numba or if the kernel fails
+        if _HAS_NUMBA:
+            try:
+                self.calculate_slope_roughness_texture(input_raster_path, variance_path, entropy_path)
+                variance_layer = _open_valid_raster(variance_path, 'Texture Variance (GDAL)')
+                entropy_layer = _open_valid_raster(entropy_path, 'Texture Entropy (GDAL)')
+                if variance_layer is not None and entropy_layer is not None:
+                    print('DEBUG: Alternative texture calculated in-process (slope/ruggedness kernel)')
+                    return variance_layer, entropy_layer
+            except Exception as kernel_error:
+                print(f'DEBUG: In-process slope/ruggedness texture failed: {str(kernel_error)}')
+        
         try:
             # Calculate local variance approximation using focal statistics
             # Variance ≈ (FocalMax - FocalMin)^2 / 4
@@ -2368,7 +3890,6 @@ Target smoothing window: ~{target_smoothing_distance}m
             # Simple but effective texture approximation using basic terrain derivatives
             # This approach is robust and uses only standard QGIS algorithms
             temp_slope_path = os.path.join(output_dir, 'temp_slope_texture.tif')
-            temp_aspect_path = os.path.join(output_dir, 'temp_aspect_texture.tif')
             temp_rough_path = os.path.join(output_dir, 'temp_roughness_texture.tif')
             
             # Step 1: Calculate basic terrain derivatives
@@ -2378,12 +3899,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                 'OUTPUT': temp_slope_path
             })
             
-            processing.run('qgis:aspect', {
-                'INPUT': input_raster_path,
-                'Z_FACTOR': 1.0,
-                'OUTPUT': temp_aspect_path
-            })
-            
             processing.run('qgis:ruggednessindex', {
                 'INPUT': input_raster_path,
                 'Z_FACTOR': 1.0,
@@ -2412,18 +3927,15 @@ Target smoothing window: ~{target_smoothing_distance}m
             })
             
             # Clean up temporary files
-            for temp_file in [temp_slope_path, temp_aspect_path, temp_rough_path]:
-                if os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                    except:
-                        pass  # Ignore cleanup errors
+            for temp_file in [temp_slope_path, temp_rough_path]:
+                with suppress(OSError):  # Ignore cleanup errors
+                    os.unlink(temp_file)
             
             # Load and validate
-            variance_layer = QgsRasterLayer(variance_path, 'Texture Variance (GDAL)')
-            entropy_layer = QgsRasterLayer(entropy_path, 'Texture Entropy (GDAL)')
+            variance_layer = _open_valid_raster(variance_path, 'Texture Variance (GDAL)')
+            entropy_layer = _open_valid_raster(entropy_path, 'Texture Entropy (GDAL)')
             
-            if variance_layer.isValid() and entropy_layer.isValid():
+            if variance_layer is not None and entropy_layer is not None:
                 print('DEBUG: Alternative GDAL texture calculation successful')
                 return variance_layer, entropy_layer
             else:
@@ -2433,6 +3945,306 @@ Target smoothing window: ~{target_smoothing_distance}m
             print(f'DEBUG: Alternative texture calculation failed: {str(e)}')
             return None, None
 
+    def calculate_gaussian_filter(self, input_raster_path, output_path, sigma, kernel_radius):
+        """
+        In-process Gaussian filter of the DSM with scipy.ndimage.
+        
+        Replaces the sagang:gaussianfilter run when SciPy is available. The
+        DSM is filtered tile by tile, each tile read with a halo of
+        kernel_radius pixels so tile borders match a whole-raster pass. NoData
+        cells get zero weight (normalized convolution: filtered values divided
+        by the filtered valid mask), so they neither pull neighbours down nor
+        receive a value, like SAGA. Tiles run in a thread pool sized by
+        get_worker_count().
+        
+        Args:
+            input_raster_path (str): Path to the DSM to filter
+            output_path (str): Output GeoTIFF path (Float32)
+            sigma (float): Gaussian standard deviation in pixels
+            kernel_radius (int): Kernel radius in pixels
+            
+        Returns:
+            str: output_path
+            
+        Note:
+            - The separable kernel has square support of kernel_radius; SAGA's
+              circle kernel only drops the corner weights, which are below
+              exp(-radius²/(2·sigma²)) of the centre weight
+        """
+        dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+        if dataset is None:
+            raise Exception(f"Could not open DSM for Gaussian filter: {input_raster_path}")
+        band = dataset.GetRasterBand(1)
+        nodata_value = band.GetNoDataValue()
+        x_size, y_size = band.XSize, band.YSize
+        block_x, block_y = band.GetBlockSize()
+        kernel_radius = max(1, int(kernel_radius))
+        truncate = kernel_radius / sigma  # scipy's radius is int(truncate * sigma + 0.5)
+        
+        out_ds = gdal.GetDriverByName('GTiff').Create(output_path, x_size, y_size, 1, gdal.GDT_Float32,
+                                                      options=_GTIFF_FLOAT_CREATION_OPTIONS.split('|'))
+        out_ds.SetGeoTransform(dataset.GetGeoTransform())
+        out_ds.SetProjection(dataset.GetProjection())
+        out_band = out_ds.GetRasterBand(1)
+        fill_value = np.nan
+        if nodata_value is not None:
+            out_band.SetNoDataValue(nodata_value)
+            fill_value = nodata_value
+        dataset = None
+        
+        thread_state = threading.local()
+        write_lock = threading.Lock()
+        tile_stats = []
+        
+        def process_tile(tile):
+            read_window, (core_col, core_row), core_window = tile
+            if not hasattr(thread_state, 'band'):
+                thread_state.dataset = gdal.Open(input_raster_path, gdal.GA_ReadOnly)
+                thread_state.band = thread_state.dataset.GetRasterBand(1)
+            values = thread_state.band.ReadAsArray(*read_window).astype(np.float32, copy=False)
+            valid = np.isfinite(values)
+            if nodata_value is not None:
+                valid &= values != nodata_value
+            values[~valid] = 0.0
+            weights = ndimage.gaussian_filter(valid.astype(np.float32), sigma, mode='constant',
+                                              cval=0.0, truncate=truncate)
+            filtered = ndimage.gaussian_filter(values, sigma, mode='constant', cval=0.0, truncate=truncate)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                np.divide(filtered, weights, out=filtered)
+            filtered[~valid] = fill_value
+            
+            x_off, y_off, cols, rows = core_window
+            core = filtered[core_row:core_row + rows, core_col:core_col + cols]
+            core_stats = _tile_statistics(core, fill_value) if nodata_value is not None else None
+            with write_lock:
+                out_band.WriteArray(core, x_off, y_off)
+                tile_stats.append(core_stats)
+        
+        tiles = list(_iter_tile_windows(x_size, y_size, block_x, block_y, overlap=kernel_radius))
+        _run_tiles(process_tile, tiles, self.get_worker_count())
+        _store_band_statistics(out_band, tile_stats)
+        out_band = None
+        out_ds = None
+        _log.debug('SciPy Gaussian filter written over %d tiles: %s', len(tiles), output_path)
+        return output_path
+
+    def calculate_residuals(self, original_path, filtered_path, output_path, slope_path=None):
+        """
+        In-process residuals (Original DSM - Filtered DSM) with GDAL and NumPy.
+        
+        Both DSMs are read tile by tile, aligned to the original's GDAL block
+        size, and subtracted in place (np.subtract(..., out=...)) straight into
+        the Float32 output, without the formula parser, process start and
+        file reopening of gdal:rastercalculator. Pixels that are NoData in
+        either input become _RESIDUAL_NODATA. Tiles run in a thread pool sized
+        by get_worker_count().
+        
+        With slope_path, the slope of the filtered DSM (_horn_slope, as
+        qgis:slope) is computed in the same pass: the filtered tiles are read
+        with a 1-pixel halo, so each tile is read once for both outputs.
+        
+        Args:
+            original_path (str): Path to the original DSM
+            filtered_path (str): Path to the Gaussian-filtered DSM
+            output_path (str): Output GeoTIFF path
+            slope_path (str, optional): Output GeoTIFF path of the slope
+            
+        Raises:
+            Exception: If an input cannot be opened or the two grids differ
+                in size (the QGIS raster calculator fallback resamples)
+        """
+        original_ds = gdal.Open(original_path, gdal.GA_ReadOnly)
+        filtered_ds = gdal.Open(filtered_path, gdal.GA_ReadOnly)
+        if original_ds is None or filtered_ds is None:
+            raise Exception(f"Could not open DSMs for residuals: {original_path}, {filtered_path}")
+        x_size, y_size = original_ds.RasterXSize, original_ds.RasterYSize
+        if (filtered_ds.RasterXSize, filtered_ds.RasterYSize) != (x_size, y_size):
+            raise Exception(f"Filtered DSM size {filtered_ds.RasterXSize}x{filtered_ds.RasterYSize} "
+                            f"differs from original {x_size}x{y_size}")
+        original_nodata = original_ds.GetRasterBand(1).GetNoDataValue()
+        filtered_nodata = filtered_ds.GetRasterBand(1).GetNoDataValue()
+        block_x, block_y = original_ds.GetRasterBand(1).GetBlockSize()
+        geotransform = original_ds.GetGeoTransform()
+        cell_x, cell_y = abs(geotransform[1]), abs(geotransform[5])
+        
+        driver = gdal.GetDriverByName('GTiff')
+        outputs = []
+        for path, out_nodata in ((output_path, _RESIDUAL_NODATA), (slope_path, _SLOPE_NODATA)):
+            if path is None:
+                continue
+            out_ds = driver.Create(path, x_size, y_size, 1, gdal.GDT_Float32,
+                                   options=_GTIFF_FLOAT_CREATION_OPTIONS.split('|'))
+            out_ds.SetGeoTransform(geotransform)
+            out_ds.SetProjection(original_ds.GetProjection())
+            out_band = out_ds.GetRasterBand(1)
+            out_band.SetNoDataValue(out_nodata)
+            outputs.append((out_ds, out_band, [], out_nodata))
+        original_ds = None
+        filtered_ds = None
+        
+        thread_state = threading.local()
+        write_lock = threading.Lock()
+        
+        def read_valid(band, window, nodata_value):
+            values = band.ReadAsArray(*window).astype(np.float32, copy=False)
+            valid = np.isfinite(values)
+            if nodata_value is not None:
+                valid &= values != nodata_value
+            return values, valid
+        
+        def process_tile(tile):
+            read_window, (core_col, core_row), core_window = tile
+            if not hasattr(thread_state, 'bands'):
+                thread_state.datasets = [gdal.Open(path, gdal.GA_ReadOnly) for path in (original_path, filtered_path)]
+                thread_state.bands = [dataset.GetRasterBand(1) for dataset in thread_state.datasets]
+            original_band, filtered_band = thread_state.bands
+            x_off, y_off, cols, rows = core_window
+            residuals, valid = read_valid(original_band, core_window, original_nodata)
+            filtered_halo, filtered_halo_valid = read_valid(filtered_band, read_window, filtered_nodata)
+            filtered = filtered_halo[core_row:core_row + rows, core_col:core_col + cols]
+            valid &= filtered_halo_valid[core_row:core_row + rows, core_col:core_col + cols]
+            with np.errstate(invalid='ignore', over='ignore'):  # NoData cells are overwritten below
+                np.subtract(residuals, filtered, out=residuals)
+            residuals[~valid] = _RESIDUAL_NODATA
+            cores = [residuals]
+            if slope_path is not None:
+                slope = _horn_slope(filtered_halo, filtered_halo_valid, cell_x, cell_y)
+                cores.append(slope[core_row:core_row + rows, core_col:core_col + cols])
+            cores_stats = [_tile_statistics(core, output[3]) for core, output in zip(cores, outputs)]
+            with write_lock:
+                for (_, out_band, tile_stats, _), core, core_stats in zip(outputs, cores, cores_stats):
+                    out_band.WriteArray(core, x_off, y_off)
+                    tile_stats.append(core_stats)
+        
+        halo = 1 if slope_path is not None else 0
+        tiles = list(_iter_tile_windows(x_size, y_size, block_x, block_y, overlap=halo))
+        _run_tiles(process_tile, tiles, self.get_worker_count())
+        for out_ds, out_band, tile_stats, _ in outputs:
+            _store_band_statistics(out_band, tile_stats)
+        out_band = None
+        out_ds = None
+        outputs = None
+        _log.debug('Residuals%s written over %d tiles: %s', ' and slope' if slope_path else '', len(tiles), output_path)
+        return output_path
+
+    def classify_features(self, output_path, slope_layer, curvature_layer, residual_layer=None,
+                          variance_layer=None, entropy_layer=None, mode=0, thresholds=None):
+        """
+        In-process anthropogenic feature classification with the Numba kernel.
+        
+        Reads the aligned input rasters with GDAL tile by tile, aligned to the
+        slope's GDAL block size, evaluates the class decision with
+        _classify_kernel in one fused pass and streams the classes into a
+        Byte GeoTIFF (NoData _BYTE_NODATA where any used input is NoData, as
+        the raster calculator does). Only one tile of each input is held in
+        memory per worker. Band scale/offset (the Byte texture proxy) is
+        applied on read, so thresholds are in real units.
+        
+        Args:
+            output_path (str): Output GeoTIFF path
+            slope_layer (QgsRasterLayer): Slope, defines the output grid
+            curvature_layer (QgsRasterLayer): Profile curvature
+            residual_layer (QgsRasterLayer, optional): Residuals
+            variance_layer (QgsRasterLayer, optional): Texture variance (mode 1)
+            entropy_layer (QgsRasterLayer, optional): Texture entropy (mode 1)
+            mode (int): 0 = binary, 1 = 3-class with texture rasters,
+                2 = 3-class without texture rasters (see _classify_kernel)
+            thresholds (tuple): (slope, curvature, residual, variance, entropy,
+                vegetation slope) thresholds; unused ones may be 0
+                
+        Returns:
+            dict: {class value: pixel count} of the valid output pixels,
+                counted per tile while classifying
+                
+        Raises:
+            Exception: If an input is not a GDAL-readable file or its grid
+                differs from the slope grid (the raster calculator handles those)
+        """
+        layers = [slope_layer, curvature_layer, residual_layer, variance_layer, entropy_layer]
+        paths = [layer.source() if layer is not None else None for layer in layers]
+        slope_ds = gdal.Open(paths[0], gdal.GA_ReadOnly)
+        if slope_ds is None:
+            raise Exception(f"Could not open slope raster: {paths[0]}")
+        x_size, y_size = slope_ds.RasterXSize, slope_ds.RasterYSize
+        block_x, block_y = slope_ds.GetRasterBand(1).GetBlockSize()
+        
+        # Per input: (nodata, scale, offset), checked against the slope grid once
+        band_info = []
+        for path in paths:
+            if path is None:
+                band_info.append(None)
+                continue
+            dataset = gdal.Open(path, gdal.GA_ReadOnly)
+            if dataset is None:
+                raise Exception(f"Could not open raster for classification: {path}")
+            if (dataset.RasterXSize, dataset.RasterYSize) != (x_size, y_size):
+                raise Exception(f"Grid of {path} differs from the slope grid")
+            band = dataset.GetRasterBand(1)
+            band_info.append((band.GetNoDataValue(), band.GetScale() or 1.0, band.GetOffset() or 0.0))
+        dataset = None
+        band = None
+        
+        out_ds = gdal.GetDriverByName('GTiff').Create(output_path, x_size, y_size, 1, gdal.GDT_Byte,
+                                                      options=_GTIFF_CREATION_OPTIONS.split('|'))
+        out_ds.SetGeoTransform(slope_ds.GetGeoTransform())
+        out_ds.SetProjection(slope_ds.GetProjection())
+        out_band = out_ds.GetRasterBand(1)
+        out_band.SetNoDataValue(_BYTE_NODATA)
+        slope_ds = None
+        
+        use_residual = residual_layer is not None
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        thread_state = threading.local()
+        write_lock = threading.Lock()
+        tile_stats = []
+        class_counts = np.zeros(256, dtype=np.int64)
+        
+        def process_tile(tile):
+            _, _, core_window = tile
+            if not hasattr(thread_state, 'bands'):
+                thread_state.datasets = [gdal.Open(path, gdal.GA_ReadOnly) if path is not None else None
+                                         for path in paths]
+                thread_state.bands = [dataset.GetRasterBand(1) if dataset is not None else None
+                                      for dataset in thread_state.datasets]
+            x_off, y_off, cols, rows = core_window
+            valid = np.ones((rows, cols), dtype=bool)
+            arrays = []
+            for band, info in zip(thread_state.bands, band_info):
+                if band is None:
+                    arrays.append(None)
+                    continue
+                nodata_value, scale, offset = info
+                values = band.ReadAsArray(*core_window).astype(np.float32, copy=False)
+                valid &= np.isfinite(values)
+                if nodata_value is not None:
+                    valid &= values != nodata_value
+                if scale != 1.0 or offset != 0.0:
+                    values = (values * scale + offset).astype(np.float32)
+                arrays.append(values)
+            slope, curvature, residual, variance, entropy = arrays
+            # Unused inputs get a placeholder of the right type for the kernel
+            residual = slope if residual is None else residual
+            variance = slope if variance is None else variance
+            entropy = slope if entropy is None else entropy
+            classes = np.empty((rows, cols), dtype=np.uint8)
+            _classify_kernel(slope, curvature, residual, variance, entropy, valid, int(mode),
+                             use_residual, thresholds, classes)
+            core_stats = _tile_statistics(classes, _BYTE_NODATA)
+            core_counts = np.bincount(classes.ravel(), minlength=256)
+            with write_lock:
+                out_band.WriteArray(classes, x_off, y_off)
+                tile_stats.append(core_stats)
+                np.add(class_counts, core_counts, out=class_counts)
+        
+        tiles = list(_iter_tile_windows(x_size, y_size, block_x, block_y, overlap=0))
+        _run_tiles(process_tile, tiles, self.get_worker_count())
+        _store_band_statistics(out_band, tile_stats)
+        out_band = None
+        out_ds = None
+        _log.debug('In-process classification written over %d tiles: %s', len(tiles), output_path)
+        class_counts[_BYTE_NODATA] = 0
+        return {int(value): int(class_counts[value]) for value in np.flatnonzero(class_counts)}
+
     def run_reconstruction(self):
         """
         Main reconstruction workflow orchestrating the entire bare earth reconstruction process.
@@ -2504,9 +4316,15 @@ Target smoothing window: ~{target_smoothing_distance}m
             if not os.path.exists(input_dsm_path):
                 QMessageBox.critical(self, 'Error', f'DSM file does not exist: {input_dsm_path}')
                 return
-            # Basic DSM validation using QGIS
+            # Basic DSM validation using QGIS - approximate min/max is enough to
+            # reject flat/empty rasters; only do a full scan if the sample was empty
             try:
-                stats = input_dsm.dataProvider().bandStatistics(1)
+                provider = input_dsm.dataProvider()
+                stats = provider.bandStatistics(1, QgsRasterBandStats.Min | QgsRasterBandStats.Max,
+                                                self.get_dsm_meta(input_dsm).extent, _STATS_SAMPLE_SIZE)
+                if stats.elementCount == 0:
+                    # Cached: the report reuses the full statistics of the DSM
+                    stats = self.get_band_statistics(input_dsm)
                 if stats.minimumValue == stats.maximumValue:
                     QMessageBox.critical(self, 'Error', f'DSM contains no valid elevation values!')
                     return
@@ -2534,84 +4352,82 @@ Target smoothing window: ~{target_smoothing_distance}m
 
             # Initialize progress bar
             total_steps = gaussian_iterations + 9
-            self.update_progress(0, total_steps, "Starting DSM processing...")
+            self.progressChanged.emit(0, total_steps, "Starting DSM processing...")
 
             # Initialize file paths for later use
             output_anthropogenic = os.path.join(output_dir, 'anthropogenic_features.tif')
+            
+            # Classification totals for the processing report (set in Step 5)
+            anthropogenic_pixels = 0
+            total_pixels = 0
 
             # Step 1: Iterative Gaussian filtering
-            input_dsm_path = self.get_raster_path(input_dsm)
-            
-            # Start with the original DSM
+            # Start with the original DSM (input_dsm_path from the input check)
             current_dsm_path = input_dsm_path
             
             try:
-                # Apply Gaussian filter iteratively with fallback algorithms
-                for iteration in range(gaussian_iterations):
-                    print(f'DEBUG: Applying Gaussian filter iteration {iteration + 1}/{gaussian_iterations}')
-                    
-                    # Update progress bar
-                    self.update_progress(iteration + 1, total_steps, f"Gaussian Filter - Iteration {iteration + 1}/{gaussian_iterations}")
-                    
-                    # Adaptive sigma: start with smaller values, increase gradually
-                    if gaussian_iterations == 1:
-                        adaptive_sigma = sigma_value
-                    else:
-                        adaptive_sigma = sigma_value * (0.7 + 0.6 * iteration / (gaussian_iterations - 1))
-                    
-                    # Create output path for this iteration
-                    if iteration == gaussian_iterations - 1:
-                        filtered_dsm_path = os.path.join(output_dir, 'filtered_dsm.tif').replace('\\', '/')
-                    else:
-                        filtered_dsm_path = os.path.join(output_dir, f'filtered_dsm_iter_{iteration + 1}.tif').replace('\\', '/')
-                    
-                    os.makedirs(os.path.dirname(filtered_dsm_path), exist_ok=True)
-                    
-                    # Try Gaussian filter with simple fallback
-                    filter_success = False
-                    
-                    # Method 1: Try SAGA NextGen Gaussian filter
+                # Iterated Gaussian smoothing equals a single Gaussian whose variance is
+                # the sum of the per-iteration variances, so all iterations are fused
+                # into one filter pass. Per-iteration sigmas keep the adaptive ramp
+                # (0.7σ .. 1.3σ); the kernel radius grows with √N to keep the support.
+                if gaussian_iterations == 1:
+                    iteration_sigmas = [sigma_value]
+                else:
+                    iteration_sigmas = [sigma_value * (0.7 + 0.6 * iteration / (gaussian_iterations - 1))
+                                        for iteration in range(gaussian_iterations)]
+                fused_sigma = math.sqrt(sum(sigma ** 2 for sigma in iteration_sigmas))
+                fused_radius = int(math.ceil(kernel_radius * math.sqrt(gaussian_iterations)))
+                print(f'DEBUG: Applying fused Gaussian filter for {gaussian_iterations} iteration(s): '
+                      f'sigma {fused_sigma:.3f}, radius {fused_radius}')
+                
+                # Update progress bar
+                self.progressChanged.emit(gaussian_iterations, total_steps, f"Gaussian Filter - {gaussian_iterations} iteration(s) in one pass")
+                
+                filtered_dsm_path = os.path.join(output_dir, 'filtered_dsm.tif').replace('\\', '/')
+                
+                # Method 1: In-process SciPy filter (no SAGA process, no
+                # intermediate file); Method 2: SAGA NextGen Gaussian filter,
+                # only tried when it is installed
+                filtered = False
+                if _HAS_SCIPY:
+                    try:
+                        self.calculate_gaussian_filter(current_dsm_path, filtered_dsm_path, fused_sigma, fused_radius)
+                        filtered = True
+                    except Exception as e0:
+                        print(f'DEBUG: SciPy Gaussian filter failed: {str(e0)}')
+                
+                if not filtered and self._has_sagang:
                     try:
-                        filtered_dsm_result = processing.run(
+                        processing.run(
                             'sagang:gaussianfilter',
                             {
                                 'INPUT': current_dsm_path,
-                                'SIGMA': adaptive_sigma,
+                                'SIGMA': fused_sigma,
                                 'KERNEL_TYPE': 1,  # Circle
-                                'KERNEL_RADIUS': kernel_radius,
+                                'KERNEL_RADIUS': fused_radius,
                                 'RESULT': filtered_dsm_path
                             },
                             feedback=feedback
                         )
-                        
-                        if os.path.isfile(filtered_dsm_path):
-                            filter_success = True
-                        else:
-                            raise Exception("Output file not created")
-                            
-                    except Exception as e:
-                        # Method 2: Simple fallback - copy file without filtering
-                        try:
-                            import shutil
-                            shutil.copy2(current_dsm_path, filtered_dsm_path)
-                            filter_success = True
-                            if iteration == 0:
-                                QMessageBox.warning(self, 'Warning', 'Gaussian filtering not available. Using original DSM.')
-                        except Exception as e2:
-                            print(f'DEBUG: All filter methods failed in iteration {iteration + 1}')
-                            filtered_dsm_path = input_dsm_path
-                            QMessageBox.warning(self, 'Warning', 'Filtering failed. Processing continues with original DSM.')
-                            break
-                    
-                    # Verify the output file exists (only if not using original DSM path)
-                    if filtered_dsm_path != current_dsm_path and not os.path.isfile(filtered_dsm_path):
-                        print(f'DEBUG: Output file verification failed, using original DSM: {filtered_dsm_path}')
+                        filtered = os.path.isfile(filtered_dsm_path)
+                    except Exception as e1:
+                        print(f'DEBUG: SAGA NextGen Gaussian filter failed: {str(e1)}')
+                
+                if not filtered:
+                    # Method 3: Simple fallback - copy file without filtering
+                    try:
+                        shutil.copy2(current_dsm_path, filtered_dsm_path)
+                        QMessageBox.warning(self, 'Warning', 'Gaussian filtering not available. Using original DSM.')
+                    except Exception as e2:
+                        print('DEBUG: All filter methods failed')
                         filtered_dsm_path = input_dsm_path
-                        QMessageBox.warning(self, 'Warning', 'File verification failed. Using original DSM.')
-                        break
-                    
-                    # Update current DSM path for next iteration
-                    current_dsm_path = filtered_dsm_path
+                        QMessageBox.warning(self, 'Warning', 'Filtering failed. Processing continues with original DSM.')
+                
+                # Verify the output is a readable raster (only if not using original DSM path)
+                if filtered_dsm_path != current_dsm_path and not _quick_probe(filtered_dsm_path)[0]:
+                    print(f'DEBUG: Output file verification failed, using original DSM: {filtered_dsm_path}')
+                    filtered_dsm_path = input_dsm_path
+                    QMessageBox.warning(self, 'Warning', 'File verification failed. Using original DSM.')
                 
                 # Load the final filtered DSM
                 filtered_dsm = QgsRasterLayer(filtered_dsm_path, 'Filtered DSM')
@@ -2624,6 +4440,8 @@ Target smoothing window: ~{target_smoothing_distance}m
                         raise Exception(f"Neither filtered nor original DSM could be loaded!")
                     QMessageBox.warning(self, 'Warning', 'Using original DSM as final result.')
                 
+                # File of the filtered DSM layer, for the steps that take a path
+                filtered_source = filtered_dsm_path
                 print(f'DEBUG: Gaussian filter completed ({gaussian_iterations} iterations)')
                 
 
@@ -2634,55 +4452,66 @@ Target smoothing window: ~{target_smoothing_distance}m
                 return
 
             # Step 2: Calculate residuals (Original DSM - Filtered DSM)
-            self.update_progress(gaussian_iterations + 1, total_steps, " Calculating residuals (Original - Filtered DSM)...")
+            self.progressChanged.emit(gaussian_iterations + 1, total_steps, " Calculating residuals (Original - Filtered DSM)...")
             output_residuals = os.path.join(output_dir, 'residuals.tif')
+            output_slope = os.path.join(output_dir, 'slope.tif')
             
             # Initialize variables
             residual_layer = None
             use_residuals = True
+            slope_in_process = False
             
             try:
-                # Use GDAL processing instead of QgsRasterCalculator for more stability
-                print('DEBUG: Calculating residuals using GDAL raster calculator...')
-                
-                # Method 1: Try GDAL raster calculator
-                residual_result = processing.run(
-                    'gdal:rastercalculator',
-                    {
-                        'INPUT_A': input_dsm_path,
-                        'BAND_A': 1,
-                        'INPUT_B': filtered_dsm_path,
-                        'BAND_B': 1,
-                        'FORMULA': 'A-B',
-                        'NO_DATA': None,
-                        'RTYPE': 5,  # Float32
-                        'OUTPUT': output_residuals
-                    },
-                    feedback=feedback
-                )
-                print('DEBUG: GDAL raster calculator succeeded')
+                # Method 1: In-process tiled subtract, no Processing round trip;
+                # the slope of the filtered DSM (Step 3) comes from the same pass
+                try:
+                    self.calculate_residuals(input_dsm_path, filtered_dsm_path, output_residuals,
+                                             slope_path=output_slope)
+                    slope_in_process = True
+                    print('DEBUG: In-process residual subtract and slope succeeded')
+                except Exception as e0:
+                    print(f'DEBUG: In-process residual subtract failed: {str(e0)}')
+                    print('DEBUG: Calculating residuals using GDAL raster calculator...')
+                    
+                    # Method 2: GDAL raster calculator
+                    residual_result = processing.run(
+                        'gdal:rastercalculator',
+                        {
+                            'INPUT_A': input_dsm_path,
+                            'BAND_A': 1,
+                            'INPUT_B': filtered_dsm_path,
+                            'BAND_B': 1,
+                            'FORMULA': 'A-B',
+                            'NO_DATA': None,
+                            'RTYPE': 5,  # Float32
+                            'OUTPUT': output_residuals
+                        },
+                        feedback=feedback
+                    )
+                    print('DEBUG: GDAL raster calculator succeeded')
                 
             except Exception as e:
                 print(f'DEBUG: GDAL raster calculator failed: {str(e)}')
                 print('DEBUG: Trying QGIS raster calculator with enhanced safety...')
                 
                 try:
-                    # Method 2: Enhanced QGIS Raster Calculator with proper layer handling
-                    from qgis.analysis import QgsRasterCalculatorEntry, QgsRasterCalculator
+                    # Method 3: Enhanced QGIS Raster Calculator with proper layer handling
+                    
+                    # Check both grids with GDAL probes; calculator layers are
+                    # built once, on the final inputs
+                    original_ok, original_width, original_height, _ = _quick_probe(input_dsm_path)
+                    if not original_ok:
+                        raise Exception(f"Could not load original DSM: {input_dsm_path}")
+                    filtered_ok, filtered_width, filtered_height, _ = _quick_probe(filtered_dsm_path)
+                    if not filtered_ok:
+                        raise Exception(f"Could not load filtered DSM: {filtered_dsm_path}")
                     
-                    # Ensure both layers are properly loaded and valid
                     original_layer = QgsRasterLayer(input_dsm_path, 'Original_DSM_Temp')
                     if not original_layer.isValid():
                         raise Exception(f"Could not load original DSM: {input_dsm_path}")
                     
-                    # Reload filtered DSM to ensure it's properly accessible
-                    filtered_layer = QgsRasterLayer(filtered_dsm_path, 'Filtered_DSM_Temp')
-                    if not filtered_layer.isValid():
-                        raise Exception(f"Could not load filtered DSM: {filtered_dsm_path}")
-                    
                     # Check layer compatibility
-                    if (original_layer.width() != filtered_layer.width() or
-                        original_layer.height() != filtered_layer.height()):
+                    if (original_width, original_height) != (filtered_width, filtered_height):
                         print('DEBUG: Layer dimensions mismatch, resampling filtered DSM...')
                         
                         # Resample filtered DSM to match original
@@ -2691,12 +4520,12 @@ Target smoothing window: ~{target_smoothing_distance}m
                             'gdal:warpreproject',
                             {
                                 'INPUT': filtered_dsm_path,
-                                'SOURCE_CRS': filtered_layer.crs().authid(),
+                                'SOURCE_CRS': None,  # the file's own CRS
                                 'TARGET_CRS': original_layer.crs().authid(),
                                 'RESAMPLING': 0,
                                 'NODATA': None,
                                 'TARGET_RESOLUTION': None,
-                                'OPTIONS': '',
+                                'OPTIONS': _GTIFF_CREATION_OPTIONS,
                                 'DATA_TYPE': 0,
                                 'TARGET_EXTENT': None,
                                 'TARGET_EXTENT_CRS': None,
@@ -2704,9 +4533,12 @@ Target smoothing window: ~{target_smoothing_distance}m
                                 'OUTPUT': resampled_filtered_path
                             }
                         )
-                        filtered_layer = QgsRasterLayer(resampled_filtered_path, 'Filtered_DSM_Resampled')
                         filtered_dsm_path = resampled_filtered_path
                     
+                    filtered_layer = QgsRasterLayer(filtered_dsm_path, 'Filtered_DSM_Temp')
+                    if not filtered_layer.isValid():
+                        raise Exception(f"Could not load filtered DSM: {filtered_dsm_path}")
+                    
                     # Create calculator entries
                     original_entry = QgsRasterCalculatorEntry()
                     original_entry.ref = 'original@1'
@@ -2743,29 +4575,15 @@ Target smoothing window: ~{target_smoothing_distance}m
                     print(f'DEBUG: QGIS raster calculator also failed: {str(e2)}')
                     print('DEBUG: Using simple GDAL subtract operation as fallback...')
                     
-                    # Method 3: Simple GDAL subtract using gdal_calc
+                    # Method 4: Simple GDAL subtract using gdal_calc, on the
+                    # (possibly resampled) filtered DSM from Method 3
                     try:
-                        # Use GDAL translate to ensure both files are accessible
-                        temp_original = os.path.join(output_dir, 'temp_original_for_residuals.tif')
-                        temp_filtered = os.path.join(output_dir, 'temp_filtered_for_residuals.tif')
-                        
-                        processing.run('gdal:translate', {
-                            'INPUT': input_dsm_path,
-                            'OUTPUT': temp_original
-                        })
-                        
-                        processing.run('gdal:translate', {
-                            'INPUT': filtered_dsm_path,
-                            'OUTPUT': temp_filtered
-                        })
-                        
-                        # Simple raster math using processing
                         processing.run(
                             'gdal:rastercalculator',
                             {
-                                'INPUT_A': temp_original,
+                                'INPUT_A': input_dsm_path,
                                 'BAND_A': 1,
-                                'INPUT_B': temp_filtered,
+                                'INPUT_B': filtered_dsm_path,
                                 'BAND_B': 1,
                                 'FORMULA': 'A-B',
                                 'NO_DATA': None,
@@ -2774,12 +4592,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                             }
                         )
                         
-                        # Clean up temporary files
-                        if os.path.exists(temp_original):
-                            os.remove(temp_original)
-                        if os.path.exists(temp_filtered):
-                            os.remove(temp_filtered)
-                            
                         print('DEBUG: GDAL subtract fallback succeeded')
                         
                     except Exception as e3:
@@ -2808,9 +4620,10 @@ Target smoothing window: ~{target_smoothing_distance}m
                     print('DEBUG: Residual layer created successfully:', output_residuals)
                     use_residuals = True
                     
-                    # Debug: Check residual statistics
+                    # Debug: Check residual statistics (stored by the subtract
+                    # pass; the fallbacks get them computed once and stored)
                     try:
-                        residual_stats = residual_layer.dataProvider().bandStatistics(1)
+                        residual_stats = self.get_gdal_band_statistics(output_residuals)
                         print('DEBUG: Residual Min/Max:', residual_stats.minimumValue, residual_stats.maximumValue)
                         print('DEBUG: Residual Mean/StdDev:', residual_stats.mean, residual_stats.stdDev)
                         
@@ -2823,27 +4636,22 @@ Target smoothing window: ~{target_smoothing_distance}m
                     except Exception as e:
                         print(f'DEBUG: Could not calculate residual statistics: {str(e)}')
             
-            # Step 3: Calculate slope (with FILTERED DSM)
-            self.update_progress(gaussian_iterations + 2, total_steps, " Calculating slope analysis...")
-            output_slope = os.path.join(output_dir, 'slope.tif')
-            slope_result = processing.run(
-                'qgis:slope',
-                {
-                    'INPUT': filtered_dsm,  # Use FILTERED DSM!
-                    'Z_FACTOR': 1.0,
-                    'OUTPUT': output_slope
-                },
-                feedback=feedback
-            )
-            slope_layer = QgsRasterLayer(output_slope, 'Slope')
-            if not slope_layer.isValid():
-                raise Exception(f"Slope layer could not be loaded: {output_slope}")
-            print('DEBUG: Slope layer created:', output_slope)
-
-
+            # Step 3: Calculate slope (with FILTERED DSM), unless Step 2 already
+            # wrote it in the same pass as the residuals
+            self.progressChanged.emit(gaussian_iterations + 2, total_steps, " Calculating slope analysis...")
+            if not slope_in_process:
+                processing.run(
+                    'qgis:slope',
+                    {
+                        'INPUT': filtered_source,  # Use FILTERED DSM!
+                        'Z_FACTOR': 1.0,
+                        'OUTPUT': output_slope
+                    },
+                    feedback=feedback
+                )
 
             # Step 4: Calculate curvature (with FILTERED DSM)
-            self.update_progress(gaussian_iterations + 3, total_steps, " Calculating curvature analysis...")
+            self.progressChanged.emit(gaussian_iterations + 3, total_steps, " Calculating curvature analysis...")
             curvature_layer = None
             try:
                 curvature_result = processing.run(
@@ -2856,12 +4664,11 @@ Target smoothing window: ~{target_smoothing_distance}m
             except Exception as e:
                 print('DEBUG: profilecurvature not available, trying GRASS r.slope.aspect')
                 try:
-                    filtered_dsm_path = self.get_raster_path(filtered_dsm)  # Use FILTERED DSM!
                     curvature_path = os.path.join(output_dir, 'curvature.tif')
                     curvature_result = processing.run(
                         'grass7:r.slope.aspect',
                         {
-                            'elevation': filtered_dsm_path,  # Use FILTERED DSM!
+                            'elevation': filtered_source,  # Use FILTERED DSM!
                             'pcurvature': curvature_path,
                             'tcurvature': 'TEMPORARY_OUTPUT',
                             'slope': 'TEMPORARY_OUTPUT',
@@ -2890,16 +4697,16 @@ Target smoothing window: ~{target_smoothing_distance}m
                     if not curvature_layer.isValid():
                         raise Exception(f"Curvature layer could not be loaded: {curvature_path}")
                     print('DEBUG: Curvature layer (GRASS r.slope.aspect) created from FILTERED DSM')
-                    print('DEBUG: Curvature Min/Max:', curvature_layer.dataProvider().bandStatistics(1).minimumValue, curvature_layer.dataProvider().bandStatistics(1).maximumValue)
-                    print('DEBUG: Curvature Mean/StdDev:', curvature_layer.dataProvider().bandStatistics(1).mean, curvature_layer.dataProvider().bandStatistics(1).stdDev)
+                    curvature_stats = self.get_band_statistics(curvature_layer)
+                    print('DEBUG: Curvature Min/Max:', curvature_stats.minimumValue, curvature_stats.maximumValue)
+                    print('DEBUG: Curvature Mean/StdDev:', curvature_stats.mean, curvature_stats.stdDev)
                 except Exception as e2:
                     print('DEBUG: GRASS r.slope.aspect not available, trying SAGA NextGen slopeaspectcurvature')
                     try:
-                        filtered_dsm_path = self.get_raster_path(filtered_dsm)  # Use FILTERED DSM!
                         curvature_path = os.path.join(output_dir, 'curvature.tif')
                         curvature_result = processing.run(
                             'sagang:slopeaspectcurvature',
-                            {'GRID': filtered_dsm_path, 'CURVATURE': curvature_path},  # Use FILTERED DSM!
+                            {'GRID': filtered_source, 'CURVATURE': curvature_path},  # Use FILTERED DSM!
                             feedback=feedback
                         )
                         if not os.path.isfile(curvature_path):
@@ -2908,19 +4715,25 @@ Target smoothing window: ~{target_smoothing_distance}m
                         if not curvature_layer.isValid():
                             raise Exception(f"Curvature layer could not be loaded: {curvature_path}")
                         print('DEBUG: Curvature layer (SAGA NextGen slopeaspectcurvature) created from FILTERED DSM')
-                        print('DEBUG: Curvature Min/Max:', curvature_layer.dataProvider().bandStatistics(1).minimumValue, curvature_layer.dataProvider().bandStatistics(1).maximumValue)
-                        print('DEBUG: Curvature Mean/StdDev:', curvature_layer.dataProvider().bandStatistics(1).mean, curvature_layer.dataProvider().bandStatistics(1).stdDev)
+                        curvature_stats = self.get_band_statistics(curvature_layer)
+                        print('DEBUG: Curvature Min/Max:', curvature_stats.minimumValue, curvature_stats.maximumValue)
+                        print('DEBUG: Curvature Mean/StdDev:', curvature_stats.mean, curvature_stats.stdDev)
                     except Exception as e3:
                         print('DEBUG: No curvature calculation possible:', str(e3))
                         QMessageBox.critical(self, 'Error', 'No curvature algorithm (QGIS, GRASS, SAGA) is available!')
                         return
 
+            slope_layer = QgsRasterLayer(output_slope, 'Slope')
+            if not slope_layer.isValid():
+                raise Exception(f"Slope layer could not be loaded: {output_slope}")
+            print('DEBUG: Slope layer created:', output_slope)
+
             # Step 4b: Texture Analysis (optional)
-            self.update_progress(gaussian_iterations + 4, total_steps, " Performing texture analysis (3-class classification)...")
-            texture_variance, texture_entropy = self.perform_texture_analysis(filtered_dsm_path, output_dir, feedback)
+            self.progressChanged.emit(gaussian_iterations + 4, total_steps, " Performing texture analysis (3-class classification)...")
+            texture_variance, texture_entropy = self.perform_texture_analysis(filtered_source, output_dir, feedback)
 
             # Step 5a: Statistical Analysis and Adaptive Threshold Calculation (Cao et al. 2020)
-            self.update_progress(gaussian_iterations + 5, total_steps, "Statistical analysis & adaptive thresholds (Cao et al. 2020)...")
+            self.progressChanged.emit(gaussian_iterations + 5, total_steps, "Statistical analysis & adaptive thresholds (Cao et al. 2020)...")
             print('DEBUG: Starting statistical analysis for adaptive thresholds...')
             
             # Determine if texture analysis is available
@@ -3025,7 +4838,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                 print('DEBUG: ====================================')
 
             # Step 5: Identify anthropogenic features
-            self.update_progress(gaussian_iterations + 6, total_steps, " Identifying anthropogenic features...")
+            self.progressChanged.emit(gaussian_iterations + 6, total_steps, " Identifying anthropogenic features...")
             # Ensure slope_layer and curvature_layer are QgsRasterLayer
             if isinstance(slope_layer, str):
                 slope_layer = QgsRasterLayer(slope_layer, 'Slope')
@@ -3056,51 +4869,53 @@ Target smoothing window: ~{target_smoothing_distance}m
                 need_resample = True
 
             if need_resample:
-                # Resample curvature to slope
+                # Resample curvature (and residuals) onto the slope grid with an
+                # in-process gdal.Warp per raster. Warp releases the GIL, so the
+                # two run concurrently, each multi-threaded over its own chunks
+                slope_ds = gdal.Open(slope_layer.source(), gdal.GA_ReadOnly)
+                if slope_ds is None:
+                    raise Exception(f"Could not open slope raster for resampling: {slope_layer.source()}")
+                x_origin, pixel_x, _, y_origin, _, pixel_y = slope_ds.GetGeoTransform()
+                warp_options = {
+                    'format': 'GTiff',
+                    'dstSRS': slope_ds.GetProjection(),
+                    'outputBounds': (x_origin, y_origin + pixel_y * slope_ds.RasterYSize,
+                                     x_origin + pixel_x * slope_ds.RasterXSize, y_origin),
+                    'width': slope_ds.RasterXSize,
+                    'height': slope_ds.RasterYSize,
+                    'resampleAlg': 'near',
+                    'multithread': True,
+                    'warpOptions': ['NUM_THREADS=ALL_CPUS'],
+                    'creationOptions': _GTIFF_CREATION_OPTIONS.split('|')
+                }
+                slope_ds = None
+                
                 resampled_curvature_path = os.path.join(output_dir, 'curvature_resampled.tif')
-                processing.run(
-                    'gdal:warpreproject',
-                    {
-                        'INPUT': curvature_layer,
-                        'SOURCE_CRS': curvature_layer.crs().authid(),
-                        'TARGET_CRS': slope_layer.crs().authid(),
-                        'RESAMPLING': 0,
-                        'NODATA': None,
-                        'TARGET_RESOLUTION': None,
-                        'OPTIONS': '',
-                        'DATA_TYPE': 0,
-                        'TARGET_EXTENT': None,
-                        'TARGET_EXTENT_CRS': None,
-                        'MULTITHREADING': False,
-                        'OUTPUT': resampled_curvature_path
-                    }
-                )
+                warps = [(self.get_raster_path(curvature_layer), resampled_curvature_path)]
+                if use_residuals and residual_layer is not None:
+                    resampled_residual_path = os.path.join(output_dir, 'residual_resampled.tif')
+                    warps.append((self.get_raster_path(residual_layer), resampled_residual_path))
+                def warp_to_slope_grid(source_path, output_path):
+                    # Warp returns the open output dataset; dropping it here, in
+                    # the worker, closes and flushes the file before it is loaded
+                    dataset = gdal.Warp(output_path, source_path, **warp_options)
+                    warped = dataset is not None
+                    dataset = None
+                    return warped
+                
+                with ThreadPoolExecutor(max_workers=len(warps)) as executor:
+                    warp_ok = list(executor.map(lambda warp: warp_to_slope_grid(*warp), warps))
+                
+                if not warp_ok[0]:
+                    raise Exception(f"Curvature could not be resampled to the slope grid: {resampled_curvature_path}")
                 curvature_layer = QgsRasterLayer(resampled_curvature_path, 'Curvature_Resampled')
                 if not curvature_layer.isValid():
                     raise Exception(f"Resampled curvature layer could not be loaded: {resampled_curvature_path}")
                 
-                # Resample residual to slope if residuals are available
-                if use_residuals and residual_layer is not None:
-                    resampled_residual_path = os.path.join(output_dir, 'residual_resampled.tif')
-                    processing.run(
-                        'gdal:warpreproject',
-                        {
-                            'INPUT': residual_layer,
-                            'SOURCE_CRS': residual_layer.crs().authid(),
-                            'TARGET_CRS': slope_layer.crs().authid(),
-                            'RESAMPLING': 0,
-                            'NODATA': None,
-                            'TARGET_RESOLUTION': None,
-                            'OPTIONS': '',
-                            'DATA_TYPE': 0,
-                            'TARGET_EXTENT': None,
-                            'TARGET_EXTENT_CRS': None,
-                            'MULTITHREADING': False,
-                            'OUTPUT': resampled_residual_path
-                        }
-                    )
-                    residual_layer = QgsRasterLayer(resampled_residual_path, 'Residual_Resampled')
-                    if not residual_layer.isValid():
+                # Residuals are optional: drop them if their resampling failed
+                if len(warps) > 1:
+                    residual_layer = QgsRasterLayer(resampled_residual_path, 'Residual_Resampled') if warp_ok[1] else None
+                    if residual_layer is None or not residual_layer.isValid():
                         residual_layer = None
                         use_residuals = False
 
@@ -3116,9 +4931,9 @@ Target smoothing window: ~{target_smoothing_distance}m
                 # 3-class formula WITH texture rasters: 0=Natural, 1=Vegetation, 2=Anthropogenic
                 print('DEBUG: Using 3-class texture-based classification (WITH texture rasters)')
                 if use_residuals and residual_layer is not None:
-                    calc_expression = f'if(("variance@1" > {variance_threshold} OR "entropy@1" > {entropy_threshold}) AND ("slope@1" <= {slope_threshold} AND "curvature@1" <= {curvature_threshold} AND "curvature@1" >= -{curvature_threshold} AND "residual@1" <= {residual_threshold} AND "residual@1" >= -{residual_threshold}), 1, if(("slope@1" > {slope_threshold} OR "curvature@1" > {curvature_threshold} OR "curvature@1" < -{curvature_threshold} OR "residual@1" > {residual_threshold} OR "residual@1" < -{residual_threshold}), 2, 0))'
+                    calc_expression = f'if("slope@1" <= {slope_threshold} AND abs("curvature@1") <= {curvature_threshold} AND abs("residual@1") <= {residual_threshold} AND ("variance@1" > {variance_threshold} OR "entropy@1" > {entropy_threshold}), 1, if(("slope@1" > {slope_threshold} OR abs("curvature@1") > {curvature_threshold} OR abs("residual@1") > {residual_threshold}), 2, 0))'
                 else:
-                    calc_expression = f'if(("variance@1" > {variance_threshold} OR "entropy@1" > {entropy_threshold}) AND ("slope@1" <= {slope_threshold} AND "curvature@1" <= {curvature_threshold} AND "curvature@1" >= -{curvature_threshold}), 1, if(("slope@1" > {slope_threshold} OR "curvature@1" > {curvature_threshold} OR "curvature@1" < -{curvature_threshold}), 2, 0))'
+                    calc_expression = f'if("slope@1" <= {slope_threshold} AND abs("curvature@1") <= {curvature_threshold} AND ("variance@1" > {variance_threshold} OR "entropy@1" > {entropy_threshold}), 1, if(("slope@1" > {slope_threshold} OR abs("curvature@1") > {curvature_threshold}), 2, 0))'
                 
                 print(f'DEBUG:  CLASSIFICATION FORMULA: {calc_expression}')
                 print(f'DEBUG:  Thresholds - Variance: {variance_threshold}, Entropy: {entropy_threshold}')
@@ -3132,9 +4947,9 @@ Target smoothing window: ~{target_smoothing_distance}m
                 # Use slope as vegetation proxy: low slope = vegetation, high slope = anthropogenic
                 vegetation_slope_threshold = slope_threshold / 2  # Half of anthropogenic threshold
                 if use_residuals and residual_layer is not None:
-                    calc_expression = f'if("slope@1" <= {vegetation_slope_threshold} AND abs("residual@1") <= {residual_threshold/2}, 1, if(("slope@1" > {slope_threshold} OR "curvature@1" > {curvature_threshold} OR "curvature@1" < -{curvature_threshold} OR abs("residual@1") > {residual_threshold}), 2, 0))'
+                    calc_expression = f'if("slope@1" <= {vegetation_slope_threshold} AND abs("residual@1") <= {residual_threshold/2}, 1, if(("slope@1" > {slope_threshold} OR abs("curvature@1") > {curvature_threshold} OR abs("residual@1") > {residual_threshold}), 2, 0))'
                 else:
-                    calc_expression = f'if("slope@1" <= {vegetation_slope_threshold}, 1, if(("slope@1" > {slope_threshold} OR "curvature@1" > {curvature_threshold} OR "curvature@1" < -{curvature_threshold}), 2, 0))'
+                    calc_expression = f'if("slope@1" <= {vegetation_slope_threshold}, 1, if(("slope@1" > {slope_threshold} OR abs("curvature@1") > {curvature_threshold}), 2, 0))'
                 
                 print(f'DEBUG:  CLASSIFICATION FORMULA: {calc_expression}')
                 print(f'DEBUG:  Thresholds - Vegetation slope: {vegetation_slope_threshold}, Anthropogenic slope: {slope_threshold}')
@@ -3145,17 +4960,45 @@ Target smoothing window: ~{target_smoothing_distance}m
                 # Original binary classification (anthropogenic=1, natural=0)
                 print('DEBUG: Using binary classification (no texture)')
                 if use_residuals and residual_layer is not None:
-                    calc_expression = f'("slope@1" > {slope_threshold}) OR ("curvature@1" > {curvature_threshold} OR "curvature@1" < -{curvature_threshold}) OR ("residual@1" > {residual_threshold} OR "residual@1" < -{residual_threshold})'
+                    calc_expression = f'("slope@1" > {slope_threshold}) OR (abs("curvature@1") > {curvature_threshold}) OR (abs("residual@1") > {residual_threshold})'
                 else:
-                    calc_expression = f'("slope@1" > {slope_threshold}) OR ("curvature@1" > {curvature_threshold} OR "curvature@1" < -{curvature_threshold})'
+                    calc_expression = f'("slope@1" > {slope_threshold}) OR (abs("curvature@1") > {curvature_threshold})'
                 
                 print(f'DEBUG:  CLASSIFICATION FORMULA: {calc_expression}')
                 print(f'DEBUG:  Thresholds - Slope: {slope_threshold}, Curvature: ±{curvature_threshold}')
                 if use_residuals and residual_layer is not None:
                     print(f'DEBUG:  Thresholds - Residual: ±{residual_threshold}')
             
+            # Preferred: fused in-process classifier (Numba); the raster
+            # calculator below is the fallback without Numba or for inputs
+            # that are not aligned GDAL files (e.g. memory layers)
+            classified_in_process = False
+            class_pixel_counts = None
+            if _HAS_NUMBA:
+                if use_texture and texture_layers_available:
+                    classification_mode = 1
+                elif use_texture:
+                    classification_mode = 2
+                else:
+                    classification_mode = 0
+                with_residuals = use_residuals and residual_layer is not None
+                try:
+                    class_pixel_counts = self.classify_features(
+                        output_anthropogenic, slope_layer, curvature_layer,
+                        residual_layer if with_residuals else None,
+                        texture_variance if classification_mode == 1 else None,
+                        texture_entropy if classification_mode == 1 else None,
+                        mode=classification_mode,
+                        thresholds=(slope_threshold, curvature_threshold,
+                                    residual_threshold if with_residuals else 0.0,
+                                    variance_threshold if classification_mode == 1 else 0.0,
+                                    entropy_threshold if classification_mode == 1 else 0.0,
+                                    slope_threshold / 2))
+                    classified_in_process = True
+                except Exception as e:
+                    print(f'DEBUG: In-process classification failed, using raster calculator: {str(e)}')
+            
             entries = []
-            from qgis.analysis import QgsRasterCalculatorEntry, QgsRasterCalculator
             slope_entry = QgsRasterCalculatorEntry()
             slope_entry.ref = 'slope@1'
             slope_entry.raster = slope_layer
@@ -3193,145 +5036,95 @@ Target smoothing window: ~{target_smoothing_distance}m
             if not os.access(output_dir, os.W_OK):
                 raise Exception(f"No write permissions in target directory: {output_dir}")
             
-            calc = QgsRasterCalculator(
-                calc_expression,
-                output_anthropogenic,
-                'GTiff',
-                slope_layer.extent(),
-                slope_layer.width(),
-                slope_layer.height(),
-                entries
-            )
-            
-            # Explicit call of Raster Calculator
-            try:
-                result = calc.processCalculation(feedback)
-                if result != QgsRasterCalculator.Success:
-                    raise Exception(f"Raster Calculator failed with code: {result}")
-            except Exception as e:
-                raise Exception(f"Raster Calculator error: {str(e)}")
+            if not classified_in_process:
+                calc = QgsRasterCalculator(
+                    calc_expression,
+                    output_anthropogenic,
+                    'GTiff',
+                    slope_layer.extent(),
+                    slope_layer.width(),
+                    slope_layer.height(),
+                    entries
+                )
+                
+                # Explicit call of Raster Calculator
+                try:
+                    result = calc.processCalculation(feedback)
+                    if result != QgsRasterCalculator.Success:
+                        raise Exception(f"Raster Calculator failed with code: {result}")
+                except Exception as e:
+                    raise Exception(f"Raster Calculator error: {str(e)}")
             
             if not os.path.isfile(output_anthropogenic):
                 raise Exception(f"Anthropogenic mask was not created: {output_anthropogenic}")
             
-            #  DEBUGGING: Check classification result immediately
-            print('DEBUG:  CHECKING CLASSIFICATION RESULT...')
-            classification_layer = QgsRasterLayer(output_anthropogenic, 'Classification_Check')
-            if classification_layer.isValid():
-                classification_provider = classification_layer.dataProvider()
-                classification_stats = classification_provider.bandStatistics(1, QgsRasterBandStats.All)
-                print(f'DEBUG:  Classification result - Min: {classification_stats.minimumValue}, Max: {classification_stats.maximumValue}')
-                print(f'DEBUG:  Classification result - Mean: {classification_stats.mean:.3f}, StdDev: {classification_stats.stdDev:.3f}')
-                
-                # Sample values to see what classes were actually produced
-                try:
-                    # Use sampling instead of block access for safety
-                    unique_values = set()
-                    class_counts = {0: 0, 1: 0, 2: 0}
-                    samples_taken = 0
-                    max_samples = 400  # 20x20 sample grid
+            #  DEBUGGING: Check classification result immediately. Everything
+            # below only feeds the debug log, so it is skipped (no statistics
+            # or sample reads) unless "Verbose debug log" is on
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug(' CHECKING CLASSIFICATION RESULT...')
+                classification_layer = QgsRasterLayer(output_anthropogenic, 'Classification_Check')
+                if classification_layer.isValid():
+                    classification_stats = classification_layer.dataProvider().bandStatistics(
+                        1, QgsRasterBandStats.Min | QgsRasterBandStats.Max | QgsRasterBandStats.Mean | QgsRasterBandStats.StdDev,
+                        classification_layer.extent(), _STATS_SAMPLE_SIZE)
+                    _log.debug(' Classification result - Min: %s, Max: %s',
+                               classification_stats.minimumValue, classification_stats.maximumValue)
+                    _log.debug(' Classification result - Mean: %.3f, StdDev: %.3f',
+                               classification_stats.mean, classification_stats.stdDev)
                     
-                    for i in range(0, classification_layer.width(), max(1, classification_layer.width() // 20)):
-                        for j in range(0, classification_layer.height(), max(1, classification_layer.height() // 20)):
-                            if samples_taken >= max_samples:
-                                break
-                            
-                            try:
-                                # Convert pixel coordinates to map coordinates
-                                x = classification_layer.extent().xMinimum() + (i + 0.5) * classification_layer.rasterUnitsPerPixelX()
-                                y = classification_layer.extent().yMaximum() - (j + 0.5) * classification_layer.rasterUnitsPerPixelY()
-                                
-                                # Sample value using provider (safer than block access)
-                                value, success = classification_provider.sample(QgsPointXY(x, y), 1)
-                                if success and value != classification_provider.sourceNoDataValue(1):
-                                    int_value = int(value)
-                                    unique_values.add(int_value)
-                                    if int_value in class_counts:
-                                        class_counts[int_value] += 1
-                                
-                                samples_taken += 1
-                                
-                            except Exception as sample_error:
-                                continue
+                    # Sample values to see what classes were actually produced
+                    try:
+                        class_counts = {0: 0, 1: 0, 2: 0}
+                        sampled_counts = _sample_class_counts(output_anthropogenic, 20)  # 20x20 sample grid
+                        unique_values = set(sampled_counts)
+                        for class_id, count in sampled_counts.items():
+                            if class_id in class_counts:
+                                class_counts[class_id] = count
                         
-                        if samples_taken >= max_samples:
-                            break
-                    
-                    print(f'DEBUG:  Unique classification values: {sorted(unique_values)}')
-                    print(f'DEBUG:  Class distribution in sample:')
-                    for class_id, count in class_counts.items():
-                        percentage = (count / sum(class_counts.values())) * 100 if sum(class_counts.values()) > 0 else 0
-                        print(f'DEBUG:    Class {class_id}: {count} pixels ({percentage:.1f}%)')
-                    
-                    if 2 not in unique_values:
-                        print('DEBUG:  CRITICAL: Class 2 (Anthropogenic) was NOT produced!')
-                        print('DEBUG:  This explains why filtering fails - no class 2 pixels exist!')
-                    else:
-                        print('DEBUG:  Class 2 (Anthropogenic) was produced successfully')
+                        _log.debug(' Unique classification values: %s', sorted(unique_values))
+                        _log.debug(' Class distribution in sample:')
+                        sampled_total = sum(class_counts.values())
+                        for class_id, count in class_counts.items():
+                            percentage = (count / sampled_total) * 100 if sampled_total > 0 else 0
+                            _log.debug('   Class %d: %d pixels (%.1f%%)', class_id, count, percentage)
                         
-                except Exception as e:
-                    print(f'DEBUG:  Could not sample classification values: {str(e)}')
-            else:
-                print('DEBUG:  ERROR: Classification result layer is invalid!')
-            
-            # Calculate anthropogenic statistics
-            test_layer = QgsRasterLayer(output_anthropogenic, 'Test')
-            if test_layer.isValid():
-                #  CRITICAL DEBUGGING: Check actual raster values
-                print('DEBUG:  ANALYZING ANTHROPOGENIC FEATURES RASTER...')
-                provider = test_layer.dataProvider()
-                stats = provider.bandStatistics(1, QgsRasterBandStats.All)
-                print(f'DEBUG:  Anthropogenic raster - Min: {stats.minimumValue}, Max: {stats.maximumValue}')
-                print(f'DEBUG:  Anthropogenic raster - Mean: {stats.mean:.3f}, StdDev: {stats.stdDev:.3f}')
-                
-                # Sample some values to see what's actually in the raster
-                try:
-                    # Use sampling instead of block access for safety
-                    unique_values = set()
-                    samples_taken = 0
-                    max_samples = 100  # 10x10 sample grid
-                    
-                    for i in range(0, test_layer.width(), max(1, test_layer.width() // 10)):
-                        for j in range(0, test_layer.height(), max(1, test_layer.height() // 10)):
-                            if samples_taken >= max_samples:
-                                break
-                            
-                            try:
-                                # Convert pixel coordinates to map coordinates
-                                x = test_layer.extent().xMinimum() + (i + 0.5) * test_layer.rasterUnitsPerPixelX()
-                                y = test_layer.extent().yMaximum() - (j + 0.5) * test_layer.rasterUnitsPerPixelY()
-                                
-                                # Sample value using provider (safer than block access)
-                                value, success = provider.sample(QgsPointXY(x, y), 1)
-                                if success and value != provider.sourceNoDataValue(1):
-                                    unique_values.add(int(value))
-                                
-                                samples_taken += 1
-                                
-                            except Exception as sample_error:
-                                continue
+                        if 2 not in unique_values:
+                            _log.debug(' CRITICAL: Class 2 (Anthropogenic) was NOT produced!')
+                            _log.debug(' This explains why filtering fails - no class 2 pixels exist!')
+                        else:
+                            _log.debug(' Class 2 (Anthropogenic) was produced successfully')
                         
-                        if samples_taken >= max_samples:
-                            break
-                    
-                    print(f'DEBUG:  Unique values found in sample: {sorted(unique_values)}')
-                    
-                    if len(unique_values) == 2 and 0 in unique_values and 1 in unique_values:
-                        print('DEBUG:  PROBLEM: Raster is BINARY (0,1) not 3-class (0,1,2)!')
-                    elif len(unique_values) == 3 and 0 in unique_values and 1 in unique_values and 2 in unique_values:
-                        print('DEBUG:  Raster is 3-class (0,1,2) as expected')
-                    else:
-                        print(f'DEBUG:  Unexpected values: {sorted(unique_values)}')
-                except Exception as e:
-                    print(f'DEBUG:  Could not sample raster values: {str(e)}')
-                
-                anthropogenic_pixels = stats.sum
-                total_pixels = test_layer.width() * test_layer.height()
-                anthropogenic_percentage = (anthropogenic_pixels / total_pixels) * 100
-                print(f'DEBUG: Anthropogenic features detected: {anthropogenic_percentage:.1f}% of area')
+                        # Binary vs. 3-class check on the same sample (the file is
+                        # not read a second time for it)
+                        if len(unique_values) == 2 and 0 in unique_values and 1 in unique_values:
+                            _log.debug(' PROBLEM: Raster is BINARY (0,1) not 3-class (0,1,2)!')
+                        elif unique_values == {0, 1, 2}:
+                            _log.debug(' Raster is 3-class (0,1,2) as expected')
+                        else:
+                            _log.debug(' Unexpected values: %s', sorted(unique_values))
+                    except Exception as e:
+                        _log.debug(' Could not sample classification values: %s', e)
+                else:
+                    _log.debug(' ERROR: Classification result layer is invalid!')
+            
+            # Exact anthropogenic pixel sum for the processing report. The
+            # in-process classifier counted the classes while writing, so only
+            # the raster calculator output needs another full pass
+            if class_pixel_counts is not None:
+                anthropogenic_pixels = sum(value * count for value, count in class_pixel_counts.items())
+                total_pixels = slope_layer.width() * slope_layer.height()
+            else:
+                anthropogenic_layer = QgsRasterLayer(output_anthropogenic, 'Anthropogenic')
+                if anthropogenic_layer.isValid():
+                    anthropogenic_pixels = self.get_band_statistics(anthropogenic_layer, QgsRasterBandStats.Sum).sum
+                    total_pixels = anthropogenic_layer.width() * anthropogenic_layer.height()
+            if total_pixels > 0:
+                _log.debug('Anthropogenic features detected: %.1f%% of area',
+                           anthropogenic_pixels / total_pixels * 100)
 
             # Step 6: Buffer the anthropogenic mask
-            self.update_progress(gaussian_iterations + 7, total_steps, f" Buffering features ({buffer_distance:.1f}m distance)...")
+            self.progressChanged.emit(gaussian_iterations + 7, total_steps, f" Buffering features ({buffer_distance:.1f}m distance)...")
             
             print(f'DEBUG: Buffer Distance from UI: {buffer_distance:.1f}m')
             
@@ -3399,7 +5192,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                         raise Exception("Could not load anthropogenic features raster for masking")
                     
                     # Create raster calculator entry
-                    from qgis.analysis import QgsRasterCalculatorEntry, QgsRasterCalculator
                     anthro_entry = QgsRasterCalculatorEntry()
                     anthro_entry.ref = 'A'
                     anthro_entry.raster = anthropogenic_layer
@@ -3427,7 +5219,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                     if os.path.isfile(output_buffered):
                         filtered_layer = QgsRasterLayer(output_buffered, 'Filtered_Check')
                         if filtered_layer.isValid():
-                            filtered_stats = filtered_layer.dataProvider().bandStatistics(1, QgsRasterBandStats.All)
+                            filtered_stats = filtered_layer.dataProvider().bandStatistics(1, _MASK_DEBUG_STATS)
                             print(f'DEBUG:  Filtered result - Min: {filtered_stats.minimumValue}, Max: {filtered_stats.maximumValue}')
                             print(f'DEBUG:  Filtered result - Mean: {filtered_stats.mean:.3f}, Sum: {filtered_stats.sum:.0f}')
                             
@@ -3442,7 +5234,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                         print('DEBUG:  ERROR: Filtered raster file was not created!')
                 else:
                     # For binary system: simply copy the mask
-                    import shutil
                     shutil.copy2(output_anthropogenic, output_buffered)
                 buffer_success = True
             else:
@@ -3512,7 +5303,9 @@ Target smoothing window: ~{target_smoothing_distance}m
                         print(f'  Band count: {anthropogenic_layer.bandCount()}')
                         provider = anthropogenic_layer.dataProvider()
                         print(f'  NoData value: {provider.sourceNoDataValue(1)}')
-                        stats = provider.bandStatistics(1, QgsRasterBandStats.All)
+                        stats = provider.bandStatistics(
+                            1, QgsRasterBandStats.Min | QgsRasterBandStats.Max | QgsRasterBandStats.Mean,
+                            anthropogenic_layer.extent(), _STATS_SAMPLE_SIZE)
                         print(f'  Min: {stats.minimumValue}, Max: {stats.maximumValue}, Mean: {stats.mean}')
                     else:
                         print('  ERROR: Anthropogenic layer is not valid!')
@@ -3544,7 +5337,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                     if os.path.isfile(anthropogenic_only_path):
                         initial_filter_layer = QgsRasterLayer(anthropogenic_only_path, 'Initial_Filter_Check')
                         if initial_filter_layer.isValid():
-                            initial_stats = initial_filter_layer.dataProvider().bandStatistics(1, QgsRasterBandStats.All)
+                            initial_stats = initial_filter_layer.dataProvider().bandStatistics(1, _MASK_DEBUG_STATS)
                             print(f'DEBUG:  Initial filtering - Min: {initial_stats.minimumValue}, Max: {initial_stats.maximumValue}')
                             print(f'DEBUG:  Initial filtering - Mean: {initial_stats.mean:.3f}, Sum: {initial_stats.sum:.0f}')
                             
@@ -3608,7 +5401,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                                 'MAX_DISTANCE': buffer_distance_meters,
                                 'REPLACE': 0,
                                 'NODATA': -1,  # Use -1 for NoData to distinguish from 0 distance
-                                'OPTIONS': '',
+                                'OPTIONS': _GTIFF_CREATION_OPTIONS,
                                 'EXTRA': '',
                                 'DATA_TYPE': 5,
                                 'OUTPUT': proximity_temp
@@ -3618,7 +5411,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                         
                         if os.path.isfile(proximity_temp):
                             # Step 2: Convert proximity to binary mask using QGIS raster calculator
-                            from qgis.analysis import QgsRasterCalculatorEntry, QgsRasterCalculator
                             
                             proximity_layer = QgsRasterLayer(proximity_temp, 'Proximity_Temp')
                             if not proximity_layer.isValid():
@@ -3648,10 +5440,8 @@ Target smoothing window: ~{target_smoothing_distance}m
                                 buffer_success = True
                                 
                                 # Clean up temporary proximity file
-                                try:
-                                    os.remove(proximity_temp)
-                                except:
-                                    pass
+                                with suppress(OSError):
+                                    os.unlink(proximity_temp)
                             else:
                                 raise Exception(f"Binary mask conversion failed with code: {result}")
                         else:
@@ -3659,7 +5449,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                             
                     except Exception as e2:
                         # Last resort: Use original mask without buffering
-                        import shutil
                         shutil.copy2(buffer_input, output_buffered)
                         buffer_success = True
                         QMessageBox.warning(self, 'Warning', 'Buffer operation failed. Using original mask without buffering.')
@@ -3672,7 +5461,7 @@ Target smoothing window: ~{target_smoothing_distance}m
             if os.path.isfile(output_buffered):
                 final_buffer_layer = QgsRasterLayer(output_buffered, 'Final_Buffer_Check')
                 if final_buffer_layer.isValid():
-                    final_buffer_stats = final_buffer_layer.dataProvider().bandStatistics(1, QgsRasterBandStats.All)
+                    final_buffer_stats = final_buffer_layer.dataProvider().bandStatistics(1, _MASK_DEBUG_STATS)
                     print(f'DEBUG:  Final buffered result - Min: {final_buffer_stats.minimumValue}, Max: {final_buffer_stats.maximumValue}')
                     print(f'DEBUG:  Final buffered result - Mean: {final_buffer_stats.mean:.3f}, Sum: {final_buffer_stats.sum:.0f}')
                     
@@ -3688,10 +5477,9 @@ Target smoothing window: ~{target_smoothing_distance}m
             
             # Check for excessive buffering (might indicate too low thresholds)
             try:
-                buffered_layer = QgsRasterLayer(output_buffered, 'Buffered_Check')
-                if buffered_layer.isValid():
-                    buffered_stats = buffered_layer.dataProvider().bandStatistics(1)
-                    total_pixels = buffered_layer.width() * buffered_layer.height()
+                buffered_stats = self.get_gdal_band_statistics(output_buffered)
+                if buffered_stats is not None:
+                    total_pixels = buffered_stats.width * buffered_stats.height
                     buffered_percentage = (buffered_stats.sum / total_pixels) * 100
                     
                     if buffered_percentage > 50 and buffer_distance > 0.0:  # Only warn if actually buffering
@@ -3706,7 +5494,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                 pass
 
             # Step 7: Mask the filtered DSM with buffered anthropogenic features
-            self.update_progress(gaussian_iterations + 8, total_steps, " Masking DSM with detected features...")
+            self.progressChanged.emit(gaussian_iterations + 8, total_steps, " Masking DSM with detected features...")
             masked_dsm_path = os.path.join(output_dir, 'masked_dsm.tif')
             
             # Load layers for masking calculation
@@ -3728,7 +5516,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                         'RESAMPLING': 0,  # Nearest neighbor for binary mask
                         'NODATA': 0,
                         'TARGET_RESOLUTION': None,
-                        'OPTIONS': '',
+                        'OPTIONS': _GTIFF_CREATION_OPTIONS,
                         'DATA_TYPE': 5,
                         'TARGET_EXTENT': None,
                         'TARGET_EXTENT_CRS': None,
@@ -3817,7 +5605,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                 if os.path.isfile(output_buffered):
                     filtered_layer = QgsRasterLayer(output_buffered, 'Filtered_Check')
                     if filtered_layer.isValid():
-                        filtered_stats = filtered_layer.dataProvider().bandStatistics(1, QgsRasterBandStats.All)
+                        filtered_stats = filtered_layer.dataProvider().bandStatistics(1, _MASK_DEBUG_STATS)
                         print(f'DEBUG:  Filtered result - Min: {filtered_stats.minimumValue}, Max: {filtered_stats.maximumValue}')
                         print(f'DEBUG:  Filtered result - Mean: {filtered_stats.mean:.3f}, Sum: {filtered_stats.sum:.0f}')
                         
@@ -3866,7 +5654,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                 print(f'DEBUG:  Could not analyze mask: {str(mask_debug_error)}')
             
             entries = []
-            from qgis.analysis import QgsRasterCalculatorEntry, QgsRasterCalculator
             
             # Filtered DSM entry
             dsm_entry = QgsRasterCalculatorEntry()
@@ -3977,7 +5764,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                 'grass_fillnulls': 'GRASS R.FILLNULLS'
             }.get(interpolation_method, interpolation_method.upper())
             
-            self.update_progress(gaussian_iterations + 9, total_steps, f"Surface reconstruction using {method_display_name}...")
+            self.progressChanged.emit(gaussian_iterations + 9, total_steps, f"Surface reconstruction using {method_display_name}...")
             
             # Store original method for report (before potential fallbacks change it)
             original_interpolation_method = interpolation_method
@@ -4003,7 +5790,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                             'ITERATIONS': 3,  # More iterations
                             'NO_MASK': False,
                             'MASK_LAYER': None,
-                            'OPTIONS': None,
+                            'OPTIONS': _GTIFF_CREATION_OPTIONS,
                             'EXTRA': '',
                             'OUTPUT': temp_filled_1
                         },
@@ -4039,7 +5826,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                             'ITERATIONS': fill_iterations,
                             'NO_MASK': False,
                             'MASK_LAYER': None,
-                            'OPTIONS': None,
+                            'OPTIONS': _GTIFF_CREATION_OPTIONS,
                             'EXTRA': '',
                             'OUTPUT': output_dsm
                         },
@@ -4052,11 +5839,8 @@ Target smoothing window: ~{target_smoothing_distance}m
                         
                         # Clean up temporary files
                         for temp_file in [temp_filled_1, temp_smoothed]:
-                            if os.path.exists(temp_file):
-                                try:
-                                    os.remove(temp_file)
-                                except:
-                                    pass
+                            with suppress(OSError):
+                                os.unlink(temp_file)
                     else:
                         raise Exception("Enhanced fillnodata output file not created")
                         
@@ -4138,7 +5922,7 @@ Target smoothing window: ~{target_smoothing_distance}m
                             'ITERATIONS': fill_iterations,
                             'NO_MASK': False,
                             'MASK_LAYER': None,
-                            'OPTIONS': None,
+                            'OPTIONS': _GTIFF_CREATION_OPTIONS,
                             'EXTRA': '',
                             'OUTPUT': output_dsm
                         },
@@ -4156,7 +5940,6 @@ Target smoothing window: ~{target_smoothing_distance}m
                     print('DEBUG: All interpolation methods failed! Using masked DSM as final result.')
                     
                     # Final fallback: Use masked DSM without interpolation
-                    import shutil
                     try:
                         shutil.copy2(masked_dsm_path, output_dsm)
                         interpolation_success = True
@@ -4181,15 +5964,14 @@ Target smoothing window: ~{target_smoothing_distance}m
             print('DEBUG: Advanced interpolation completed:', output_dsm)
 
             # Validate reconstructed DSM
-            reconstructed_layer = QgsRasterLayer(output_dsm, 'Reconstructed DSM Debug')
-            if not reconstructed_layer.isValid():
+            if not _quick_probe(output_dsm)[0]:
                 print('DEBUG: Using masked DSM without interpolation as fallback')
                 output_dsm = masked_dsm_path
 
 
 
             # Load result layers
-            self.update_progress(total_steps, total_steps, " Loading result layers into QGIS...")
+            self.progressChanged.emit(total_steps, total_steps, " Loading result layers into QGIS...")
             print('DEBUG: Loading result layers into QGIS...')
             
             # 1. ALWAYS load reconstructed DSM (most important)
@@ -4240,39 +6022,43 @@ Target smoothing window: ~{target_smoothing_distance}m
             
             print(f'DEBUG: Total layers loaded: {layers_loaded}')
             
-            # Generate processing report
-            self.update_progress(total_steps, total_steps, "Generating processing report...")
-            self.generate_processing_report(
-                input_dsm=input_dsm,
-                output_dir=output_dir,
-                scaling_info=scaling_info,
-                gaussian_iterations=gaussian_iterations,
-                sigma_value=sigma_value,
-                kernel_radius=kernel_radius,
-                buffer_distance=buffer_distance,
-                fill_distance=fill_distance,
-                fill_iterations=fill_iterations,
-                interpolation_method=interpolation_method,
-                original_interpolation_method=original_interpolation_method,
-                stats_results=stats_results,
-                slope_threshold=slope_threshold,
-                curvature_threshold=curvature_threshold,
-                residual_threshold=residual_threshold,
-                use_residuals=use_residuals,
-                slope_layer=slope_layer,
-                curvature_layer=curvature_layer,
-                residual_layer=residual_layer if use_residuals else None,
-                anthropogenic_pixels=anthropogenic_pixels if 'anthropogenic_pixels' in locals() else 0,
-                total_pixels=total_pixels if 'total_pixels' in locals() else 0,
-                output_dsm=output_dsm
-            )
-            
-            # Organize output files for better structure
-            self.update_progress(total_steps, total_steps, "Organizing output files...")
-            self.organize_output_files(output_dir)
+            # Report statistics and file organization open many small GDAL
+            # datasets in one directory: skip the per-open directory listing
+            # (sidecars are still probed individually) and decode with all cores
+            with _gdal_config(GDAL_DISABLE_READDIR_ON_OPEN='TRUE', GDAL_NUM_THREADS='ALL_CPUS'):
+                # Generate processing report
+                self.progressChanged.emit(total_steps, total_steps, "Generating processing report...")
+                self.generate_processing_report(
+                    input_dsm=input_dsm,
+                    output_dir=output_dir,
+                    scaling_info=scaling_info,
+                    gaussian_iterations=gaussian_iterations,
+                    sigma_value=sigma_value,
+                    kernel_radius=kernel_radius,
+                    buffer_distance=buffer_distance,
+                    fill_distance=fill_distance,
+                    fill_iterations=fill_iterations,
+                    interpolation_method=interpolation_method,
+                    original_interpolation_method=original_interpolation_method,
+                    stats_results=stats_results,
+                    slope_threshold=slope_threshold,
+                    curvature_threshold=curvature_threshold,
+                    residual_threshold=residual_threshold,
+                    use_residuals=use_residuals,
+                    slope_layer=slope_layer,
+                    curvature_layer=curvature_layer,
+                    residual_layer=residual_layer if use_residuals else None,
+                    anthropogenic_pixels=anthropogenic_pixels,
+                    total_pixels=total_pixels,
+                    output_dsm=output_dsm
+                )
+                
+                # Organize output files for better structure
+                self.progressChanged.emit(total_steps, total_steps, "Organizing output files...")
+                self.organize_output_files(output_dir)
             
             # Set progress bar to 100%
-            self.update_progress(total_steps, total_steps, "Processing completed successfully!")
+            self.progressChanged.emit(total_steps, total_steps, "Processing completed successfully!")
             QMessageBox.information(self, 'Finished', 'Reconstruction completed!')
         except Exception as e:
             print('DEBUG: Error:', str(e))
@@ -4375,6 +6161,7 @@ class BareEarthReconstructor:
         Side Effects:
             - Removes plugin action from QGIS menu
             - Clears action reference
+            - Disconnects the dialog from project layer signals
             - Ensures proper resource cleanup
             
         Note:
@@ -4385,6 +6172,13 @@ class BareEarthReconstructor:
         if self.action:
             self.iface.removePluginMenu('&Bare Earth Reconstructor', self.action)
             self.action = None
+        if self.dlg:
+            try:
+                QgsProject.instance().layersAdded.disconnect(self.dlg._on_layers_added)
+                QgsProject.instance().layersWillBeRemoved.disconnect(self.dlg._on_layers_removed)
+            except TypeError:
+                pass  # Already disconnected
+            self.dlg = None
 
     def run(self):
         """
@@ -0,0 +1,48 @@
+"""
+Smoke test of the in-process anthropogenic feature classifier.
+
+Needs a QGIS Python environment (the plugin module imports qgis at load
+time); skipped otherwise.
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip('numpy')
+gdal = pytest.importorskip('osgeo.gdal')
+pytest.importorskip('qgis.core')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import bare_earth_reconstructor as ber  # noqa: E402
+
+
+def _write_raster(path, values, nodata=None):
+    dataset = gdal.GetDriverByName('GTiff').Create(path, values.shape[1], values.shape[0], 1, gdal.GDT_Float32)
+    dataset.SetGeoTransform((0.0, 1.0, 0.0, values.shape[0], 0.0, -1.0))
+    band = dataset.GetRasterBand(1)
+    if nodata is not None:
+        band.SetNoDataValue(nodata)
+    band.WriteArray(values)
+    dataset = None
+    return SimpleNamespace(source=lambda: path)
+
+
+def test_classify_features_returns_class_counts():
+    slope = np.array([[1.0, 10.0, 1.0], [1.0, 1.0, -9999.0]], dtype=np.float32)
+    curvature = np.array([[0.0, 0.0, 2.0], [0.0, 0.0, 0.0]], dtype=np.float32)
+    slope_layer = _write_raster('/vsimem/classify_slope.tif', slope, nodata=-9999.0)
+    curvature_layer = _write_raster('/vsimem/classify_curvature.tif', curvature)
+    dialog = SimpleNamespace(get_worker_count=lambda: 2)
+    output_path = '/vsimem/classify_out.tif'
+    try:
+        counts = ber.BareEarthReconstructorDialog.classify_features(
+            dialog, output_path, slope_layer, curvature_layer, mode=0,
+            thresholds=(5.0, 1.0, 0.0, 0.0, 0.0, 2.5))
+        assert counts == {0: 3, 1: 2}
+        classes = gdal.Open(output_path).GetRasterBand(1).ReadAsArray()
+        assert classes.tolist() == [[0, 1, 1], [0, 0, ber._BYTE_NODATA]]
+    finally:
+        for path in ('/vsimem/classify_slope.tif', '/vsimem/classify_curvature.tif', output_path):
+            gdal.Unlink(path)